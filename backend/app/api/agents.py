@@ -7,6 +7,7 @@ import sys
 import os
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -49,7 +50,8 @@ async def get_agent_registry():
     """전체 에이전트 레지스트리 및 상태 조회"""
     from core.agents.orchestrator import AgentOrchestrator
 
-    orch = AgentOrchestrator()
+    # 첫 생성 시 구성 요소 import(모델 라이브러리 등)가 이벤트 루프를 막지 않도록 스레드풀에서 생성
+    orch = await run_in_threadpool(AgentOrchestrator)
     agents_info = {}
     for name, state in orch.agents.items():
         agents_info[name] = {
@@ -59,6 +61,7 @@ async def get_agent_registry():
             "dependencies": state.dependencies,
             "status": "idle",
         }
+    orch.close()
 
     return {
         "total_agents": len(agents_info),
@@ -159,6 +162,8 @@ def run_agent_pipeline(pipeline_id: str, video_path: str):
     except Exception as e:
         pipeline_store[pipeline_id]["status"] = "failed"
         pipeline_store[pipeline_id]["error"] = str(e)
+    finally:
+        orch.close()
 
 
 @router.get("/pipeline/{pipeline_id}")
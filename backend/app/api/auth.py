@@ -5,26 +5,33 @@ GAIM Lab v7.1 — JWT 사용자 인증 모듈 (SQLite DB)
 - POST /auth/login       : 로그인 (토큰 발급)
 - POST /auth/register    : 사용자 등록
 - GET  /auth/me          : 현재 사용자 정보
-- GET  /auth/users       : 사용자 목록 (관리자)
+- GET  /auth/users       : 사용자 목록 (관리자, keyset 페이지네이션)
 - PUT  /auth/users/{uid} : 사용자 수정 (관리자)
 - DELETE /auth/users/{uid}: 사용자 삭제 (관리자)
 - POST /auth/users/{uid}/reset-password : 비밀번호 초기화 (관리자)
 
 v7.1: SQLite users.db + PBKDF2 해싱 + 관리자 CRUD
+(GAIM_KDF=scrypt로 scrypt 전환 가능, 기존 해시는 로그인 시 재해싱)
 """
 
 import os
+import base64
 import hashlib
+import hmac
 import json
 import sqlite3
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 # JWT 라이브러리 (선택적)
 try:
@@ -33,84 +40,209 @@ try:
 except ImportError:
     HAS_PYJWT = False
 
+# orjson (선택적) — PyJWT 미설치 시 토큰 페이로드 직렬화에 사용
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ─── Configuration ───
 SECRET_KEY = os.getenv("GAIM_SECRET_KEY", "gaim-lab-v71-dev-secret-key-change-in-prod")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+_DEFAULT_EXP_SECS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_SECRET_BYTES = SECRET_KEY.encode()
 
 # ─── SQLite User Database ───
 _DATA_DIR = Path(os.getenv("GAIM_DATA_DIR", str(Path(__file__).resolve().parent.parent.parent.parent / "data")))
 _DB_PATH = _DATA_DIR / "users.db"
 
 
-def _get_db() -> sqlite3.Connection:
+# 프로세스 공유 커넥션 — 요청마다 open/close와 PRAGMA 설정을 반복하지 않음
+_conn: Optional[sqlite3.Connection] = None
+_db_lock = threading.RLock()
+
+
+def _open_db() -> sqlite3.Connection:
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(_DB_PATH))
+    conn = sqlite3.connect(str(_DB_PATH), check_same_thread=False)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL 모드에서는 NORMAL로도 안전
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
 
-# ─── Password Hashing (PBKDF2) ───
-def _hash_password(password: str) -> str:
-    """PBKDF2-SHA256 with salt derived from SECRET_KEY"""
+@contextmanager
+def _get_db():
+    """공유 SQLite 커넥션을 잠금 하에 빌려줌
+
+    Usage:
+        with _get_db() as conn:
+            conn.execute(...)
+
+    블록 안에서 커밋하지 않은 변경은 종료 시 rollback됩니다.
+    """
+    global _conn
+    with _db_lock:
+        if _conn is None:
+            _conn = _open_db()
+        try:
+            yield _conn
+        finally:
+            if _conn.in_transaction:
+                _conn.rollback()
+
+
+# ─── Password Hashing (PBKDF2 / scrypt) ───
+# GAIM_KDF=pbkdf2(기본)|scrypt — 저장 형식은 "p1$<hex>" / "s1$<hex>"
+# 접두사 없는 hex는 v7.1 이전 PBKDF2 해시로 간주하며 그대로 검증됩니다.
+_KDF_PREFIX = {"pbkdf2": "p1$", "scrypt": "s1$"}
+_KDF = os.getenv("GAIM_KDF", "pbkdf2")
+if _KDF not in _KDF_PREFIX:
+    _KDF = "pbkdf2"
+
+# 최근 해싱 결과 캐시: sha256(username || kdf || password || SECRET_KEY) → (digest, 만료 시각)
+# 반복 로그인 시 KDF 연산을 건너뜀. 평문은 저장하지 않으며 TTL/크기를 짧게 제한
+# 키에 username을 묶어 캐시 적중(빠른 응답)이 다른 계정의 비밀번호 정보를 흘리지 않도록 함
+_PW_CACHE_TTL = 60
+_PW_CACHE_MAXSIZE = 2048
+_pw_cache: dict = {}
+_pw_cache_lock = threading.Lock()
+
+
+def _derive(password: str, kdf: str) -> str:
+    if kdf == "scrypt":
+        return hashlib.scrypt(
+            password.encode(), salt=_SECRET_BYTES, n=16384, r=8, p=1, dklen=32
+        ).hex()
     return hashlib.pbkdf2_hmac(
-        "sha256", password.encode(), SECRET_KEY.encode(), 100_000
+        "sha256", password.encode(), _SECRET_BYTES, 100_000
     ).hex()
 
 
+def _hash_password(password: str, kdf: str = _KDF, username: Optional[str] = None) -> str:
+    """PBKDF2-SHA256 또는 scrypt (salt는 SECRET_KEY에서 파생), 버전 접두사 포함
+
+    username을 주면 해당 계정 전용 캐시를 사용하고, 없으면 매번 계산합니다.
+    """
+    if username is None:
+        return _KDF_PREFIX[kdf] + _derive(password, kdf)
+
+    key = hashlib.sha256(
+        username.encode() + b"\0" + kdf.encode() + b"\0" + password.encode() + _SECRET_BYTES
+    ).digest()
+    now = time.monotonic()
+    with _pw_cache_lock:
+        hit = _pw_cache.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+
+    hashed = _KDF_PREFIX[kdf] + _derive(password, kdf)
+    with _pw_cache_lock:
+        _pw_cache[key] = (hashed, now + _PW_CACHE_TTL)
+        if len(_pw_cache) > _PW_CACHE_MAXSIZE:
+            del _pw_cache[next(iter(_pw_cache))]
+    return hashed
+
+
+def _stored_kdf(stored_hash: str) -> str:
+    """저장된 해시의 KDF 판별 (접두사 없음 → 레거시 PBKDF2)"""
+    return "scrypt" if stored_hash.startswith("s1$") else "pbkdf2"
+
+
+def _matches(candidate: str, stored_hash: str) -> bool:
+    """_hash_password() 결과와 저장된 해시 비교 (접두사 없는 레거시 hex 포함)"""
+    if "$" not in stored_hash:
+        candidate = candidate.split("$", 1)[1]
+    return hmac.compare_digest(candidate, stored_hash)
+
+
+def _verify_password(password: str, stored_hash: str, username: Optional[str] = None) -> bool:
+    """저장된 해시의 접두사에 맞는 KDF로 검증"""
+    return _matches(_hash_password(password, _stored_kdf(stored_hash), username), stored_hash)
+
+
+def _needs_rehash(stored_hash: str) -> bool:
+    """현재 GAIM_KDF와 다른 알고리즘으로 저장된 해시인지 확인"""
+    return _stored_kdf(stored_hash) != _KDF
+
+
+# 존재하지 않는 아이디에 대한 비교 대상 (현재 KDF 접두사 포함 → 추가 KDF 연산 없음)
+_DUMMY_HASH = _hash_password("x" * 12)
+
+
 def _init_db():
     """테이블 생성 및 기본 admin 계정 seed"""
-    conn = _get_db()
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            name TEXT DEFAULT '',
-            email TEXT DEFAULT '',
-            role TEXT DEFAULT 'student',
-            is_active INTEGER DEFAULT 1,
-            provider TEXT DEFAULT 'local',
-            avatar TEXT DEFAULT '',
-            created_at TEXT DEFAULT (datetime('now')),
-            last_login TEXT
-        )
-    """)
-    conn.commit()
-
-    # Seed default admin if no users exist
-    row = conn.execute("SELECT COUNT(*) as cnt FROM users").fetchone()
-    if row["cnt"] == 0:
-        conn.execute(
-            "INSERT INTO users (username, password_hash, name, role) VALUES (?, ?, ?, ?)",
-            ("admin", _hash_password("admin123"), "관리자", "admin")
-        )
+    with _get_db() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT UNIQUE NOT NULL,
+                password_hash TEXT NOT NULL,
+                name TEXT DEFAULT '',
+                email TEXT DEFAULT '',
+                role TEXT DEFAULT 'student',
+                is_active INTEGER DEFAULT 1,
+                provider TEXT DEFAULT 'local',
+                avatar TEXT DEFAULT '',
+                created_at TEXT DEFAULT (datetime('now')),
+                last_login TEXT
+            )
+        """)
         conn.commit()
-        print("[AUTH] 기본 관리자 계정 생성: admin / admin123")
 
-    conn.close()
+        # Seed default admin if no users exist
+        row = conn.execute("SELECT COUNT(*) as cnt FROM users").fetchone()
+        if row["cnt"] == 0:
+            conn.execute(
+                "INSERT INTO users (username, password_hash, name, role) VALUES (?, ?, ?, ?)",
+                ("admin", _hash_password("admin123"), "관리자", "admin")
+            )
+            conn.commit()
+            print("[AUTH] 기본 관리자 계정 생성: admin / admin123")
 
 
-# Initialize on module load
-_init_db()
+def _intern(value):
+    """role/provider처럼 값 종류가 적은 문자열 컬럼을 intern해 행 간 동일 객체 공유 (NULL은 그대로)"""
+    return sys.intern(value) if value else value
 
 
 # ─── JWT Token Helpers ───
+def _sign(token_data: bytes) -> bytes:
+    """PyJWT 미설치 시 사용하는 HMAC-SHA256 토큰 서명 (raw 32바이트 digest)"""
+    return hmac.new(_SECRET_BYTES, token_data, hashlib.sha256).digest()
+
+
+def _pack_payload(payload: dict) -> bytes:
+    """페이로드 → URL-safe base64 (padding 제거) bytes"""
+    raw = orjson.dumps(payload) if HAS_ORJSON else json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+def _unpack_payload(token_data: bytes) -> dict:
+    raw = base64.urlsafe_b64decode(token_data + b"=" * (-len(token_data) % 4))
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
 def _create_token(data: dict, expires_delta: timedelta = None) -> str:
+    # 시각은 time.time() 한 번만 읽고, 기본 만료는 모듈 상수(초) 사용
+    # iat/exp는 server.py와 같이 정수 epoch 초 (JWT NumericDate)
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXP_SECS
     payload = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    payload["exp"] = expire.timestamp()
-    payload["iat"] = datetime.utcnow().timestamp()
+    payload["iat"] = now
+    payload["exp"] = now + ttl
 
     if HAS_PYJWT:
         return pyjwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
     else:
-        import base64
-        token_data = json.dumps(payload).encode()
-        sig = hashlib.sha256(f"{SECRET_KEY}:{token_data.decode()}".encode()).hexdigest()[:16]
-        return base64.urlsafe_b64encode(token_data).decode() + "." + sig
+        token_data = _pack_payload(payload)
+        # 전송 형식만 URL-safe base64 (padding 제거)
+        return (token_data + b"." + base64.urlsafe_b64encode(_sign(token_data)).rstrip(b"=")).decode()
 
 
 def _decode_token(token: str) -> dict:
@@ -122,16 +254,21 @@ def _decode_token(token: str) -> dict:
         except pyjwt.InvalidTokenError:
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
     else:
-        import base64
         try:
-            parts = token.rsplit(".", 1)
-            token_data = base64.urlsafe_b64decode(parts[0]).decode()
-            payload = json.loads(token_data)
-            if payload.get("exp", 0) < time.time():
-                raise HTTPException(status_code=401, detail="토큰이 만료되었습니다")
-            return payload
+            token_data, sig = token.encode().rsplit(b".", 1)
+            sig_bytes = base64.urlsafe_b64decode(sig + b"=" * (-len(sig) % 4))
+        except Exception:
+            raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
+        # hex 문자열이 아닌 raw digest끼리 상수 시간 비교
+        if not hmac.compare_digest(sig_bytes, _sign(token_data)):
+            raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
+        try:
+            payload = _unpack_payload(token_data)
         except Exception:
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
+        if payload.get("exp", 0) < time.time():
+            raise HTTPException(status_code=401, detail="토큰이 만료되었습니다")
+        return payload
 
 
 # ─── FastAPI Security ───
@@ -149,16 +286,17 @@ async def get_current_user(
     if not username:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
 
-    conn = _get_db()
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
-    conn.close()
+    with _get_db() as conn:
+        row = conn.execute(
+            "SELECT name, role, is_active FROM users WHERE username = ?", (username,)
+        ).fetchone()
 
     if not row:
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다")
     if not row["is_active"]:
         raise HTTPException(status_code=403, detail="비활성화된 계정입니다")
 
-    return {"username": username, "role": row["role"], "name": row["name"]}
+    return {"username": username, "role": _intern(row["role"]), "name": row["name"]}
 
 
 async def require_auth(user=Depends(get_current_user)):
@@ -225,21 +363,29 @@ class UserCreateRequest(BaseModel):
 router = APIRouter(prefix="/auth", tags=["인증"])
 
 
+@router.on_event("startup")
+async def _startup():
+    """테이블 생성/seed를 import 시점이 아닌 앱 기동 시 스레드풀에서 실행"""
+    await run_in_threadpool(_init_db)
+
+
+# KDF 연산(수십 ms)은 run_in_threadpool로 이벤트 루프 밖에서 실행하고,
+# DB 블록(_get_db) 안에서는 await하지 않습니다 (공유 커넥션 잠금 유지 시간 최소화).
+
 @router.post("/register", response_model=TokenResponse)
 async def register(req: RegisterRequest):
     """신규 사용자 등록"""
-    conn = _get_db()
-    existing = conn.execute("SELECT id FROM users WHERE username = ?", (req.username,)).fetchone()
-    if existing:
-        conn.close()
-        raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
-
-    conn.execute(
-        "INSERT INTO users (username, password_hash, name, role) VALUES (?, ?, ?, ?)",
-        (req.username, _hash_password(req.password), req.name, req.role)
-    )
-    conn.commit()
-    conn.close()
+    password_hash = await run_in_threadpool(_hash_password, req.password, username=req.username)
+    with _get_db() as conn:
+        existing = conn.execute("SELECT id FROM users WHERE username = ?", (req.username,)).fetchone()
+        if existing:
+            raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
+
+        conn.execute(
+            "INSERT INTO users (username, password_hash, name, role) VALUES (?, ?, ?, ?)",
+            (req.username, password_hash, req.name, req.role)
+        )
+        conn.commit()
 
     token = _create_token({"sub": req.username, "role": req.role})
     return TokenResponse(access_token=token, username=req.username, name=req.name, role=req.role)
@@ -248,38 +394,58 @@ async def register(req: RegisterRequest):
 @router.post("/login", response_model=TokenResponse)
 async def login(req: LoginRequest):
     """로그인 (토큰 발급)"""
-    conn = _get_db()
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (req.username,)).fetchone()
+    candidate = await run_in_threadpool(_hash_password, req.password, username=req.username)
+    with _get_db() as conn:
+        # 조회 + last_login 갱신을 UPDATE ... RETURNING 한 번으로 처리 (SQLite 3.35+)
+        # 검증 실패 시 블록 종료와 함께 rollback되므로 실패한 시도는 last_login에 남지 않음
+        row = conn.execute(
+            "UPDATE users SET last_login = datetime('now') WHERE username = ? "
+            "RETURNING password_hash, name, role, is_active",
+            (req.username,)
+        ).fetchone()
+
+        # 아이디가 없어도 candidate는 이미 계산되어 있으므로 KDF 비용이 동일 (timing-safe)
+        # _DUMMY_HASH는 현재 KDF이므로 마이그레이션 대상은 실제 행뿐
+        target_hash = row["password_hash"] if row else _DUMMY_HASH
+        migrate = _needs_rehash(target_hash)
+        if not migrate:
+            _check_login(row, _matches(candidate, target_hash))
+            conn.commit()
+
+    if migrate:
+        # 저장 해시가 다른 KDF(GAIM_KDF 변경): 해당 KDF로 다시 계산하는 연산은 잠금 밖 스레드풀에서,
+        # 통과하면 현재 알고리즘으로 재해싱하며 last_login도 함께 갱신
+        ok = await run_in_threadpool(_verify_password, req.password, target_hash, req.username)
+        _check_login(row, ok)
+        with _get_db() as conn:
+            conn.execute(
+                "UPDATE users SET password_hash = ?, last_login = datetime('now') WHERE username = ?",
+                (candidate, req.username)
+            )
+            conn.commit()
+
+    role = row["role"]
+    token = _create_token({"sub": req.username, "role": role})
+    return TokenResponse(access_token=token, username=req.username, name=row["name"], role=role)
 
-    if not row or row["password_hash"] != _hash_password(req.password):
-        conn.close()
-        raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다")
 
+def _check_login(row, ok: bool) -> None:
+    """로그인 검증 결과에 따라 401/403 발생"""
+    if not row or not ok:
+        raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다")
     if not row["is_active"]:
-        conn.close()
         raise HTTPException(status_code=403, detail="비활성화된 계정입니다. 관리자에게 문의하세요")
 
-    # Update last_login
-    conn.execute(
-        "UPDATE users SET last_login = datetime('now') WHERE username = ?",
-        (req.username,)
-    )
-    conn.commit()
-
-    role = row["role"]
-    name = row["name"]
-    conn.close()
-
-    token = _create_token({"sub": req.username, "role": role})
-    return TokenResponse(access_token=token, username=req.username, name=name, role=role)
-
 
 @router.get("/me")
 async def get_me(user=Depends(require_auth)):
     """현재 로그인 사용자 정보"""
-    conn = _get_db()
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (user["username"],)).fetchone()
-    conn.close()
+    with _get_db() as conn:
+        row = conn.execute(
+            "SELECT username, name, email, role, is_active, created_at, last_login "
+            "FROM users WHERE username = ?",
+            (user["username"],)
+        ).fetchone()
 
     if not row:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
@@ -298,106 +464,108 @@ async def get_me(user=Depends(require_auth)):
 @router.put("/me/password")
 async def change_my_password(req: PasswordChangeRequest, user=Depends(require_auth)):
     """현재 비밀번호 확인 후 변경 (일반 사용자)"""
-    conn = _get_db()
-    row = conn.execute("SELECT password_hash FROM users WHERE username = ?", (user["username"],)).fetchone()
+    with _get_db() as conn:
+        row = conn.execute("SELECT password_hash FROM users WHERE username = ?", (user["username"],)).fetchone()
 
-    if not row or row["password_hash"] != _hash_password(req.current_password):
-        conn.close()
+    if not row or not await run_in_threadpool(
+        _verify_password, req.current_password, row["password_hash"], user["username"]
+    ):
         raise HTTPException(status_code=401, detail="현재 비밀번호가 잘못되었습니다")
 
     if len(req.new_password) < 4:
-        conn.close()
         raise HTTPException(status_code=400, detail="새 비밀번호는 4자 이상이어야 합니다")
 
-    conn.execute(
-        "UPDATE users SET password_hash = ? WHERE username = ?",
-        (_hash_password(req.new_password), user["username"])
-    )
-    conn.commit()
-    conn.close()
+    password_hash = await run_in_threadpool(_hash_password, req.new_password, username=user["username"])
+    with _get_db() as conn:
+        conn.execute(
+            "UPDATE users SET password_hash = ? WHERE username = ?",
+            (password_hash, user["username"])
+        )
+        conn.commit()
     return {"message": "비밀번호가 변경되었습니다"}
 
 
 # ─── Admin: User Management ───
 
+USERS_PAGE_MAX = 500
+
+
 @router.get("/users")
-async def list_users(user=Depends(require_admin)):
-    """사용자 목록 (관리자 전용)"""
-    conn = _get_db()
-    rows = conn.execute(
-        "SELECT id, username, name, email, role, is_active, provider, created_at, last_login FROM users ORDER BY id"
-    ).fetchall()
-    conn.close()
-
-    return [
+async def list_users(after: int = 0, limit: int = 50, user=Depends(require_admin)):
+    """사용자 목록 (관리자 전용) — id 기준 keyset 페이지네이션"""
+    limit = max(1, min(limit, USERS_PAGE_MAX))
+    with _get_db() as conn:
+        rows = conn.execute(
+            "SELECT id, username, name, email, role, is_active, provider, created_at, last_login "
+            "FROM users WHERE id > ? ORDER BY id LIMIT ?",
+            (after, limit)
+        ).fetchall()
+
+    items = [
         {
             "id": r["id"],
             "username": r["username"],
             "name": r["name"],
             "email": r["email"],
-            "role": r["role"],
+            "role": _intern(r["role"]),
             "is_active": bool(r["is_active"]),
-            "provider": r["provider"],
+            "provider": _intern(r["provider"]),
             "created_at": r["created_at"],
             "last_login": r["last_login"],
         }
         for r in rows
     ]
+    return {"items": items, "next_after": items[-1]["id"] if len(items) == limit else None}
 
 
 @router.post("/users", response_model=dict)
 async def admin_create_user(req: UserCreateRequest, user=Depends(require_admin)):
     """관리자: 새 사용자 생성"""
-    conn = _get_db()
-    existing = conn.execute("SELECT id FROM users WHERE username = ?", (req.username,)).fetchone()
-    if existing:
-        conn.close()
-        raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
-
-    conn.execute(
-        "INSERT INTO users (username, password_hash, name, email, role) VALUES (?, ?, ?, ?, ?)",
-        (req.username, _hash_password(req.password), req.name, req.email, req.role)
-    )
-    conn.commit()
-    conn.close()
+    password_hash = await run_in_threadpool(_hash_password, req.password, username=req.username)
+    with _get_db() as conn:
+        existing = conn.execute("SELECT id FROM users WHERE username = ?", (req.username,)).fetchone()
+        if existing:
+            raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
+
+        conn.execute(
+            "INSERT INTO users (username, password_hash, name, email, role) VALUES (?, ?, ?, ?, ?)",
+            (req.username, password_hash, req.name, req.email, req.role)
+        )
+        conn.commit()
     return {"message": f"사용자 '{req.username}' 생성 완료", "username": req.username}
 
 
 @router.put("/users/{username}")
 async def update_user(username: str, req: UserUpdateRequest, user=Depends(require_admin)):
     """관리자: 사용자 정보 수정"""
-    conn = _get_db()
-    row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-
-    updates = []
-    params = []
-    if req.name is not None:
-        updates.append("name = ?")
-        params.append(req.name)
-    if req.role is not None:
-        if req.role not in ("student", "teacher", "admin"):
-            conn.close()
-            raise HTTPException(status_code=400, detail="유효하지 않은 역할입니다 (student/teacher/admin)")
-        updates.append("role = ?")
-        params.append(req.role)
-    if req.is_active is not None:
-        updates.append("is_active = ?")
-        params.append(1 if req.is_active else 0)
-    if req.email is not None:
-        updates.append("email = ?")
-        params.append(req.email)
-
-    if not updates:
-        conn.close()
-        return {"message": "수정할 내용이 없습니다"}
-
-    params.append(username)
-    conn.execute(f"UPDATE users SET {', '.join(updates)} WHERE username = ?", params)
-    conn.commit()
-    conn.close()
+    with _get_db() as conn:
+        row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+
+        updates = []
+        params = []
+        if req.name is not None:
+            updates.append("name = ?")
+            params.append(req.name)
+        if req.role is not None:
+            if req.role not in ("student", "teacher", "admin"):
+                raise HTTPException(status_code=400, detail="유효하지 않은 역할입니다 (student/teacher/admin)")
+            updates.append("role = ?")
+            params.append(req.role)
+        if req.is_active is not None:
+            updates.append("is_active = ?")
+            params.append(1 if req.is_active else 0)
+        if req.email is not None:
+            updates.append("email = ?")
+            params.append(req.email)
+
+        if not updates:
+            return {"message": "수정할 내용이 없습니다"}
+
+        params.append(username)
+        conn.execute(f"UPDATE users SET {', '.join(updates)} WHERE username = ?", params)
+        conn.commit()
     return {"message": f"사용자 '{username}' 정보 수정 완료"}
 
 
@@ -407,33 +575,30 @@ async def delete_user(username: str, user=Depends(require_admin)):
     if username == user["username"]:
         raise HTTPException(status_code=400, detail="자기 자신은 삭제할 수 없습니다")
 
-    conn = _get_db()
-    row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    with _get_db() as conn:
+        row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-    conn.execute("DELETE FROM users WHERE username = ?", (username,))
-    conn.commit()
-    conn.close()
+        conn.execute("DELETE FROM users WHERE username = ?", (username,))
+        conn.commit()
     return {"message": f"사용자 '{username}' 삭제 완료"}
 
 
 @router.post("/users/{username}/reset-password")
 async def reset_password(username: str, req: PasswordResetRequest, user=Depends(require_admin)):
     """관리자: 비밀번호 초기화"""
-    conn = _get_db()
-    row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    password_hash = await run_in_threadpool(_hash_password, req.new_password)
+    with _get_db() as conn:
+        row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-    conn.execute(
-        "UPDATE users SET password_hash = ? WHERE username = ?",
-        (_hash_password(req.new_password), username)
-    )
-    conn.commit()
-    conn.close()
+        conn.execute(
+            "UPDATE users SET password_hash = ? WHERE username = ?",
+            (password_hash, username)
+        )
+        conn.commit()
     return {"message": f"사용자 '{username}' 비밀번호 초기화 완료"}
 
 
@@ -512,21 +677,20 @@ async def google_callback(code: str = None, error: str = None):
     google_id = userinfo.get("id", "")
     username = f"google_{google_id}"
 
-    conn = _get_db()
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
-    if not row:
-        conn.execute(
-            "INSERT INTO users (username, password_hash, name, email, role, provider, avatar) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (username, "", name, email, "student", "google", userinfo.get("picture", ""))
-        )
+    with _get_db() as conn:
+        row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        if not row:
+            conn.execute(
+                "INSERT INTO users (username, password_hash, name, email, role, provider, avatar) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (username, "", name, email, "student", "google", userinfo.get("picture", ""))
+            )
+            conn.commit()
+
+        row = conn.execute("SELECT role FROM users WHERE username = ?", (username,)).fetchone()
+        role = row["role"]
+        conn.execute("UPDATE users SET last_login = datetime('now') WHERE username = ?", (username,))
         conn.commit()
 
-    row = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
-    role = row["role"]
-    conn.execute("UPDATE users SET last_login = datetime('now') WHERE username = ?", (username,))
-    conn.commit()
-    conn.close()
-
     jwt_token = _create_token({"sub": username, "role": role, "name": name, "email": email})
 
     from fastapi.responses import RedirectResponse
@@ -0,0 +1,23 @@
+"""
+GAIM Lab — argon2id 비용 프로필 (server.py)
+
+server.py는 import 시점에 Cloud SQL Connector를 불러오므로, 테스트에서 프로덕션
+해싱 파라미터를 검증할 수 있도록 환경변수 파싱만 이 모듈로 분리했습니다.
+"""
+
+import os
+from typing import Dict, Mapping, Optional
+
+
+def argon2_params(environ: Optional[Mapping[str, str]] = None) -> Dict[str, int]:
+    """ARGON2_* 환경변수 → PasswordHasher 키워드 인자
+
+    기본값은 argon2-cffi 기본 프로필(t=3, m=64MiB, p=4)과 같습니다.
+    기존 해시는 자체 파라미터를 포함하므로 값을 바꿔도 검증에는 영향이 없습니다.
+    """
+    env = os.environ if environ is None else environ
+    return {
+        "time_cost": int(env.get("ARGON2_TIME_COST", "3")),
+        "memory_cost": int(env.get("ARGON2_MEMORY_COST", "65536")),
+        "parallelism": int(env.get("ARGON2_PARALLELISM", "4")),
+    }
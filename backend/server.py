@@ -6,25 +6,32 @@ v8.1: Rate Limiting, 구조화 로깅, 시그모이드 문서화
 """
 
 import os
+import asyncio
 import hashlib
+import hmac
 import json
 import time
 import secrets
+import sys
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
+from itertools import combinations
 import uuid
+import queue
 import tempfile
 import threading
 from contextlib import contextmanager
 
-# v8.0 P0: 표준 JWT 라이브러리
-from jose import jwt, JWTError
+# v8.0 P0: 표준 JWT 라이브러리 (PyJWT)
+import jwt
 
 # v8.0 P0: argon2id 패스워드 해싱
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
-_ph = PasswordHasher()
+# 비용 파라미터는 ARGON2_* 환경변수로 조정 가능 (기본값 = argon2-cffi 기본 프로필: t=3, m=64MiB, p=4)
+from argon2_profile import argon2_params
+_ph = PasswordHasher(**argon2_params())
 
 # v8.0: 동적 버전 참조
 try:
@@ -35,8 +42,11 @@ except Exception:
 
 from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 # v8.1: Rate Limiting
 try:
@@ -49,6 +59,21 @@ except ImportError:
     HAS_SLOWAPI = False
     _limiter = None
 
+# orjson (선택적) — 요청 본문 파싱/응답 직렬화 가속
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Gemini SDK (선택적) — 미설치 또는 GOOGLE_API_KEY 미설정 시 분석 엔드포인트는 500 반환
+try:
+    import google.generativeai as genai
+    HAS_GENAI = True
+except ImportError:
+    HAS_GENAI = False
+
 # v8.1: 구조화 로깅
 logging.basicConfig(
     level=logging.INFO,
@@ -77,6 +102,7 @@ def _get_secret_key():
 
 SECRET_KEY = _get_secret_key()
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
+_DEFAULT_EXP_SECS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 
 # v8.1: 파일 업로드 크기 제한 (바이트)
@@ -90,6 +116,7 @@ INSTANCE_CONNECTION_NAME = os.getenv("INSTANCE_CONNECTION_NAME", "")
 
 # Use Cloud SQL Python Connector for secure connection
 from google.cloud.sql.connector import Connector
+from pg8000.legacy import PreparedStatement
 
 _connector = None
 
@@ -100,28 +127,135 @@ def _get_connector():
     return _connector
 
 
+# 커넥션 풀 — 요청마다 Connector 핸드셰이크(TCP+TLS+인증)를 반복하지 않도록 재사용
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))  # 풀이 비었을 때 추가로 열 수 있는 임시 커넥션 수
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # 동시 커넥션 상한에 걸렸을 때 대기할 최대 시간(초)
+DB_POOL_PING_AFTER = 60  # 이 시간(초) 이상 유휴였던 커넥션은 꺼낼 때 SELECT 1로 확인
+_db_pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+# 대여 중인 커넥션 수 상한 (풀 + overflow) — 넘으면 반납될 때까지 대기
+_db_slots = threading.BoundedSemaphore(DB_POOL_SIZE + DB_MAX_OVERFLOW)
+
+
+def _connect():
+    return _get_connector().connect(
+        INSTANCE_CONNECTION_NAME,
+        "pg8000",
+        user=DB_USER,
+        password=DB_PASS,
+        db=DB_NAME,
+    )
+
+
+def _close_quietly(conn):
+    _prepared.pop(id(conn), None)
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _acquire_conn():
+    """풀에서 커넥션을 꺼내고, 없으면 새로 연결"""
+    while True:
+        try:
+            conn, idle_since = _db_pool.get_nowait()
+        except queue.Empty:
+            return _connect()
+        if time.monotonic() - idle_since < DB_POOL_PING_AFTER:
+            return conn
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.fetchone()
+            cur.close()
+            conn.rollback()  # ping이 연 암묵적 트랜잭션 종료
+            return conn
+        except Exception:
+            _close_quietly(conn)
+
+
+def _release_conn(conn):
+    """미완료 트랜잭션을 정리한 뒤 풀에 반납 (풀이 가득 차면 닫음)"""
+    try:
+        conn.rollback()  # 트랜잭션 밖이면 no-op
+    except Exception:
+        _close_quietly(conn)
+        return
+    try:
+        _db_pool.put_nowait((conn, time.monotonic()))
+    except queue.Full:
+        _close_quietly(conn)
+
+
 # v8.0 P0: contextmanager로 커넥션 누수 방지
 @contextmanager
-def _get_db():
-    """Get a pg8000 connection via Cloud SQL Connector.
+def _get_db(readonly: bool = False):
+    """Borrow a pooled pg8000 connection (Cloud SQL Connector).
     
     Usage:
         with _get_db() as conn:
             cur = conn.cursor()
             ...
             cur.close()
+
+    쓰기 핸들러는 첫 문장에서 열린 트랜잭션 하나로 처리하고 마지막에 commit 한 번만 호출합니다.
+    커밋하지 않은 변경은 반납 시 rollback됩니다.
+    동시에 빌려줄 수 있는 커넥션은 DB_POOL_SIZE + DB_MAX_OVERFLOW개이며,
+    DB_POOL_TIMEOUT 안에 자리가 나지 않으면 503을 반환합니다.
+    readonly=True인 조회 전용 핸들러는 autocommit으로 실행해 BEGIN/ROLLBACK 왕복을 생략합니다.
     """
-    conn = _get_connector().connect(
-        INSTANCE_CONNECTION_NAME,
-        "pg8000",
-        user=DB_USER,
-        password=DB_PASS,
-        db=DB_NAME,
-    )
+    if not _db_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        logger.error("db_pool_exhausted limit=%d timeout=%.0fs", DB_POOL_SIZE + DB_MAX_OVERFLOW, DB_POOL_TIMEOUT)
+        raise HTTPException(status_code=503, detail="데이터베이스 연결이 모두 사용 중입니다. 잠시 후 다시 시도해주세요")
     try:
-        yield conn
+        conn = _acquire_conn()
+        if readonly:
+            conn.autocommit = True
+        try:
+            yield conn
+        finally:
+            if readonly:
+                conn.autocommit = False
+            _release_conn(conn)
     finally:
-        conn.close()
+        _db_slots.release()
+
+
+def _intern(value):
+    """role/provider처럼 값 종류가 적은 문자열 컬럼을 intern해 행 간 동일 객체 공유 (NULL은 그대로)"""
+    return sys.intern(value) if value else value
+
+
+# 핫패스 조회용 서버측 prepared statement
+# pg8000의 unnamed 실행은 매번 Parse/Describe/Bind 왕복을 거치므로, 풀 커넥션마다
+# 한 번만 PREPARE해 두고 이후에는 Bind/Execute 한 번으로 실행합니다.
+# (username은 UNIQUE 제약으로 이미 인덱스가 있으므로 별도 인덱스는 불필요)
+_PREPARED_SQL = {
+    "auth_user": "SELECT role, is_active FROM users WHERE username = :username",
+    "login_user": (
+        "SELECT username, password_hash, name, role, is_active FROM users WHERE username = :username"
+    ),
+    "touch_login": "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE username = :username",
+    "me_user": (
+        "SELECT username, name, email, role, is_active, created_at, last_login "
+        "FROM users WHERE username = :username"
+    ),
+}
+# id(conn) → {key: PreparedStatement}. 각 statement가 커넥션을 강하게 참조하므로
+# WeakKeyDictionary로는 정리되지 않음 — 커넥션을 닫는 _close_quietly()에서 제거합니다.
+_prepared: Dict[int, dict] = {}
+
+
+def _run_prepared(conn, key: str, **params) -> tuple:
+    """커넥션별로 캐시된 prepared statement를 실행하고 결과 행들을 반환"""
+    stmts = _prepared.get(id(conn))
+    if stmts is None:
+        stmts = _prepared[id(conn)] = {}
+    stmt = stmts.get(key)
+    if stmt is None:
+        stmt = stmts[key] = PreparedStatement(conn, _PREPARED_SQL[key])
+    return stmt.run(**params)
 
 
 # v8.0 P0: argon2id 패스워드 해싱 (사용자별 랜덤 salt 자동 포함)
@@ -146,14 +280,19 @@ def _verify_password(password: str, stored_hash: str) -> bool:
         "sha256", password.encode(), 
         "dev-only-insecure-key-do-not-use-in-production".encode(), 100_000
     ).hex()
-    if stored_hash == legacy:
+    if hmac.compare_digest(stored_hash, legacy):
         return True
     # 이전 시크릿 키로도 시도 (v7.1 호환)
     legacy_v71 = hashlib.pbkdf2_hmac(
         "sha256", password.encode(),
         "gaim-lab-v71-dev-secret-key".encode(), 100_000
     ).hex()
-    return stored_hash == legacy_v71
+    return hmac.compare_digest(stored_hash, legacy_v71)
+
+
+# 존재하지 않는 아이디도 동일한 argon2 검증 비용을 치르도록 하는 더미 해시
+# (응답 시간으로 아이디 존재 여부를 추측하는 user enumeration 방지)
+_DUMMY_HASH = _hash_password("x" * 12)
 
 
 def _is_legacy_hash(stored_hash: str) -> bool:
@@ -161,20 +300,23 @@ def _is_legacy_hash(stored_hash: str) -> bool:
     return not stored_hash.startswith("$argon2")
 
 
-# v8.0 P0: 표준 JWT (python-jose HS256)
+# v8.0 P0: 표준 JWT (PyJWT HS256)
 def _create_token(data: dict, expires_delta: timedelta = None) -> str:
-    """JWT 토큰 생성 (python-jose HS256)"""
-    payload = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    payload.update({"exp": expire, "iat": datetime.utcnow()})
+    """JWT 토큰 생성 (PyJWT HS256)
+
+    exp/iat는 정수 epoch 초로 직접 기록합니다 (datetime.utcnow() 미사용).
+    """
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXP_SECS
+    payload = {**data, "iat": now, "exp": now + ttl}
     return jwt.encode(payload, SECRET_KEY, algorithm="HS256")
 
 
 def _decode_token(token: str) -> dict:
-    """JWT 토큰 디코딩 (python-jose HS256)"""
+    """JWT 토큰 디코딩 (PyJWT HS256)"""
     try:
         return jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -235,6 +377,44 @@ def _init_analyses_table():
         cur.close()
 
 
+def _schema_ready() -> bool:
+    """users/analyses 테이블이 이미 있는지 단일 조회로 확인 (DDL 생략 판단용)"""
+    with _get_db(readonly=True) as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT to_regclass('public.users') IS NOT NULL "
+            "AND to_regclass('public.analyses') IS NOT NULL"
+        )
+        ready = cur.fetchone()[0]
+        cur.close()
+    return bool(ready)
+
+
+# 워커 간 스키마 초기화 직렬화용 advisory lock 키
+_INIT_LOCK_KEY = 42
+
+
+def _init_db_once():
+    """advisory lock으로 워커 간 스키마 생성/seed를 직렬화 (먼저 잡은 워커만 DDL 실행)"""
+    with _get_db() as conn:
+        cur = conn.cursor()
+        # 다른 워커가 초기화 중이면 끝날 때까지 대기 — 스키마 생성 전에 요청을 받지 않도록
+        cur.execute("SELECT pg_advisory_lock(%s)", (_INIT_LOCK_KEY,))
+        try:
+            # 스키마가 이미 있으면 CREATE TABLE/COUNT 왕복을 건너뜀 (대기했던 워커 포함)
+            if _schema_ready():
+                logger.info("db_init skipped=schema_present")
+            else:
+                _init_db()
+                _init_analyses_table()
+                logger.info("db_init success=true")
+        finally:
+            # 세션 수준 lock이므로 풀에 반납하기 전에 해제
+            cur.execute("SELECT pg_advisory_unlock(%s)", (_INIT_LOCK_KEY,))
+            conn.commit()
+            cur.close()
+
+
 # DB init moved to FastAPI startup event (see below)
 _db_initialized = False
 
@@ -242,25 +422,79 @@ _db_initialized = False
 security = HTTPBearer(auto_error=False)
 
 
+# 인증 결과 캐시 — sha256(token) → (username, role, 만료 시각)
+# 같은 토큰의 반복 요청은 JWT 검증과 DB 조회를 건너뜀. 항목은 최대 AUTH_CACHE_TTL초,
+# 토큰 exp보다 오래 유지되지 않으며, 사용자 수정/삭제/비밀번호 변경 시 즉시 제거됨
+AUTH_CACHE_TTL = 30
+AUTH_CACHE_MAXSIZE = 10_000
+# 스레드풀 동시 접근 시 전역 락 경합을 피하도록 토큰 해시 하위 4비트로 16개 샤드에 분산
+_AUTH_CACHE_SHARDS = 16
+_AUTH_SHARD_MAXSIZE = AUTH_CACHE_MAXSIZE // _AUTH_CACHE_SHARDS
+_auth_caches: List[Dict[bytes, tuple]] = [{} for _ in range(_AUTH_CACHE_SHARDS)]
+_auth_cache_locks = [threading.Lock() for _ in range(_AUTH_CACHE_SHARDS)]
+
+
+def _auth_cache_get(key: bytes) -> Optional[tuple]:
+    i = key[0] & 0x0F
+    cache = _auth_caches[i]
+    with _auth_cache_locks[i]:
+        entry = cache.get(key)
+        if entry is not None and entry[2] <= time.time():
+            del cache[key]
+            entry = None
+    return entry
+
+
+def _auth_cache_put(key: bytes, username: str, role: str, expires_at: float):
+    i = key[0] & 0x0F
+    cache = _auth_caches[i]
+    with _auth_cache_locks[i]:
+        cache[key] = (username, role, expires_at)
+        if len(cache) > _AUTH_SHARD_MAXSIZE:
+            # 삽입 순서상 가장 오래된 항목 제거
+            del cache[next(iter(cache))]
+
+
+def _auth_cache_evict(username: str):
+    """해당 사용자의 캐시된 인증 결과를 모든 샤드에서 제거"""
+    for cache, lock in zip(_auth_caches, _auth_cache_locks):
+        with lock:
+            for key in [k for k, v in cache.items() if v[0] == username]:
+                del cache[key]
+
+
+# 인증 거부 경로(스캔/공격 트래픽에서 빈번)용 예외 인스턴스 — 요청마다 새로 만들지 않음
+# 재사용 시 이전 raise의 traceback이 누적되지 않도록 with_traceback(None)으로 raise
+_EXC_NO_AUTH = HTTPException(status_code=401, detail="인증이 필요합니다")
+_EXC_BAD_TOKEN = HTTPException(status_code=401, detail="유효하지 않은 토큰")
+_EXC_INACTIVE = HTTPException(status_code=401, detail="비활성화된 계정")
+_EXC_NOT_ADMIN = HTTPException(status_code=403, detail="관리자만 접근 가능")
+
+
 async def require_auth(credentials: HTTPAuthorizationCredentials = Depends(security)):
     if not credentials:
-        raise HTTPException(status_code=401, detail="인증이 필요합니다")
+        raise _EXC_NO_AUTH.with_traceback(None)
+    cache_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    cached = _auth_cache_get(cache_key)
+    if cached is not None:
+        return {"username": cached[0], "role": cached[1]}
     payload = _decode_token(credentials.credentials)
     if not payload:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰")
-    with _get_db() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT username, role, is_active FROM users WHERE username = %s", (payload["sub"],))
-        row = cur.fetchone()
-        cur.close()
-    if not row or not row[2]:
-        raise HTTPException(status_code=401, detail="비활성화된 계정")
-    return {"username": row[0], "role": row[1]}
+        raise _EXC_BAD_TOKEN.with_traceback(None)
+    with _get_db(readonly=True) as conn:
+        rows = _run_prepared(conn, "auth_user", username=payload["sub"])
+    row = rows[0] if rows else None
+    if not row or not row[1]:
+        raise _EXC_INACTIVE.with_traceback(None)
+    # username은 토큰 sub와 동일하므로 조회하지 않음; role은 몇 가지 값뿐이라 intern해 캐시 항목 간 공유
+    username, role = payload["sub"], _intern(row[0])
+    _auth_cache_put(cache_key, username, role, min(time.time() + AUTH_CACHE_TTL, payload["exp"]))
+    return {"username": username, "role": role}
 
 
 async def require_admin(user=Depends(require_auth)):
     if user["role"] != "admin":
-        raise HTTPException(status_code=403, detail="관리자만 접근 가능")
+        raise _EXC_NOT_ADMIN.with_traceback(None)
     return user
 
 
@@ -289,6 +523,16 @@ class UserUpdateRequest(BaseModel):
     is_active: Optional[bool] = None
     email: Optional[str] = None
 
+
+# UserUpdateRequest 필드 조합별 UPDATE 문을 미리 생성 (2^4 - 1개)
+# — 요청마다 SQL을 조립하지 않고, 허용 컬럼 외에는 구조적으로 SQL에 들어갈 수 없음
+_USER_UPDATE_FIELDS = ("name", "role", "is_active", "email")
+_UPDATE_SQL = {
+    frozenset(combo): "UPDATE users SET " + ", ".join(f"{f} = %s" for f in combo) + " WHERE username = %s"
+    for n in range(1, len(_USER_UPDATE_FIELDS) + 1)
+    for combo in combinations(_USER_UPDATE_FIELDS, n)
+}
+
 class PasswordResetRequest(BaseModel):
     new_password: str
 
@@ -304,37 +548,70 @@ class UserCreateRequest(BaseModel):
     email: str = ""
 
 
+# ─── JSON (orjson) ───
+class _ORJSONRequest(Request):
+    """request.json()을 stdlib json 대신 orjson으로 파싱"""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class _ORJSONRoute(APIRoute):
+    """라우트 핸들러에 _ORJSONRequest를 전달하는 route class (orjson 미설치 시 기본 동작)"""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if not HAS_ORJSON:
+            return handler
+
+        async def orjson_handler(request: Request):
+            return await handler(_ORJSONRequest(request.scope, request.receive))
+
+        return orjson_handler
+
+
 # ─── Router ───
-router = APIRouter(prefix="/auth", tags=["인증"])
+router = APIRouter(prefix="/auth", tags=["인증"], route_class=_ORJSONRoute)
+
+
+def _migrate_legacy_hash(username: str, password: str):
+    """레거시 PBKDF2 해시 → argon2id 재해싱 (응답 전송 후 백그라운드 실행)"""
+    new_hash = _hash_password(password)
+    with _get_db() as conn:
+        cur = conn.cursor()
+        cur.execute("UPDATE users SET password_hash = %s WHERE username = %s", (new_hash, username))
+        conn.commit()
+        cur.close()
+    logger.info("password_migrated user=%s algorithm=argon2id", username)
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(req: LoginRequest, request: Request):
+async def login(req: LoginRequest, request: Request, background_tasks: BackgroundTasks):
     # v8.1: Rate limiting (IP 기반)
     start = time.time()
     logger.info("login_attempt user=%s ip=%s", req.username, request.client.host if request.client else "unknown")
+    with _get_db(readonly=True) as conn:
+        rows = _run_prepared(conn, "login_user", username=req.username)
+    row = rows[0] if rows else None
+    # 검증은 커넥션 반납 후 트랜잭션 밖에서 실행 — 행 잠금이나 풀 커넥션을 잡은 채 await하지 않음
+    target_hash = row[1] if row else _DUMMY_HASH
+    ok = await run_in_threadpool(_verify_password, req.password, target_hash)
+    if not row or not ok:
+        logger.warning("login_failed user=%s reason=invalid_credentials", req.username)
+        raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다")
+    if not row[4]:
+        logger.warning("login_failed user=%s reason=inactive_account", req.username)
+        raise HTTPException(status_code=403, detail="비활성화된 계정입니다")
+    # 검증 성공 후에만 짧은 트랜잭션으로 last_login 갱신
     with _get_db() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT username, password_hash, name, role, is_active FROM users WHERE username = %s", (req.username,))
-        row = cur.fetchone()
-        if not row or not _verify_password(req.password, row[1]):
-            cur.close()
-            logger.warning("login_failed user=%s reason=invalid_credentials", req.username)
-            raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다")
-        if not row[4]:
-            cur.close()
-            logger.warning("login_failed user=%s reason=inactive_account", req.username)
-            raise HTTPException(status_code=403, detail="비활성화된 계정입니다")
-        username, password_hash, name, role, _ = row
-        # v8.0 P0: 레거시 PBKDF2 해시 자동 마이그레이션 → argon2id
-        if _is_legacy_hash(password_hash):
-            cur.execute("UPDATE users SET password_hash = %s WHERE username = %s",
-                        (_hash_password(req.password), username))
-            conn.commit()
-            logger.info("password_migrated user=%s algorithm=argon2id", username)
-        cur.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE username = %s", (username,))
+        _run_prepared(conn, "touch_login", username=req.username)
         conn.commit()
-        cur.close()
+    username, password_hash, name, role, _ = row
+    # v8.0 P0: 레거시 PBKDF2 해시 자동 마이그레이션 → argon2id (응답 지연 없음)
+    if _is_legacy_hash(password_hash):
+        background_tasks.add_task(_migrate_legacy_hash, username, req.password)
     token = _create_token({"sub": username, "role": role})
     elapsed = round((time.time() - start) * 1000)
     logger.info("login_success user=%s role=%s elapsed_ms=%d", username, role, elapsed)
@@ -345,6 +622,7 @@ async def login(req: LoginRequest, request: Request):
 async def register(req: RegisterRequest):
     if len(req.password) < 8:
         raise HTTPException(status_code=400, detail="비밀번호는 8자 이상이어야 합니다")
+    password_hash = await run_in_threadpool(_hash_password, req.password)
     with _get_db() as conn:
         cur = conn.cursor()
         cur.execute("SELECT id FROM users WHERE username = %s", (req.username,))
@@ -354,7 +632,7 @@ async def register(req: RegisterRequest):
         role = req.role if req.role in ("student", "teacher") else "student"
         cur.execute(
             "INSERT INTO users (username, password_hash, name, role) VALUES (%s, %s, %s, %s)",
-            (req.username, _hash_password(req.password), req.name or req.username, role)
+            (req.username, password_hash, req.name or req.username, role)
         )
         conn.commit()
         cur.close()
@@ -364,11 +642,9 @@ async def register(req: RegisterRequest):
 
 @router.get("/me")
 async def get_me(user=Depends(require_auth)):
-    with _get_db() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT username, name, email, role, is_active, created_at, last_login FROM users WHERE username = %s", (user["username"],))
-        row = cur.fetchone()
-        cur.close()
+    with _get_db(readonly=True) as conn:
+        rows = _run_prepared(conn, "me_user", username=user["username"])
+    row = rows[0] if rows else None
     if not row:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     return {
@@ -383,38 +659,51 @@ async def get_me(user=Depends(require_auth)):
 async def change_my_password(req: PasswordChangeRequest, user=Depends(require_auth)):
     if len(req.new_password) < 8:
         raise HTTPException(status_code=400, detail="새 비밀번호는 8자 이상이어야 합니다")
+    new_hash = await run_in_threadpool(_hash_password, req.new_password)
     with _get_db() as conn:
         cur = conn.cursor()
         cur.execute("SELECT password_hash FROM users WHERE username = %s", (user["username"],))
         row = cur.fetchone()
-        if not row or not _verify_password(req.current_password, row[0]):
+        if not row or not await run_in_threadpool(_verify_password, req.current_password, row[0]):
             cur.close()
             raise HTTPException(status_code=401, detail="현재 비밀번호가 잘못되었습니다")
         cur.execute("UPDATE users SET password_hash = %s WHERE username = %s",
-                    (_hash_password(req.new_password), user["username"]))
+                    (new_hash, user["username"]))
         conn.commit()
         cur.close()
+    _auth_cache_evict(user["username"])
     return {"message": "비밀번호가 변경되었습니다"}
 
 
 # ─── Admin ───
+USERS_PAGE_MAX = 500
+
+
 @router.get("/users")
-async def list_users(user=Depends(require_admin)):
-    with _get_db() as conn:
+async def list_users(after: int = 0, limit: int = 50, user=Depends(require_admin)):
+    """사용자 목록 — id 기준 keyset 페이지네이션 (?after=<마지막 id>&limit=N)"""
+    limit = max(1, min(limit, USERS_PAGE_MAX))
+    with _get_db(readonly=True) as conn:
         cur = conn.cursor()
-        cur.execute("SELECT id, username, name, email, role, is_active, provider, created_at, last_login FROM users ORDER BY id")
+        cur.execute(
+            "SELECT id, username, name, email, role, is_active, provider, created_at, last_login "
+            "FROM users WHERE id > %s ORDER BY id LIMIT %s",
+            (after, limit)
+        )
         rows = cur.fetchall()
         cur.close()
-    return [
+    items = [
         {"id": r[0], "username": r[1], "name": r[2], "email": r[3],
-         "role": r[4], "is_active": bool(r[5]), "provider": r[6],
+         "role": _intern(r[4]), "is_active": bool(r[5]), "provider": _intern(r[6]),
          "created_at": str(r[7]) if r[7] else None, "last_login": str(r[8]) if r[8] else None}
         for r in rows
     ]
+    return {"items": items, "next_after": items[-1]["id"] if len(items) == limit else None}
 
 
 @router.post("/users")
 async def create_user(req: UserCreateRequest, user=Depends(require_admin)):
+    password_hash = await run_in_threadpool(_hash_password, req.password)
     with _get_db() as conn:
         cur = conn.cursor()
         cur.execute("SELECT id FROM users WHERE username = %s", (req.username,))
@@ -423,7 +712,7 @@ async def create_user(req: UserCreateRequest, user=Depends(require_admin)):
             raise HTTPException(status_code=400, detail="이미 존재하는 아이디입니다")
         cur.execute(
             "INSERT INTO users (username, password_hash, name, email, role) VALUES (%s, %s, %s, %s, %s)",
-            (req.username, _hash_password(req.password), req.name, req.email, req.role)
+            (req.username, password_hash, req.name, req.email, req.role)
         )
         conn.commit()
         cur.close()
@@ -438,13 +727,13 @@ async def update_user(username: str, req: UserUpdateRequest, user=Depends(requir
         if not cur.fetchone():
             cur.close()
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        updates = {k: v for k, v in req.model_dump().items() if v is not None}
+        updates = req.model_dump(exclude_none=True)
         if updates:
-            set_clause = ", ".join(f"{k} = %s" for k in updates)
-            cur.execute(f"UPDATE users SET {set_clause} WHERE username = %s",
-                        (*updates.values(), username))
+            cur.execute(_UPDATE_SQL[frozenset(updates)],
+                        (*(updates[f] for f in _USER_UPDATE_FIELDS if f in updates), username))
             conn.commit()
         cur.close()
+    _auth_cache_evict(username)
     return {"message": f"'{username}' 사용자가 수정되었습니다"}
 
 
@@ -457,21 +746,24 @@ async def delete_user(username: str, user=Depends(require_admin)):
         cur.execute("DELETE FROM users WHERE username = %s", (username,))
         conn.commit()
         cur.close()
+    _auth_cache_evict(username)
     return {"message": f"'{username}' 사용자가 삭제되었습니다"}
 
 
 @router.post("/users/{username}/reset-password")
 async def reset_password(username: str, req: PasswordResetRequest, user=Depends(require_admin)):
+    new_hash = await run_in_threadpool(_hash_password, req.new_password)
     with _get_db() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT id FROM users WHERE username = %s", (username,))
-        if not cur.fetchone():
+        # 존재 확인 SELECT 없이 UPDATE 한 번 — 갱신 행 수로 404 판단
+        cur.execute("UPDATE users SET password_hash = %s WHERE username = %s",
+                    (new_hash, username))
+        if cur.rowcount == 0:
             cur.close()
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        cur.execute("UPDATE users SET password_hash = %s WHERE username = %s",
-                    (_hash_password(req.new_password), username))
         conn.commit()
         cur.close()
+    _auth_cache_evict(username)
     return {"message": f"'{username}' 비밀번호가 초기화되었습니다"}
 
 
@@ -539,19 +831,30 @@ EVALUATION_PROMPT = """
 }}
 """
 
+# Gemini 클라이언트 — 모듈 로드 시 1회 설정 후 모든 요청이 공유
+_gemini_model = None
+_gemini_gen_config = None
+_GEMINI_UNAVAILABLE = "GOOGLE_API_KEY가 설정되지 않았습니다"
+if not HAS_GENAI:
+    _GEMINI_UNAVAILABLE = "google-generativeai 패키지가 설치되지 않았습니다"
+elif GOOGLE_API_KEY:
+    genai.configure(api_key=GOOGLE_API_KEY)
+    _gemini_model = genai.GenerativeModel(model_name="gemini-2.0-flash")
+    _gemini_gen_config = genai.GenerationConfig(response_mime_type="application/json")
+
+# 동시 Gemini 분석 상한 — 초과 업로드는 대기열에서 순서를 기다림
+GEMINI_MAX_CONC = int(os.getenv("GEMINI_MAX_CONC", "4"))
+_gemini_sem = asyncio.Semaphore(GEMINI_MAX_CONC)
+
 
 def _run_gemini_analysis(analysis_id: str, video_bytes: bytes, video_name: str):
     """Background thread: upload video to Gemini and run analysis"""
-    import google.generativeai as genai
-
     try:
         # Update status
         _update_analysis(analysis_id, status="processing", progress=10, message="Gemini API 연결 중...")
 
-        if not GOOGLE_API_KEY:
-            raise RuntimeError("GOOGLE_API_KEY가 설정되지 않았습니다")
-
-        genai.configure(api_key=GOOGLE_API_KEY)
+        if _gemini_model is None:
+            raise RuntimeError(_GEMINI_UNAVAILABLE)
 
         # Save video to temp file for Gemini upload
         _update_analysis(analysis_id, progress=20, message="동영상 업로드 중...")
@@ -576,10 +879,9 @@ def _run_gemini_analysis(analysis_id: str, video_bytes: bytes, video_name: str):
 
         # Run 7-dimension analysis
         _update_analysis(analysis_id, progress=60, message="AI 수업 분석 중...")
-        model = genai.GenerativeModel(model_name="gemini-2.0-flash")
-        response = model.generate_content(
+        response = _gemini_model.generate_content(
             [video_file, EVALUATION_PROMPT],
-            generation_config=genai.GenerationConfig(response_mime_type="application/json")
+            generation_config=_gemini_gen_config
         )
 
         # Parse result
@@ -655,7 +957,6 @@ async def upload_video(
     use_text: bool = True
 ):
     """동영상 업로드 및 Gemini 분석 (동기 실행 — Cloud Run 호환)"""
-    import google.generativeai as genai
     start = time.time()
     logger.info("upload_start filename=%s ip=%s", file.filename, request.client.host if request.client else "unknown")
 
@@ -664,8 +965,8 @@ async def upload_video(
     if ext not in allowed:
         raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다. 허용: {allowed}")
 
-    if not GOOGLE_API_KEY:
-        raise HTTPException(status_code=500, detail="GOOGLE_API_KEY가 설정되지 않았습니다")
+    if _gemini_model is None:
+        raise HTTPException(status_code=500, detail=_GEMINI_UNAVAILABLE)
 
     analysis_id = str(uuid.uuid4())
     video_bytes = await file.read()
@@ -689,35 +990,36 @@ async def upload_video(
         cur.close()
 
     try:
-        genai.configure(api_key=GOOGLE_API_KEY)
-
         # Save video to temp file
         suffix = ext or ".mp4"
         with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
             tmp.write(video_bytes)
             tmp_path = tmp.name
 
-        # Upload to Gemini File API
-        _update_analysis(analysis_id, progress=30, message="Gemini에 동영상 전송 중...")
-        video_file = genai.upload_file(path=tmp_path, mime_type=f"video/{suffix[1:]}")
-
-        # Wait for processing
-        _update_analysis(analysis_id, progress=40, message="동영상 처리 대기 중...")
-        import time as _time
-        while video_file.state.name == "PROCESSING":
-            _time.sleep(5)
-            video_file = genai.get_file(video_file.name)
-
-        if video_file.state.name == "FAILED":
-            raise RuntimeError(f"Gemini 동영상 처리 실패: {video_file.state.name}")
+        # Gemini 호출은 스레드로 넘기고 동시 실행 수를 제한 (초과 요청은 대기)
+        async with _gemini_sem:
+            # Upload to Gemini File API
+            _update_analysis(analysis_id, progress=30, message="Gemini에 동영상 전송 중...")
+            video_file = await asyncio.to_thread(
+                genai.upload_file, path=tmp_path, mime_type=f"video/{suffix[1:]}"
+            )
 
-        # Run 7-dimension analysis
-        _update_analysis(analysis_id, progress=60, message="AI 수업 분석 중...")
-        model = genai.GenerativeModel(model_name="gemini-2.0-flash")
-        response = model.generate_content(
-            [video_file, EVALUATION_PROMPT],
-            generation_config=genai.GenerationConfig(response_mime_type="application/json")
-        )
+            # Wait for processing
+            _update_analysis(analysis_id, progress=40, message="동영상 처리 대기 중...")
+            while video_file.state.name == "PROCESSING":
+                await asyncio.sleep(5)
+                video_file = await asyncio.to_thread(genai.get_file, video_file.name)
+
+            if video_file.state.name == "FAILED":
+                raise RuntimeError(f"Gemini 동영상 처리 실패: {video_file.state.name}")
+
+            # Run 7-dimension analysis
+            _update_analysis(analysis_id, progress=60, message="AI 수업 분석 중...")
+            response = await asyncio.to_thread(
+                _gemini_model.generate_content,
+                [video_file, EVALUATION_PROMPT],
+                generation_config=_gemini_gen_config
+            )
 
         # Parse result
         result_text = response.text.strip()
@@ -750,7 +1052,7 @@ async def upload_video(
         # Cleanup
         try:
             os.unlink(tmp_path)
-            genai.delete_file(video_file.name)
+            await asyncio.to_thread(genai.delete_file, video_file.name)
         except Exception:
             pass
 
@@ -782,7 +1084,7 @@ async def get_analysis_status(analysis_id: str):
         }
 
     # Fall back to DB
-    with _get_db() as conn:
+    with _get_db(readonly=True) as conn:
         cur = conn.cursor()
         cur.execute("SELECT id, status, progress, message, created_at, completed_at FROM analyses WHERE id=%s", (analysis_id,))
         row = cur.fetchone()
@@ -811,7 +1113,7 @@ async def get_analysis_result(analysis_id: str):
         }
 
     # Fall back to DB
-    with _get_db() as conn:
+    with _get_db(readonly=True) as conn:
         cur = conn.cursor()
         cur.execute("SELECT video_name, status, result_json FROM analyses WHERE id=%s", (analysis_id,))
         row = cur.fetchone()
@@ -840,7 +1142,7 @@ data_router = APIRouter(tags=["데이터"])
 @data_router.get("/history")
 async def get_history(limit: int = 50):
     """분석 이력 조회"""
-    with _get_db() as conn:
+    with _get_db(readonly=True) as conn:
         cur = conn.cursor()
         cur.execute(
             "SELECT id, video_name, status, total_score, grade, created_at, completed_at "
@@ -898,7 +1200,7 @@ growth_router = APIRouter(prefix="/growth", tags=["성장"])
 @growth_router.get("/{prefix}")
 async def get_growth_data(prefix: str):
     """분석 이력 기반 성장 데이터"""
-    with _get_db() as conn:
+    with _get_db(readonly=True) as conn:
         cur = conn.cursor()
         cur.execute(
             "SELECT id, video_name, total_score, grade, result_json, created_at "
@@ -976,7 +1278,7 @@ async def cohort_compare(body: dict):
     prefix_b = group_b.get("prefix", "")
 
     def _fetch_group_scores(prefix: str):
-        with _get_db() as conn:
+        with _get_db(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT total_score, result_json FROM analyses "
@@ -1057,7 +1359,8 @@ app = FastAPI(
     description="GAIM Lab 인증 + 수업분석 서비스 (Cloud Run + Cloud SQL + Gemini)",
     version=APP_VERSION,
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
 )
 
 # v8.1: Rate Limiter 통합
@@ -1104,10 +1407,9 @@ async def startup_event():
     global _db_initialized
     if not _db_initialized and INSTANCE_CONNECTION_NAME:
         try:
-            _init_db()
-            _init_analyses_table()
+            # 동기 Cloud SQL 연결/DDL이 이벤트 루프를 막지 않도록 스레드풀에서 실행 (풀 워밍업 겸용)
+            await run_in_threadpool(_init_db_once)
             _db_initialized = True
-            logger.info("db_init success=true")
         except Exception as e:
             logger.warning(f"db_init failed={e} — will retry on first request")
 
@@ -0,0 +1,61 @@
+"""
+GAIM Lab v8.2 — Database Unit Tests
+
+result_json 직렬화가 msgspec 설치 여부와 무관하게 json.dumps(default=str)과 같은 결과인지 검증.
+
+실행:
+    python -m pytest backend/tests/test_database.py -v
+"""
+
+import json
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.agents.orchestrator import _DBWriter
+from core.database import AnalysisRepository, _encode_result
+
+
+def _stdlib(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+class TestEncodeResultParity:
+    """_encode_result ↔ json.dumps(ensure_ascii=False, default=str) 동등성"""
+
+    @pytest.mark.parametrize("payload", [
+        {"total_score": 82.5, "grade": "A-", "dimensions": [{"name": "수업 전문성", "score": 16.0}]},
+        {"vibe_summary": {"avg_pitch": np.float64(0.5), "avg_silence_ratio": np.float64(0.125)}},
+        {"timeline": [(1, 2.5), [None, True, "텍스트"]], "big": 1e16},
+        {"count": np.int64(7), "flag": np.bool_(True)},
+    ])
+    def test_same_json_value(self, payload):
+        """일반 구조·numpy 스칼라는 파싱 결과가 동일 (np.float64는 숫자로 저장)"""
+        assert json.loads(_encode_result(payload)) == json.loads(_stdlib(payload))
+
+    @pytest.mark.parametrize("payload", [
+        {"nan": float("nan"), "inf": np.float64("inf")},
+        {None: 1, 2: "b"},
+        {"tags": {1, 2}, "raw": b"ab", "at": datetime(2026, 1, 1)},
+    ])
+    def test_special_values_match_stdlib(self, payload):
+        """NaN/inf, 비문자열 키, msgspec 고유 인코딩 타입은 stdlib json과 문자열까지 동일"""
+        assert _encode_result(payload) == _stdlib(payload)
+
+    def test_float64_stays_numeric(self):
+        encoded = json.loads(_encode_result({"v": np.float64(0.5)}))
+        assert encoded["v"] == 0.5 and not math.isnan(encoded["v"])
+
+
+class TestBatchWriteFallback:
+    """배치 저장이 실패하면 행별로 재시도해 정상 행은 저장"""
+
+    def test_bad_row_does_not_drop_batch(self, tmp_path):
+        writer = _DBWriter()
+        writer._repo = AnalysisRepository(str(tmp_path / "analyses.db"))
+        good = {"video_path": "lecture_01.mp4", "pipeline_id": "p1", "result": {}, "pedagogy": None}
+        bad = {"pipeline_id": "p2", "result": {}}  # video_path 누락
+        assert writer._write([good, bad]) == [True, False]
+        assert [r["pipeline_id"] for r in writer._repo.get_history()] == ["p1"]
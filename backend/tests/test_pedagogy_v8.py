@@ -17,7 +17,7 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from core.agents.pedagogy_agent import _sigmoid_map, _bin, PedagogyAgent
+from core.agents.pedagogy_agent import _sigmoid_map, _sigmoid_map_batch, _bin, PedagogyAgent
 
 
 # ─── Test Data ───
@@ -86,6 +86,22 @@ class TestSigmoidMap:
         assert result == 0.0
 
 
+class TestSigmoidMapBatch:
+    """배치 시그모이드 매핑 테스트"""
+
+    def test_matches_scalar(self):
+        """배치 결과가 원소별 _sigmoid_map과 일치"""
+        values = [0.0, 0.14, 0.15, 0.16, 0.45, 0.8, 1.0, 5.0]
+        batch = _sigmoid_map_batch(values, SAMPLE_BINS, SAMPLE_SCORES)
+        for v, b in zip(values, batch):
+            assert b == pytest.approx(_sigmoid_map(v, SAMPLE_BINS, SAMPLE_SCORES))
+
+    def test_extreme_steepness_finite(self):
+        """극단적 steepness에서도 모든 값이 유한"""
+        batch = _sigmoid_map_batch([0.3, 0.9, 50.0], SAMPLE_BINS, SAMPLE_SCORES, steepness=1000.0)
+        assert all(math.isfinite(b) for b in batch)
+
+
 class TestSteepnessSensitivity:
     """steepness 파라미터 민감도 테스트"""
 
@@ -178,6 +194,54 @@ class TestPedagogyAgentModes:
         agent = PedagogyAgent(use_rag=False)
         assert len(agent.dimensions) >= 7, f"Expected ≥7 dimensions, got {len(agent.dimensions)}"
 
+    def test_shared_config_read_only(self):
+        """인스턴스 간 공유되는 설정은 변경할 수 없음"""
+        agent = PedagogyAgent(use_rag=False)
+        name = next(iter(agent.dimensions))
+        with pytest.raises(TypeError):
+            agent.dimensions[name]["weight"] = 0
+        with pytest.raises(TypeError):
+            agent.grading["A+"] = 0
+        assert PedagogyAgent(use_rag=False).dimensions[name] is agent.dimensions[name]
+
+    def test_evaluate_memoized_copy(self):
+        """같은 입력 재평가 시 동일한 결과의 독립 사본 반환 (v8.2 캐시)"""
+        agent = PedagogyAgent(use_rag=False)
+        stt = {"word_count": 1200, "duration_seconds": 600, "segments": [{"text": "a"}]}
+        first = agent.evaluate({}, {}, {}, stt, {})
+        first["dimensions"][0]["score"] = -1
+        second = agent.evaluate({}, {}, {}, stt, {})
+        assert second == agent._evaluate({}, {}, {}, stt, {})
+        assert second["dimensions"][0]["score"] != -1
+
+    def test_evaluate_unhashable_input_uncached(self):
+        """요약에 해시 불가 값(np.ndarray 등)이 있어도 캐시 없이 정상 평가"""
+        import numpy as np
+        agent = PedagogyAgent(use_rag=False)
+        vibe = {"monotone_ratio": 0.3, "pitch_curve": np.array([1.0, 2.0]), "tags": {"a"}}
+        result = agent.evaluate({}, {}, vibe, {"word_count": 900, "duration_seconds": 600}, {})
+        assert result == agent._evaluate({}, {}, vibe, {"word_count": 900, "duration_seconds": 600}, {})
+
+    def test_evaluate_cache_shared_by_config(self):
+        """같은 설정의 인스턴스는 캐시를 공유하고, 프리셋이 다르면 섞이지 않음"""
+        stt = {"word_count": 900, "duration_seconds": 600, "filler_ratio": 0.05}
+        first = PedagogyAgent(use_rag=False).evaluate({}, {}, {}, stt, {})
+        other = PedagogyAgent(use_rag=False)
+        assert other.evaluate({}, {}, {}, stt, {}) == first
+        discussion = PedagogyAgent(use_rag=False, preset="discussion")
+        result = discussion.evaluate({}, {}, {}, stt, {})
+        assert result == discussion._evaluate({}, {}, {}, stt, {})
+        assert result["preset_used"] == "discussion"
+
+    def test_evaluate_batch_matches_single(self):
+        """일괄 평가 결과는 강의별 evaluate()와 동일"""
+        agent = PedagogyAgent(use_rag=False)
+        stts = [{"word_count": 300, "duration_seconds": 600}, {"word_count": 1500, "duration_seconds": 900}]
+        batch = agent.evaluate_batch([{}, {}], [{}, {}], [{}, {}], stts)
+        assert batch == [agent.evaluate({}, {}, {}, stt) for stt in stts]
+        with pytest.raises(ValueError):
+            agent.evaluate_batch([{}], [], [], [])
+
     def test_grading_thresholds(self):
         """등급 기준이 정의됨"""
         agent = PedagogyAgent(use_rag=False)
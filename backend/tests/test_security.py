@@ -19,14 +19,19 @@ import pytest
 # server.py의 Cloud SQL 관련 import를 건너뛰기 위해 직접 보안 함수를 테스트
 
 # ── argon2id ──
-from argon2 import PasswordHasher
+from argon2 import PasswordHasher, extract_parameters
 from argon2.exceptions import VerifyMismatchError
 
-_ph = PasswordHasher()
+# 테스트용 저비용 프로필 (argon2id 동작은 동일, 해싱 1회 수 ms 이하)
+_ph = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
 
-# ── JWT (python-jose) ──
-from jose import jwt, JWTError
-from datetime import datetime
+# server.py의 argon2 프로필 (Cloud SQL import 없이 로드 가능한 모듈)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from argon2_profile import argon2_params
+
+# ── JWT (PyJWT) ──
+import time
+import jwt
 
 
 # ─── Configuration for tests ───
@@ -67,6 +72,30 @@ class TestArgon2Hashing:
         assert _ph.verify(hashed, password)
 
 
+class TestArgon2ProductionProfile:
+    """프로덕션 해싱 파라미터 검증 (server.py가 사용하는 argon2_params)"""
+
+    def test_default_profile_parameters(self, monkeypatch):
+        """환경변수가 없으면 argon2id, t=3, m=64MiB, p=4"""
+        for name in ("ARGON2_TIME_COST", "ARGON2_MEMORY_COST", "ARGON2_PARALLELISM"):
+            monkeypatch.delenv(name, raising=False)
+        params = extract_parameters(PasswordHasher(**argon2_params()).hash("profile-check"))
+        assert params.type.name == "ID"
+        assert params.time_cost >= 3
+        assert params.memory_cost >= 65536
+        assert params.parallelism == 4
+
+    def test_env_overrides(self):
+        """ARGON2_* 환경변수로 비용 조정"""
+        env = {"ARGON2_TIME_COST": "2", "ARGON2_MEMORY_COST": "19456", "ARGON2_PARALLELISM": "1"}
+        assert argon2_params(env) == {"time_cost": 2, "memory_cost": 19456, "parallelism": 1}
+
+    def test_low_cost_hash_verifies_with_default_hasher(self):
+        """해시에 파라미터가 포함되므로 프로필이 달라도 검증 가능"""
+        hashed = _ph.hash("cross-profile")
+        assert PasswordHasher(**argon2_params({})).verify(hashed, "cross-profile")
+
+
 class TestLegacyPBKDF2:
     """레거시 PBKDF2 해시 호환성 테스트"""
 
@@ -109,10 +138,8 @@ class TestJWT:
 
     def test_create_and_decode(self):
         """JWT 생성 → 디코딩 라운드트립"""
-        payload = {"sub": "testuser", "role": "student"}
-        expire = datetime.utcnow() + timedelta(hours=1)
-        payload["exp"] = expire
-        payload["iat"] = datetime.utcnow()
+        now = int(time.time())
+        payload = {"sub": "testuser", "role": "student", "iat": now, "exp": now + 3600}
         
         token = jwt.encode(payload, TEST_SECRET, algorithm="HS256")
         decoded = jwt.decode(token, TEST_SECRET, algorithms=["HS256"])
@@ -121,26 +148,27 @@ class TestJWT:
         assert decoded["role"] == "student"
 
     def test_expired_token_raises(self):
-        """만료된 토큰 → JWTError"""
+        """만료된 토큰 → ExpiredSignatureError"""
+        now = int(time.time())
         payload = {
             "sub": "testuser",
-            "exp": datetime.utcnow() - timedelta(hours=1),
-            "iat": datetime.utcnow() - timedelta(hours=2),
+            "exp": now - 3600,
+            "iat": now - 7200,
         }
         token = jwt.encode(payload, TEST_SECRET, algorithm="HS256")
         
-        with pytest.raises(Exception):  # ExpiredSignatureError
+        with pytest.raises(jwt.ExpiredSignatureError):
             jwt.decode(token, TEST_SECRET, algorithms=["HS256"])
 
     def test_wrong_secret_raises(self):
-        """잘못된 시크릿 → JWTError"""
+        """잘못된 시크릿 → InvalidSignatureError"""
         payload = {
             "sub": "testuser",
-            "exp": datetime.utcnow() + timedelta(hours=1),
+            "exp": int(time.time()) + 3600,
         }
         token = jwt.encode(payload, TEST_SECRET, algorithm="HS256")
         
-        with pytest.raises(JWTError):
+        with pytest.raises(jwt.InvalidSignatureError):
             jwt.decode(token, "wrong-secret", algorithms=["HS256"])
 
     def test_token_contains_expected_claims(self):
@@ -148,8 +176,8 @@ class TestJWT:
         payload = {
             "sub": "admin",
             "role": "admin",
-            "exp": datetime.utcnow() + timedelta(hours=24),
-            "iat": datetime.utcnow(),
+            "exp": int(time.time()) + int(timedelta(hours=24).total_seconds()),
+            "iat": int(time.time()),
         }
         token = jwt.encode(payload, TEST_SECRET, algorithm="HS256")
         decoded = jwt.decode(token, TEST_SECRET, algorithms=["HS256"])
@@ -159,6 +187,16 @@ class TestJWT:
         assert "exp" in decoded
         assert "iat" in decoded
 
+    def test_int_epoch_claims_roundtrip(self):
+        """정수 epoch exp/iat가 그대로 보존됨"""
+        now = int(time.time())
+        payload = {"sub": "admin", "iat": now, "exp": now + 60}
+        token = jwt.encode(payload, TEST_SECRET, algorithm="HS256")
+        decoded = jwt.decode(token, TEST_SECRET, algorithms=["HS256"])
+
+        assert decoded["iat"] == now
+        assert decoded["exp"] == now + 60
+
 
 class TestProductionSecretGuard:
     """프로덕션 환경에서 시크릿 키 강제 검증"""
@@ -4,72 +4,241 @@
 
 v7.1 Optimizations:
   - SSIM 기반 유사 프레임 스킵 (동일 슬라이드 구간 고속 처리)
+    → v7.2: 8x8 perceptual hash + 해밍 거리로 교체 (프레임당 XOR/popcount 1회)
   - ThreadPoolExecutor 병렬 OCR (4 workers)
+    → v7.2: tesserocr 사용 시 in-process OCR (GIL 해제, subprocess 없음)
   - OCR 영역 축소 + 리사이즈 (처리 속도 향상)
 """
 
+import array
 import cv2
+import hashlib
 import numpy as np
+import os
+import queue
+import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import ClassVar, Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
 # pytesseract는 선택적 import
 try:
     import pytesseract
-    TESSERACT_AVAILABLE = True
+    HAS_PYTESSERACT = True
 except ImportError:
-    TESSERACT_AVAILABLE = False
+    HAS_PYTESSERACT = False
 
-# ─── v7.1: SSIM threshold for frame deduplication ───
-_SSIM_THRESHOLD = 0.95   # frames with SSIM > this reuse previous result
+# v7.2: tesserocr (Tesseract C API 바인딩, 선택적) — 프로세스 생성/이미지 인코딩 없이
+# 같은 프로세스에서 OCR하고 인식 중 GIL을 해제하므로 스레드 풀에서 코어 수만큼 병렬 실행됨
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+TESSERACT_AVAILABLE = HAS_TESSEROCR or HAS_PYTESSERACT
+
+# v7.2: diskcache (선택적) — 영상 간 동일 슬라이드 분석 결과 재사용
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+# ─── v7.2: perceptual-hash threshold for frame deduplication ───
+_HASH_MAX_DISTANCE = 5    # 64비트 해시의 해밍 거리가 이 값 이하이면 이전 결과 재사용
+_HASH_NEAR_DISTANCE = 12  # 이 값 이하이면 슬라이드는 같고 강사만 움직인 프레임 (얼굴 검출만 재실행)
 _OCR_MAX_WIDTH = 800      # resize to this width before OCR
 _PARALLEL_WORKERS = 4     # parallel OCR workers
 
 
-def _compute_ssim_fast(img1_gray: np.ndarray, img2_gray: np.ndarray) -> float:
+def _phash(gray: np.ndarray) -> int:
     """
-    Fast structural similarity (simplified SSIM) between two grayscale images.
-    Uses mean/variance/covariance without the full Wang et al. formula
-    for speed — sufficient for frame deduplication.
+    8x8 평균 해시 — 축소 영상에서 평균보다 밝은 픽셀을 1로 하는 64비트 정수.
+    v7.1의 SSIM(float64 GaussianBlur 6회) 대신 XOR + popcount 한 번으로 중복 판정.
     """
-    if img1_gray.shape != img2_gray.shape:
-        # resize to match
-        img2_gray = cv2.resize(img2_gray, (img1_gray.shape[1], img1_gray.shape[0]))
-
-    C1 = 6.5025    # (0.01 * 255)^2
-    C2 = 58.5225   # (0.03 * 255)^2
-
-    # Downscale for speed
-    h, w = img1_gray.shape
-    if w > 256:
-        scale = 256 / w
-        img1_gray = cv2.resize(img1_gray, (256, int(h * scale)))
-        img2_gray = cv2.resize(img2_gray, (256, int(h * scale)))
-
-    i1 = img1_gray.astype(np.float64)
-    i2 = img2_gray.astype(np.float64)
-
-    mu1 = cv2.GaussianBlur(i1, (11, 11), 1.5)
-    mu2 = cv2.GaussianBlur(i2, (11, 11), 1.5)
-
-    mu1_sq = mu1 * mu1
-    mu2_sq = mu2 * mu2
-    mu1_mu2 = mu1 * mu2
-
-    sigma1_sq = cv2.GaussianBlur(i1 * i1, (11, 11), 1.5) - mu1_sq
-    sigma2_sq = cv2.GaussianBlur(i2 * i2, (11, 11), 1.5) - mu2_sq
-    sigma12 = cv2.GaussianBlur(i1 * i2, (11, 11), 1.5) - mu1_mu2
+    small = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+    return int.from_bytes(np.packbits(small > small.mean()).tobytes(), "big")
+
+
+# 프레임 분류: 동일 (결과 재사용) / 거의 동일 (얼굴 검출만) / 고유 (전체 분석)
+_SAME, _NEAR, _UNIQUE = 0, 1, 2
+
+
+def _classify_frame(h: int, prev: Optional[int]) -> int:
+    """직전 고유 프레임 해시와의 해밍 거리로 프레임 분류"""
+    if prev is None:
+        return _UNIQUE
+    distance = (h ^ prev).bit_count()
+    if distance <= _HASH_MAX_DISTANCE:
+        return _SAME
+    if distance <= _HASH_NEAR_DISTANCE:
+        return _NEAR
+    return _UNIQUE
+
+
+# ─── v7.2: Persistent slide cache (그레이 프레임 내용 digest → 슬라이드/텍스트 분석 결과) ───
+# 강의 영상들은 같은 슬라이드를 재사용하므로 재분석 시 OCR을 건너뜀.
+# 키는 분석 입력(그레이 프레임) 전체의 blake2b — 64비트 phash는 비슷한 텍스트 슬라이드끼리 충돌해
+# 다른 강의의 결과를 돌려줄 수 있으므로 캐시 키로 쓰지 않음.
+# 강사 노출/가림은 영상마다 다르므로 저장하지 않고 매번 검출.
+# GAIM_CONTENT_CACHE=0 으로 비활성화, GAIM_CONTENT_CACHE_DIR로 위치 변경.
+USE_SLIDE_CACHE = HAS_DISKCACHE and os.getenv("GAIM_CONTENT_CACHE", "1") != "0"
+_SLIDE_CACHE_DIR = Path(os.getenv("GAIM_CONTENT_CACHE_DIR",
+                                  str(Path.home() / ".cache" / "gaim" / "content")))
+_SLIDE_CACHE_SIZE = int(os.getenv("GAIM_CONTENT_CACHE_BYTES", str(256 * 1024 * 1024)))
+_SLIDE_CACHE_VERSION = 2  # 분석 로직/키 형식이 바뀌면 올려서 이전 항목 무효화
+_slide_cache = None
+_slide_cache_lock = threading.Lock()
+
+
+def _get_slide_cache():
+    """프로세스 공용 diskcache (열기 실패 시 None — 캐시 없이 분석)"""
+    global _slide_cache, USE_SLIDE_CACHE
+    if not USE_SLIDE_CACHE:
+        return None
+    if _slide_cache is None:
+        with _slide_cache_lock:
+            if _slide_cache is None:
+                try:
+                    _slide_cache = diskcache.Cache(
+                        str(_SLIDE_CACHE_DIR),
+                        size_limit=_SLIDE_CACHE_SIZE,
+                        eviction_policy="least-recently-used",
+                    )
+                except Exception as e:
+                    print(f"[ContentAgent] 슬라이드 캐시 비활성화: {e}")
+                    USE_SLIDE_CACHE = False
+                    return None
+    return _slide_cache
+
+
+# 캐시에 저장하는 필드 (timestamp, 강사 감지, is_duplicate 제외)
+_SLIDE_CACHE_FIELDS = (
+    "text_density", "text_density_score", "readability", "slide_detected",
+    "color_contrast", "brightness", "complexity_score",
+)
+
+
+# ─── v7.2: Face detector cache ───
+# 모델 로드/파싱은 스레드당 한 번만 (검출기 인스턴스는 스레드 간 공유 시 안전하지 않음)
+_FACE_CASCADE_PATH = (
+    cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+    if hasattr(cv2, "data") else None
+)
+_detector_local = threading.local()
+
+# YuNet (OpenCV DNN 얼굴 검출기) — 모델 파일이 있으면 Haar 대신 사용
+_YUNET_MODEL = Path(os.getenv(
+    "GAIM_YUNET_MODEL",
+    str(Path(__file__).resolve().parent.parent.parent / "models" / "face_detection_yunet_2023mar.onnx"),
+))
+HAS_YUNET = hasattr(cv2, "FaceDetectorYN") and _YUNET_MODEL.exists()
+_YUNET_INPUT_WIDTH = 320  # 강사 노출 여부 판단에는 320px 폭이면 충분
+
+
+def _get_face_cascade():
+    """현재 스레드의 Haar 얼굴 검출기 (OpenCV 빌드에 Haar 모듈이 없으면 None)"""
+    cascade = getattr(_detector_local, "face", None)
+    if cascade is None and _FACE_CASCADE_PATH and hasattr(cv2, "CascadeClassifier"):
+        cascade = _detector_local.face = cv2.CascadeClassifier(_FACE_CASCADE_PATH)
+    return cascade
+
+
+def _get_yunet():
+    """현재 스레드의 YuNet 검출기"""
+    detector = getattr(_detector_local, "yunet", None)
+    if detector is None:
+        detector = _detector_local.yunet = cv2.FaceDetectorYN.create(
+            str(_YUNET_MODEL), "", (_YUNET_INPUT_WIDTH, _YUNET_INPUT_WIDTH)
+        )
+    return detector
 
-    ssim_map = ((2 * mu1_mu2 + C1) * (2 * sigma12 + C2)) / \
-               ((mu1_sq + mu2_sq + C1) * (sigma1_sq + sigma2_sq + C2))
 
-    return float(np.mean(ssim_map))
+def _detect_faces(frame: np.ndarray, gray: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """얼굴 박스 (x, y, w, h) 목록 — 원본 프레임 좌표계"""
+    if HAS_YUNET:
+        # YuNet은 BGR 3채널 입력 — 폭 320px로 축소해 검출 후 박스를 원본 크기로 복원
+        height, width = frame.shape[:2]
+        scale = min(1.0, _YUNET_INPUT_WIDTH / width)
+        small = cv2.resize(frame, (int(width * scale), int(height * scale)),
+                           interpolation=cv2.INTER_AREA) if scale < 1.0 else frame
+        detector = _get_yunet()
+        detector.setInputSize((small.shape[1], small.shape[0]))
+        _, faces = detector.detect(small)
+        if faces is None:
+            return []
+        return [tuple(int(v / scale) for v in face[:4]) for face in faces]
+
+    cascade = _get_face_cascade()
+    if cascade is None:
+        return []
+    return [tuple(int(v) for v in box) for box in cascade.detectMultiScale(gray, 1.1, 4)]
+
+
+def _ocr_image(binary: np.ndarray, lang: str) -> str:
+    """이진화 이미지 OCR — tesserocr가 있으면 스레드별 API 인스턴스 재사용, 없으면 pytesseract"""
+    if HAS_TESSEROCR:
+        apis = getattr(_detector_local, "tess", None)
+        if apis is None:
+            apis = _detector_local.tess = {}
+        api = apis.get(lang)
+        if api is None:
+            api = apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+        binary = np.ascontiguousarray(binary)
+        h, w = binary.shape
+        api.SetImageBytes(binary.tobytes(), w, h, 1, w)
+        return api.GetUTF8Text()
+    return pytesseract.image_to_string(binary, lang=lang)
+
+
+# ─── v7.2: OpenCL transparent API (T-API) ───
+# OpenCL 장치가 있을 때만 그레이 프레임을 UMat으로 올려 Canny/Laplacian/통계를 장치에서 연속 실행.
+# 장치가 없으면 UMat은 CPU 경로에 래퍼 오버헤드만 더하므로 ndarray 그대로 사용.
+# GAIM_OPENCL=0 으로 강제 비활성화 가능.
+USE_OPENCL = (
+    os.getenv("GAIM_OPENCL", "1") != "0"
+    and hasattr(cv2, "UMat")
+    and hasattr(cv2, "ocl")
+    and cv2.ocl.haveOpenCL()
+)
+if USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+
+def _to_device(gray: np.ndarray):
+    """T-API 사용 시 UMat, 아니면 입력 그대로"""
+    return cv2.UMat(gray) if USE_OPENCL else gray
+
+
+def _host(mat) -> np.ndarray:
+    """UMat 결과를 ndarray로 (ndarray는 그대로)"""
+    return mat.get() if isinstance(mat, cv2.UMat) else mat
+
+
+def _center_roi(img, height: int, width: int):
+    """중앙 1/2 영역 (UMat은 복사 없이 ROI 헤더만 생성)"""
+    rows, cols = (height // 4, 3 * height // 4), (width // 4, 3 * width // 4)
+    if isinstance(img, cv2.UMat):
+        return cv2.UMat(img, rows, cols)
+    return img[rows[0]:rows[1], cols[0]:cols[1]]
+
+
+def _fused_stats(gray: np.ndarray) -> Tuple[float, float, float]:
+    """v7.2: (밝기 평균, 밝기 표준편차, Laplacian 분산)을 meanStdDev 두 번으로 계산
+
+    uint8 입력의 3x3 Laplacian은 |값| ≤ 1020이므로 CV_16S로 충분 (CV_64F 대비 1/4 메모리).
+    """
+    mean, std = cv2.meanStdDev(gray)
+    _, lap_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    mean, std, lap_std = _host(mean), _host(std), _host(lap_std)
+    return float(mean[0, 0]), float(std[0, 0]), float(lap_std[0, 0]) ** 2
 
 
-@dataclass
+@dataclass(slots=True)  # v7.2: 인스턴스별 __dict__ 제거 (1fps 장시간 영상에서 결과 수가 많음)
 class ContentMetrics:
     """화면/슬라이드 분석 결과"""
     timestamp: float
@@ -85,6 +254,22 @@ class ContentMetrics:
     is_duplicate: bool = False         # v7.1: 이전 프레임과 동일 (재사용)
 
 
+# ─── v7.2: SoA column buffers for summary reductions ───
+# get_summary/_get_warnings가 매번 results 전체를 순회하지 않도록
+# 집계에 쓰이는 스칼라 필드만 float64 연속 배열로 유지
+_SUMMARY_COLUMNS = (
+    "text_density", "text_density_score", "brightness", "complexity_score",
+    "slide_detected", "speaker_visible", "speaker_overlap",
+)
+
+
+def _new_columns(results: Optional[List[ContentMetrics]] = None) -> Dict[str, array.array]:
+    """결과 목록으로 컬럼 버퍼 생성 (results가 없으면 빈 버퍼)"""
+    results = results or []
+    return {name: array.array("d", [getattr(r, name) for r in results])
+            for name in _SUMMARY_COLUMNS}
+
+
 class ContentAgent:
     """
     🎨 Content Agent (v7.1)
@@ -92,8 +277,23 @@ class ContentAgent:
     (Gemini API 없이 로컬 분석)
 
     v7.1: SSIM dedup + parallel OCR + region-resize optimization
+    v7.2: SSIM → perceptual hash dedup
     """
 
+    # v7.2: 프로세스 공용 분석 스레드 풀 (배치/스트림 호출마다 스레드를 새로 만들지 않음)
+    _POOL: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _POOL_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """분석 워커 풀 (지연 생성, 종료하지 않고 재사용 — 스레드별 OCR/검출기 캐시도 유지됨)"""
+        if cls._POOL is None:
+            with cls._POOL_LOCK:
+                if cls._POOL is None:
+                    cls._POOL = ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS,
+                                                   thread_name_prefix="content-agent")
+        return cls._POOL
+
     def __init__(self, config: Optional[dict] = None):
         self.config = config or {
             "text_density_threshold": 150,
@@ -102,19 +302,24 @@ class ContentAgent:
         }
 
         self.results: List[ContentMetrics] = []
-        self._prev_gray: Optional[np.ndarray] = None  # v7.1: for SSIM comparison
+        # v7.2: 요약용 컬럼 버퍼 (results의 스칼라 필드를 연속 메모리에 복제)
+        self._cols = _new_columns()
+        self._prev_hash: Optional[int] = None  # v7.2: perceptual hash of previous unique frame
         self._prev_metrics: Optional[ContentMetrics] = None
+        # v7.2: OCR 전처리 버퍼 (해상도별, 스레드별 — 병렬 OCR 워커 간 공유하지 않음)
+        self._scratch = threading.local()
 
         # v7.1: performance stats
         self._stats = {
             "total_frames": 0,
             "unique_frames": 0,
             "skipped_frames": 0,
+            "near_duplicate_frames": 0,
             "ocr_time": 0.0,
         }
 
         if not TESSERACT_AVAILABLE:
-            print("[!] pytesseract not installed. Text analysis will be limited.")
+            print("[!] pytesseract/tesserocr not installed. Text analysis will be limited.")
 
     def analyze_frame(self, frame: np.ndarray, timestamp: float) -> ContentMetrics:
         """
@@ -130,41 +335,88 @@ class ContentAgent:
         self._stats["total_frames"] += 1
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-        # v7.1: SSIM deduplication — skip if very similar to previous frame
-        if self._prev_gray is not None and self._prev_metrics is not None:
-            ssim = _compute_ssim_fast(gray, self._prev_gray)
-            if ssim > _SSIM_THRESHOLD:
-                # Reuse previous metrics with updated timestamp
-                dup = ContentMetrics(
-                    timestamp=timestamp,
-                    text_density=self._prev_metrics.text_density,
-                    text_density_score=self._prev_metrics.text_density_score,
-                    readability=self._prev_metrics.readability,
-                    slide_detected=self._prev_metrics.slide_detected,
-                    speaker_visible=self._prev_metrics.speaker_visible,
-                    speaker_overlap=self._prev_metrics.speaker_overlap,
-                    color_contrast=self._prev_metrics.color_contrast,
-                    brightness=self._prev_metrics.brightness,
-                    complexity_score=self._prev_metrics.complexity_score,
-                    is_duplicate=True,
-                )
-                self.results.append(dup)
-                self._stats["skipped_frames"] += 1
-                return dup
+        # v7.2: perceptual-hash deduplication — skip if very similar to previous frame
+        phash = _phash(gray)
+        kind = _classify_frame(phash, self._prev_hash) if self._prev_metrics is not None else _UNIQUE
+
+        if kind == _SAME:
+            # Reuse previous metrics with updated timestamp
+            dup = self._reuse_metrics(self._prev_metrics, timestamp, is_duplicate=True)
+            self._record(dup)
+            self._stats["skipped_frames"] += 1
+            return dup
+
+        if kind == _NEAR:
+            # 슬라이드/텍스트/밝기는 이전 결과 재사용, 강사 위치만 다시 검출
+            speaker = ContentMetrics(timestamp=timestamp)
+            self._analyze_speaker(frame, gray, speaker)
+            near = self._reuse_metrics(self._prev_metrics, timestamp, speaker=speaker)
+            self._record(near)
+            self._stats["near_duplicate_frames"] += 1
+            return near
 
         # Full analysis for unique frames
-        metrics = self._analyze_single_frame(frame, gray, timestamp)
-        self._prev_gray = gray
+        metrics = self._analyze_unique_frame(frame, gray, timestamp)
+        self._prev_hash = phash
         self._prev_metrics = metrics
         self._stats["unique_frames"] += 1
-        self.results.append(metrics)
+        self._record(metrics)
+        return metrics
+
+    def _slide_cache_key(self, gray: np.ndarray) -> str:
+        """그레이 프레임 내용 digest + 결과에 영향을 주는 설정 (OCR 언어/임계값/OCR 사용 여부)"""
+        digest = hashlib.blake2b(np.ascontiguousarray(gray), digest_size=16)
+        digest.update(repr(gray.shape).encode())
+        return (f"v{_SLIDE_CACHE_VERSION}:{digest.hexdigest()}:{self.config['ocr_language']}:"
+                f"{self.config['text_density_threshold']}:{int(TESSERACT_AVAILABLE)}")
+
+    def _analyze_unique_frame(self, frame: np.ndarray, gray: np.ndarray,
+                              timestamp: float) -> ContentMetrics:
+        """v7.2: 고유 프레임 분석 — 영구 캐시에 같은 프레임이 있으면 OCR 생략 (스레드 안전)"""
+        cache = _get_slide_cache()
+        if cache is None:
+            return self._analyze_single_frame(frame, gray, timestamp)
+
+        key = self._slide_cache_key(gray)
+        cached = cache.get(key)
+        if cached is not None:
+            metrics = ContentMetrics(timestamp, **dict(zip(_SLIDE_CACHE_FIELDS, cached)))
+            self._analyze_speaker(frame, gray, metrics)
+            return metrics
+
+        metrics = self._analyze_single_frame(frame, gray, timestamp)
+        cache.set(key, tuple(getattr(metrics, name) for name in _SLIDE_CACHE_FIELDS))
         return metrics
 
+    def _record(self, metrics: ContentMetrics):
+        """결과 추가 + 컬럼 버퍼 갱신"""
+        self.results.append(metrics)
+        for name, col in self._cols.items():
+            col.append(getattr(metrics, name))
+
+    def _column(self, name: str) -> np.ndarray:
+        """컬럼 버퍼를 복사 없이 ndarray로 노출 (results가 외부에서 교체되면 재구성)"""
+        col = self._cols[name]
+        if len(col) != len(self.results):
+            self._cols = _new_columns(self.results)
+            col = self._cols[name]
+        return np.frombuffer(col, dtype=np.float64)
+
+    @staticmethod
+    def _reuse_metrics(ref: ContentMetrics, timestamp: float, is_duplicate: bool = False,
+                       speaker: Optional[ContentMetrics] = None) -> ContentMetrics:
+        """기준 프레임 결과를 복사 (speaker가 주어지면 강사 감지 결과만 교체)"""
+        if speaker is None:
+            return replace(ref, timestamp=timestamp, is_duplicate=is_duplicate)
+        return replace(ref, timestamp=timestamp, is_duplicate=is_duplicate,
+                       speaker_visible=speaker.speaker_visible,
+                       speaker_overlap=speaker.speaker_overlap)
+
     def analyze_frames_batch(self, frames_with_ts: List[Tuple[np.ndarray, float]]) -> List[ContentMetrics]:
         """
-        v7.1: 여러 프레임을 SSIM dedup + 병렬 OCR로 분석
+        v7.1: 여러 프레임을 해시 dedup + 병렬 OCR로 분석
 
-        1단계: SSIM으로 고유 프레임 필터링
+        1단계: perceptual hash로 고유 프레임 필터링
         2단계: 고유 프레임을 병렬로 분석
         3단계: 중복 프레임에 결과 복사
 
@@ -179,77 +431,87 @@ class ContentAgent:
 
         t_start = time.time()
 
-        # Step 1: Identify unique frames via SSIM
+        # Step 1: Classify frames via perceptual hash (same / near-same / unique)
         unique_indices = []  # indices of unique frames
         dup_map = {}         # dup_index -> reference_unique_index
+        near_map = {}        # near_dup_index -> reference_unique_index (얼굴 검출만 재실행)
 
-        prev_gray = None
+        prev_hash = None
         prev_unique_idx = None
 
         for i, (frame, ts) in enumerate(frames_with_ts):
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            phash = _phash(gray)
+            kind = _classify_frame(phash, prev_hash)
 
-            if prev_gray is not None:
-                ssim = _compute_ssim_fast(gray, prev_gray)
-                if ssim > _SSIM_THRESHOLD:
-                    dup_map[i] = prev_unique_idx
-                    self._stats["skipped_frames"] += 1
-                    continue
+            if kind == _SAME:
+                dup_map[i] = prev_unique_idx
+                self._stats["skipped_frames"] += 1
+                continue
+            if kind == _NEAR:
+                near_map[i] = prev_unique_idx
+                self._stats["near_duplicate_frames"] += 1
+                continue
 
             unique_indices.append(i)
-            prev_gray = gray
+            prev_hash = phash
             prev_unique_idx = i
             self._stats["unique_frames"] += 1
 
         self._stats["total_frames"] = len(frames_with_ts)
 
         print(f"  [ContentAgent] 프레임 중복 제거: {len(frames_with_ts)} → {len(unique_indices)} 고유 프레임 "
-              f"({len(frames_with_ts) - len(unique_indices)} 스킵)")
+              f"({len(dup_map)} 스킵, {len(near_map)} 얼굴 검출만)")
 
-        # Step 2: Parallel analysis of unique frames
+        # Step 2: Parallel analysis of unique frames (+ face-only pass for near-duplicates)
         unique_results = {}  # index -> ContentMetrics
+        speaker_results = {}  # near_dup_index -> ContentMetrics (speaker fields only)
 
         def _analyze_one(idx):
             frame, ts = frames_with_ts[idx]
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            return idx, self._analyze_single_frame(frame, gray, ts)
-
-        with ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS) as pool:
-            futures = {pool.submit(_analyze_one, idx): idx for idx in unique_indices}
-            for future in as_completed(futures):
-                try:
-                    idx, metrics = future.result()
-                    unique_results[idx] = metrics
-                except Exception as e:
-                    idx = futures[future]
-                    frame, ts = frames_with_ts[idx]
-                    unique_results[idx] = ContentMetrics(timestamp=ts)
+            return idx, self._analyze_unique_frame(frame, gray, ts)
 
-        # Step 3: Build full results list (fill duplicates)
+        def _speaker_one(idx):
+            frame, ts = frames_with_ts[idx]
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            speaker = ContentMetrics(timestamp=ts)
+            self._analyze_speaker(frame, gray, speaker)
+            return idx, speaker
+
+        pool = self._get_pool()
+        futures = {pool.submit(_analyze_one, idx): idx for idx in unique_indices}
+        near_futures = {pool.submit(_speaker_one, idx): idx for idx in near_map}
+        for future in as_completed(futures):
+            try:
+                idx, metrics = future.result()
+                unique_results[idx] = metrics
+            except Exception as e:
+                idx = futures[future]
+                frame, ts = frames_with_ts[idx]
+                unique_results[idx] = ContentMetrics(timestamp=ts)
+        for future in as_completed(near_futures):
+            try:
+                idx, speaker = future.result()
+                speaker_results[idx] = speaker
+            except Exception:
+                pass  # 얼굴 검출 실패 시 기준 프레임의 강사 감지 결과 사용
+
+        # Step 3: Build full results list (fill duplicates / near-duplicates)
         all_results = []
         for i in range(len(frames_with_ts)):
             if i in unique_results:
                 all_results.append(unique_results[i])
             elif i in dup_map:
-                ref_idx = dup_map[i]
-                ref = unique_results[ref_idx]
                 _, ts = frames_with_ts[i]
-                dup = ContentMetrics(
-                    timestamp=ts,
-                    text_density=ref.text_density,
-                    text_density_score=ref.text_density_score,
-                    readability=ref.readability,
-                    slide_detected=ref.slide_detected,
-                    speaker_visible=ref.speaker_visible,
-                    speaker_overlap=ref.speaker_overlap,
-                    color_contrast=ref.color_contrast,
-                    brightness=ref.brightness,
-                    complexity_score=ref.complexity_score,
-                    is_duplicate=True,
-                )
-                all_results.append(dup)
+                all_results.append(self._reuse_metrics(unique_results[dup_map[i]], ts, is_duplicate=True))
+            elif i in near_map:
+                _, ts = frames_with_ts[i]
+                all_results.append(self._reuse_metrics(unique_results[near_map[i]], ts,
+                                                       speaker=speaker_results.get(i)))
 
         self.results = all_results
+        self._cols = _new_columns(all_results)
         elapsed = time.time() - t_start
         self._stats["ocr_time"] = elapsed
         print(f"  [ContentAgent] 분석 완료: {elapsed:.1f}s "
@@ -257,50 +519,192 @@ class ContentAgent:
 
         return all_results
 
+    def analyze_frames_stream(self, frames: Iterable[Tuple[np.ndarray, float]],
+                              queue_size: int = 16) -> Iterator[ContentMetrics]:
+        """
+        v7.2: 프레임 이터러블을 스트리밍 분석 (디코딩과 분석을 겹쳐 실행)
+
+        리더 스레드가 frames를 최대 queue_size개까지 미리 읽는 동안 고유 프레임은
+        스레드 풀에서 분석됩니다. 동시에 메모리에 있는 프레임은 약 2 * queue_size개로
+        제한되므로 영상 길이와 무관하게 전체 프레임을 리스트로 들고 있을 필요가 없습니다.
+
+        Args:
+            frames: (frame_bgr, timestamp) 이터러블 (예: 비디오 디코딩 제너레이터)
+            queue_size: 선읽기 큐 / 미완료 결과 상한
+
+        Yields:
+            입력 순서대로 ContentMetrics (self.results에도 누적)
+        """
+        frame_queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        end = object()
+
+        def _put(item) -> bool:
+            # 소비 측이 중단되면 (제너레이터 close) 블로킹된 put에서 빠져나옴
+            while not stop.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _reader():
+            try:
+                for item in frames:
+                    if not _put(item):
+                        return
+            except Exception as e:
+                _put(e)
+                return
+            _put(end)
+
+        def _analyze_one(frame, gray, ts):
+            try:
+                return self._analyze_unique_frame(frame, gray, ts)
+            except Exception:
+                return ContentMetrics(timestamp=ts)
+
+        def _speaker_one(frame, gray, ts):
+            try:
+                speaker = ContentMetrics(timestamp=ts)
+                self._analyze_speaker(frame, gray, speaker)
+                return speaker
+            except Exception:
+                return None  # 얼굴 검출 실패 시 기준 프레임의 강사 감지 결과 사용
+
+        def _ready(entry) -> bool:
+            _, _, future, ref = entry
+            return (future is None or future.done()) and (ref is None or ref.done())
+
+        def _resolve(entry) -> ContentMetrics:
+            ts, kind, future, ref = entry
+            if kind == _UNIQUE:
+                metrics = self._prev_metrics = future.result()
+            elif kind == _SAME:
+                metrics = self._reuse_metrics(ref.result(), ts, is_duplicate=True)
+            else:
+                metrics = self._reuse_metrics(ref.result(), ts, speaker=future.result())
+            self._record(metrics)
+            return metrics
+
+        t_start = time.time()
+        reader = threading.Thread(target=_reader, name="content-frame-reader", daemon=True)
+        reader.start()
+
+        # 순서 재정렬 버퍼: (timestamp, 분류, 결과 future, 기준 고유 프레임 future)
+        pending = deque()
+        ref_future = None
+        try:
+            pool = self._get_pool()
+            while True:
+                item = frame_queue.get()
+                if item is end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                frame, ts = item
+                self._stats["total_frames"] += 1
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                phash = _phash(gray)
+                kind = _classify_frame(phash, self._prev_hash) if ref_future is not None else _UNIQUE
+
+                if kind == _SAME:
+                    self._stats["skipped_frames"] += 1
+                    pending.append((ts, kind, None, ref_future))
+                elif kind == _NEAR:
+                    self._stats["near_duplicate_frames"] += 1
+                    pending.append((ts, kind, pool.submit(_speaker_one, frame, gray, ts), ref_future))
+                else:
+                    self._stats["unique_frames"] += 1
+                    self._prev_hash = phash
+                    ref_future = pool.submit(_analyze_one, frame, gray, ts)
+                    pending.append((ts, kind, ref_future, None))
+
+                # 완료된 앞부분은 바로 내보내고, 상한을 넘으면 가장 오래된 결과를 기다림
+                while pending and (len(pending) >= queue_size or _ready(pending[0])):
+                    yield _resolve(pending.popleft())
+
+            while pending:
+                yield _resolve(pending.popleft())
+        finally:
+            stop.set()
+            # 분석이 디코딩과 겹쳐 실행되므로 스트림 시작~종료 경과 시간을 누적
+            self._stats["ocr_time"] += time.time() - t_start
+            # 공용 풀이므로 중단된 스트림의 대기 작업은 취소 (실행 중인 작업은 그대로 완료)
+            for _, _, future, _ in pending:
+                if future is not None:
+                    future.cancel()
+
     def _analyze_single_frame(self, frame: np.ndarray, gray: np.ndarray,
                               timestamp: float) -> ContentMetrics:
         """단일 고유 프레임 전체 분석 (스레드 안전)"""
         metrics = ContentMetrics(timestamp=timestamp)
+        # v7.2: OpenCL 사용 시 한 번만 업로드해 통계/엣지 연산을 장치에서 이어서 실행
+        dev_gray = _to_device(gray)
 
-        # 1. 기본 이미지 속성 분석
-        self._analyze_basic_properties(frame, gray, metrics)
+        # 1. 기본 이미지 속성 + 화면 복잡도 분석 (v7.2: 단일 통계 패스)
+        self._analyze_basic_properties(frame, dev_gray, metrics)
 
-        # 2. 화면 영역 분석 (슬라이드 vs 강사)
-        self._analyze_regions(frame, gray, metrics)
+        # 2. 화면 영역 분석 (슬라이드 vs 강사) — v7.2: 슬라이드 판단용 중앙 ROI는 여기서 한 번만 정의
+        height, width = frame.shape[:2]
+        slide_roi = _center_roi(dev_gray, height, width)
+        self._analyze_regions(frame, gray, metrics, dev_gray, slide_roi)
 
-        # 3. 텍스트 분석 (OCR)
+        # 3. 텍스트 분석 (OCR은 호스트 메모리 필요 — ndarray 사용)
         if TESSERACT_AVAILABLE:
             self._analyze_text(frame, gray, metrics)
         else:
-            self._estimate_text_density(frame, gray, metrics)
-
-        # 4. 화면 복잡도 분석
-        self._analyze_complexity(gray, metrics)
+            self._estimate_text_density(frame, dev_gray, metrics)
 
         return metrics
 
     def _analyze_basic_properties(self, frame: np.ndarray, gray: np.ndarray,
                                   metrics: ContentMetrics):
-        """기본 이미지 속성 분석"""
+        """기본 이미지 속성 + 복잡도 분석"""
+        brightness, gray_std, lap_var = _fused_stats(gray)
+
         # 밝기 계산
-        metrics.brightness = float(np.mean(gray))
+        metrics.brightness = brightness
 
-        # 색상 대비 계산
-        lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
-        l_channel = lab[:, :, 0]
-        metrics.color_contrast = float(np.std(l_channel) / 128)
+        # 색상 대비 계산 (v7.2: BGR→LAB 변환 없이 그레이 표준편차로 근사)
+        metrics.color_contrast = gray_std / 128
+
+        # 화면 복잡도 — Laplacian variance 정규화 (0-100)
+        metrics.complexity_score = min(100, lap_var / 50)
 
     def _analyze_regions(self, frame: np.ndarray, gray: np.ndarray,
-                         metrics: ContentMetrics):
-        """화면 영역 분석 (슬라이드, 강사 영역 감지)"""
+                         metrics: ContentMetrics, dev_gray=None, slide_roi=None):
+        """화면 영역 분석 (슬라이드, 강사 영역 감지)
+
+        dev_gray: v7.2 — gray의 UMat 사본 (있으면 슬라이드 엣지 검출에 사용)
+        slide_roi: v7.2 — 호출자가 미리 만든 중앙 ROI (없으면 여기서 생성)
+        """
         height, width = frame.shape[:2]
 
-        # 얼굴 감지로 강사 영역 확인
-        face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
+        self._analyze_speaker(frame, gray, metrics)
 
-        faces = face_cascade.detectMultiScale(gray, 1.1, 4)
+        # 슬라이드 감지 (텍스트/도형이 있는 균일한 배경 영역)
+        center_region = slide_roi if slide_roi is not None else _center_roi(
+            gray if dev_gray is None else dev_gray, height, width)
+
+        # 엣지 감지로 콘텐츠 존재 확인
+        edges = cv2.Canny(center_region, 50, 150)
+        area = (3 * height // 4 - height // 4) * (3 * width // 4 - width // 4)
+        edge_density = cv2.countNonZero(edges) / area
+
+        # 일정 수준의 엣지 밀도가 있으면 슬라이드로 판단
+        if 0.01 < edge_density < 0.3:
+            metrics.slide_detected = True
+
+    def _analyze_speaker(self, frame: np.ndarray, gray: np.ndarray,
+                         metrics: ContentMetrics):
+        """v7.2: 강사 영역 감지 (얼굴 위치로 노출/슬라이드 가림 판단)"""
+        width = frame.shape[1]
+
+        # 얼굴 감지로 강사 영역 확인 (v7.2: 캐시된 검출기 재사용, YuNet 우선)
+        faces = _detect_faces(frame, gray)
 
         if len(faces) > 0:
             metrics.speaker_visible = True
@@ -312,17 +716,6 @@ class ContentAgent:
                     metrics.speaker_overlap = True
                     break
 
-        # 슬라이드 감지 (텍스트/도형이 있는 균일한 배경 영역)
-        center_region = gray[height//4:3*height//4, width//4:3*width//4]
-
-        # 엣지 감지로 콘텐츠 존재 확인
-        edges = cv2.Canny(center_region, 50, 150)
-        edge_density = np.sum(edges > 0) / edges.size
-
-        # 일정 수준의 엣지 밀도가 있으면 슬라이드로 판단
-        if 0.01 < edge_density < 0.3:
-            metrics.slide_detected = True
-
     def _analyze_text(self, frame: np.ndarray, gray: np.ndarray,
                       metrics: ContentMetrics):
         """OCR을 통한 텍스트 분석 (v7.1: region + resize optimization)"""
@@ -332,21 +725,23 @@ class ContentAgent:
             # v7.1: Resize for faster OCR
             if w > _OCR_MAX_WIDTH:
                 scale = _OCR_MAX_WIDTH / w
-                gray_resized = cv2.resize(gray, (_OCR_MAX_WIDTH, int(h * scale)))
+                size = (_OCR_MAX_WIDTH, int(h * scale))
+            else:
+                size = (w, h)
+            resized_buf, binary_buf = self._ocr_buffers(size)
+            if size[0] != w:
+                gray_resized = cv2.resize(gray, size, dst=resized_buf)
             else:
                 gray_resized = gray
 
             # 적응형 이진화
             binary = cv2.adaptiveThreshold(
                 gray_resized, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY, 11, 2
+                cv2.THRESH_BINARY, 11, 2, dst=binary_buf
             )
 
-            # OCR 수행
-            text = pytesseract.image_to_string(
-                binary,
-                lang=self.config["ocr_language"]
-            )
+            # OCR 수행 (v7.2: tesserocr 우선)
+            text = _ocr_image(binary, self.config["ocr_language"])
 
             # 텍스트 밀도 계산
             clean_text = ''.join(c for c in text if c.isalnum())
@@ -368,15 +763,27 @@ class ContentAgent:
         except Exception as e:
             self._estimate_text_density(frame, gray, metrics)
 
+    def _ocr_buffers(self, size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """v7.2: (리사이즈, 이진화) 출력 버퍼 — 같은 해상도 영상은 프레임마다 재할당하지 않음"""
+        buffers = getattr(self._scratch, "ocr", None)
+        if buffers is None:
+            buffers = self._scratch.ocr = {}
+        bufs = buffers.get(size)
+        if bufs is None:
+            w, h = size
+            bufs = buffers[size] = (np.empty((h, w), np.uint8), np.empty((h, w), np.uint8))
+        return bufs
+
     def _estimate_text_density(self, frame: np.ndarray, gray: np.ndarray,
                                metrics: ContentMetrics):
         """OCR 없이 텍스트 밀도 추정 (엣지 기반)"""
-        # 텍스트 영역 감지 (MSER 알고리즘)
-        mser = cv2.MSER_create()
-        regions, _ = mser.detectRegions(gray)
+        # v7.2: MSER 영역 목록(수천 개 point 배열) 대신 엣지의 연결 성분 수로 추정
+        edges = cv2.Canny(gray, 80, 160)
+        n_components, _ = cv2.connectedComponents(edges)
 
-        # 텍스트로 추정되는 영역 수로 밀도 추정
-        estimated_chars = len(regions) // 3
+        # 텍스트로 추정되는 영역 수로 밀도 추정 (라벨 0은 배경)
+        # 글자당 연결 성분: 영문 ~1.2, 한글 음절 ~2-3 → 2로 나눔
+        estimated_chars = (n_components - 1) // 2
         metrics.text_density = estimated_chars
 
         # 점수 계산
@@ -388,32 +795,24 @@ class ContentAgent:
         else:
             metrics.readability = "unknown"
 
-    def _analyze_complexity(self, gray: np.ndarray, metrics: ContentMetrics):
-        """화면 복잡도 분석"""
-        # Laplacian variance로 복잡도 측정
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
-
-        # 정규화 (0-100)
-        metrics.complexity_score = min(100, variance / 50)
-
     def get_summary(self) -> Dict:
         """분석 결과 요약"""
         if not self.results:
             return {"error": "분석 결과가 없습니다"}
 
         total = len(self.results)
+        density_score = self._column("text_density_score")
 
         summary = {
             "total_frames_analyzed": total,
-            "avg_text_density": np.mean([r.text_density for r in self.results]),
-            "avg_text_density_score": np.mean([r.text_density_score for r in self.results]),
-            "high_density_ratio": sum(1 for r in self.results if r.text_density_score >= 7) / total,
-            "slide_detection_ratio": sum(1 for r in self.results if r.slide_detected) / total,
-            "speaker_visible_ratio": sum(1 for r in self.results if r.speaker_visible) / total,
-            "speaker_overlap_ratio": sum(1 for r in self.results if r.speaker_overlap) / total,
-            "avg_brightness": np.mean([r.brightness for r in self.results]),
-            "avg_complexity": np.mean([r.complexity_score for r in self.results]),
+            "avg_text_density": float(self._column("text_density").mean()),
+            "avg_text_density_score": float(density_score.mean()),
+            "high_density_ratio": int((density_score >= 7).sum()) / total,
+            "slide_detection_ratio": float(self._column("slide_detected").sum()) / total,
+            "speaker_visible_ratio": float(self._column("speaker_visible").sum()) / total,
+            "speaker_overlap_ratio": float(self._column("speaker_overlap").sum()) / total,
+            "avg_brightness": float(self._column("brightness").mean()),
+            "avg_complexity": float(self._column("complexity_score").mean()),
             "warnings": self._get_warnings()
         }
 
@@ -423,6 +822,7 @@ class ContentAgent:
                 "total_frames": self._stats["total_frames"],
                 "unique_frames": self._stats["unique_frames"],
                 "skipped_frames": self._stats["skipped_frames"],
+                "near_duplicate_frames": self._stats["near_duplicate_frames"],
                 "dedup_ratio": round(self._stats["skipped_frames"] / max(1, self._stats["total_frames"]), 3),
                 "ocr_time": round(self._stats["ocr_time"], 2),
             }
@@ -438,9 +838,9 @@ class ContentAgent:
         total = len(self.results)
 
         # Calculate values directly to avoid recursion
-        high_density_ratio = sum(1 for r in self.results if r.text_density_score >= 7) / total
-        speaker_overlap_ratio = sum(1 for r in self.results if r.speaker_overlap) / total
-        avg_brightness = np.mean([r.brightness for r in self.results])
+        high_density_ratio = int((self._column("text_density_score") >= 7).sum()) / total
+        speaker_overlap_ratio = float(self._column("speaker_overlap").sum()) / total
+        avg_brightness = float(self._column("brightness").mean())
 
         if high_density_ratio > 0.3:
             warnings.append("[!] High text density detected in over 30% of frames")
@@ -479,11 +879,13 @@ class ContentAgent:
     def reset(self):
         """분석 결과 초기화"""
         self.results = []
-        self._prev_gray = None
+        self._cols = _new_columns()
+        self._prev_hash = None
         self._prev_metrics = None
         self._stats = {
             "total_frames": 0,
             "unique_frames": 0,
             "skipped_frames": 0,
+            "near_duplicate_frames": 0,
             "ocr_time": 0.0,
         }
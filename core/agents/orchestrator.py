@@ -3,18 +3,32 @@ Agent Orchestrator - Multi-Agent Pipeline Orchestrator
 Google ADK style agent execution management system
 
 v7.0: Pydantic-based SharedContext, confidence metadata propagation
+v7.2: SharedContext is a slots dataclass (no per-write validation)
 Pipeline flow:
 EXTRACT -> [VISION | CONTENT | STT | VIBE] (parallel) -> PEDAGOGY -> FEEDBACK -> SYNTHESIZE
+v7.2: VISION/CONTENT share a single frame decode pass
+v7.2: agents are dispatched from AgentState.dependencies (DAG) instead of fixed phase barriers
 """
 
+import os
+import re
+import sys
 import time
+import uuid
+import queue
+import tempfile
+import functools
 import traceback
+import atexit
 import threading
 import importlib.util
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+
+import cv2
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -24,18 +38,73 @@ _CORE_DIR = _AGENTS_DIR.parent
 _PROJECT_ROOT = _CORE_DIR.parent
 
 
+# v7.2: 동적 로드 직렬화 — sys.modules 등록 후 exec_module 완료 전에 다른 스레드가
+# 초기화 중인 모듈을 가져가지 않도록 (첫 파이프라인이 여러 스레드에서 동시에 시작될 때)
+_MODULE_LOCK = threading.RLock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_module_cached(module_name: str, file_path: str):
+    """파일 경로 기반 모듈 동적 로드 (성공한 결과만 캐시 — 실패 시 다음 호출에서 재시도)"""
+    with _MODULE_LOCK:
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None:
+            raise ImportError(f"Cannot load module from {file_path}")
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return mod
+
+
 def _load_module(module_name: str, file_path: Path):
     """파일 경로 기반 모듈 동적 로드"""
-    import sys
-    if module_name in sys.modules:
-        return sys.modules[module_name]
-    spec = importlib.util.spec_from_file_location(module_name, str(file_path))
-    if spec is None:
-        raise ImportError(f"Cannot load module from {file_path}")
-    mod = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = mod
-    spec.loader.exec_module(mod)
-    return mod
+    return _load_module_cached(module_name, str(file_path))
+
+
+# v7.2: 파이프라인 공용 워커 수 (GAIM_AGENT_WORKERS로 조정)
+# 최소 4: DAG 동시 작업(visual/stt/vibe) 3개 + visual 작업이 제출하는 콘텐츠 소비자 1개 —
+# 이보다 작으면 visual 작업이 같은 풀의 하위 작업을 기다리며 교착될 수 있음
+_PIPELINE_WORKERS = max(4, int(os.getenv("GAIM_AGENT_WORKERS", str(max(4, os.cpu_count() or 1)))))
+
+
+# v7.2: 프레임 파일명의 숫자 → 타임스탬프
+_TS_RE = re.compile(r'(\d+)')
+
+# v7.2: 프레임 공급 방식 — "video": 영상에서 직접 디코딩 (JPEG 인코딩/디스크/재디코딩 없음),
+# "jpeg": 기존 ffmpeg JPEG 추출. 영상을 OpenCV로 열 수 없으면 자동으로 jpeg 사용
+_FRAME_SOURCE = os.getenv("GAIM_FRAME_SOURCE", "video")
+
+# v7.2: JPEG 프레임 병렬 디코딩 워커 수 (cv2.imread는 GIL을 해제)
+_DECODE_WORKERS = min(4, os.cpu_count() or 1)
+
+# v7.2: 보관할 최근 이벤트 수 (파이프라인 1회 ≈ 수십 개)
+_EVENT_LOG_MAX = 2048
+
+# v7.2: 전체 traceback(프레임 순회 + 소스 라인 읽기)은 디버그 모드에서만 이벤트에 포함
+_DEBUG_TRACEBACKS = bool(os.getenv("GAIM_DEBUG"))
+
+
+# v7.2: 파이프라인 구성 요소 — 키 → (모듈 이름, 파일 경로, 속성 이름)
+# 프로세스당 한 번 해석해 AgentOrchestrator._COMPONENTS에 캐시 (단계 실행마다 import 조회 없음)
+_COMPONENT_SPECS = {
+    "extract": ("timelapse_analyzer", _CORE_DIR / "analyzers" / "timelapse_analyzer.py", "flash_extract_resources"),
+    "video_frames": ("timelapse_analyzer", _CORE_DIR / "analyzers" / "timelapse_analyzer.py", "iter_video_frames"),
+    "vision": ("vision_agent", _AGENTS_DIR / "vision_agent.py", "VisionAgent"),
+    "content": ("content_agent", _AGENTS_DIR / "content_agent.py", "ContentAgent"),
+    "stt": ("stt_agent", _AGENTS_DIR / "stt_agent.py", "STTAgent"),
+    "vibe": ("vibe_agent", _AGENTS_DIR / "vibe_agent.py", "VibeAgent"),
+    "pedagogy": ("pedagogy_agent", _AGENTS_DIR / "pedagogy_agent.py", "PedagogyAgent"),
+    "discourse": ("discourse_analyzer", _AGENTS_DIR / "discourse_analyzer.py", "DiscourseAnalyzer"),
+    "feedback": ("feedback_agent", _AGENTS_DIR / "feedback_agent.py", "FeedbackAgent"),
+    "master": ("master_agent", _AGENTS_DIR / "master_agent.py", "MasterAgent"),
+    "database": ("database", _CORE_DIR / "database.py", "AnalysisRepository"),
+}
 
 
 class AgentStatus(Enum):
@@ -59,7 +128,7 @@ class PipelinePhase(Enum):
     SYNTHESIZE = "synthesize"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """개별 에이전트 상태"""
     name: str
@@ -67,21 +136,28 @@ class AgentState:
     icon: str
     status: AgentStatus = AgentStatus.IDLE
     progress: int = 0
-    start_time: Optional[float] = None
+    start_time: Optional[float] = None  # v7.2: time.monotonic() 기준 (소요 시간 계산 전용)
     end_time: Optional[float] = None
     result: Optional[Dict] = None
     error: Optional[str] = None
     dependencies: List[str] = field(default_factory=list)
+    # v7.2: to_dict() 메모 — (status, progress, end_time, error)가 같으면 재사용 (실행 중에는 캐시 안 함)
+    _dict_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def elapsed_seconds(self) -> float:
         if self.start_time is None:
             return 0.0
-        end = self.end_time or time.time()
+        end = self.end_time or time.monotonic()
         return round(end - self.start_time, 2)
 
     def to_dict(self) -> Dict:
-        return {
+        """상태 스냅샷 (v7.2: 종료/대기 상태에서는 같은 dict를 반환하므로 호출자는 수정하지 말 것)"""
+        key = (self.status, self.progress, self.end_time, self.error, self.result is not None)
+        if key == self._dict_key:
+            return self._dict_cache
+        d = {
             "name": self.name,
             "role": self.role,
             "icon": self.icon,
@@ -92,60 +168,185 @@ class AgentState:
             "has_result": self.result is not None,
             "dependencies": self.dependencies,
         }
+        # 실행 중에는 elapsed_seconds가 계속 변하므로 캐시하지 않음
+        if self.status is not AgentStatus.RUNNING:
+            self._dict_key, self._dict_cache = key, d
+        return d
+
+
+# v7.2: 신뢰된 프로세스 내부 에이전트 간 공유 컨테이너 — 외부 입력을 검증하지 않으므로
+# Pydantic 모델 대신 slots dataclass 사용 (필드 쓰기/생성 시 검증·__dict__ 비용 없음)
+@dataclass(slots=True)
+class SharedContext:
+    """Agent shared context"""
+    video_path: str = ""
+    temp_dir: str = ""
+    extracted_frames: List[str] = field(default_factory=list)
+    frame_entries: List[Tuple[str, float]] = field(default_factory=list)  # v7.2: (경로, 타임스탬프) — 추출 시 1회 파싱
+    frame_source: str = "jpeg"  # v7.2: "jpeg" (extracted_frames) | "video" (video_path 직접 디코딩)
+    audio_path: str = ""
+    vision_summary: Dict = field(default_factory=dict)
+    vision_timeline: List[Dict] = field(default_factory=list)
+    content_summary: Dict = field(default_factory=dict)
+    content_timeline: List[Dict] = field(default_factory=list)
+    stt_result: Dict = field(default_factory=dict)
+    vibe_summary: Dict = field(default_factory=dict)
+    vibe_timeline: List[Dict] = field(default_factory=list)
+    audio_metrics: Dict = field(default_factory=dict)
+    discourse_result: Dict = field(default_factory=dict)
+    pedagogy_result: Dict = field(default_factory=dict)
+    feedback_result: Dict = field(default_factory=dict)
+    master_draft: Dict = field(default_factory=dict)  # v7.2: MasterAgent.synthesize 결과 (교육학/피드백 병합 전)
+    master_report: Dict = field(default_factory=dict)
+    duration: float = 0.0
+    metadata: Dict = field(default_factory=dict)
+
+    def clear(self):
+        """v7.2: 기존 인스턴스를 기본값으로 되돌림 (배치 reset 시 재생성 대신 사용)
+
+        컬렉션 필드는 .clear()가 아닌 새 빈 컨테이너로 교체 — 이전 run_pipeline 결과가
+        pedagogy_result 등을 그대로 참조하므로 제자리에서 비우면 호출자 데이터가 지워짐.
+        """
+        for name, default, factory in _CONTEXT_DEFAULTS:
+            setattr(self, name, factory() if factory is not None else default)
+
+
+# (필드명, 기본값, default_factory) — SharedContext.clear()용, 모듈 로드 시 1회 계산
+_CONTEXT_DEFAULTS = tuple(
+    (f.name, f.default, None if f.default_factory is MISSING else f.default_factory)
+    for f in fields(SharedContext)
+)
+
+
+class _FrameFanout:
+    """v7.2: 추출 프레임을 한 번만 디코딩해 여러 에이전트에 전달
 
+    디코더 스레드가 (frame, timestamp) 이터러블(JPEG imread 또는 영상 직접 디코딩)을
+    소비하며 결과를 소비자별 bounded queue에 넣으므로
+    메모리에 올라가는 프레임 수는 소비자당 maxsize개로 제한됩니다.
+    한 소비자가 실패/중단되면 그 큐는 건너뛰어 나머지 소비자가 막히지 않습니다.
+    디코딩 중 예외가 나면 각 소비자가 남은 프레임을 소진한 뒤 같은 예외를 다시 발생시킵니다.
+    """
+
+    _END = object()
 
-# v7.0: Pydantic-based SharedContext (with dataclass fallback)
-try:
-    from pydantic import BaseModel, Field as PydField
-    HAS_PYDANTIC = True
-except ImportError:
-    HAS_PYDANTIC = False
-
-if HAS_PYDANTIC:
-    class SharedContext(BaseModel):
-        """v7.0: Pydantic-validated agent shared context"""
-        model_config = {"arbitrary_types_allowed": True}
-
-        video_path: str = ""
-        temp_dir: str = ""
-        extracted_frames: List[str] = PydField(default_factory=list)
-        audio_path: str = ""
-        vision_summary: Dict = PydField(default_factory=dict)
-        vision_timeline: List[Dict] = PydField(default_factory=list)
-        content_summary: Dict = PydField(default_factory=dict)
-        content_timeline: List[Dict] = PydField(default_factory=list)
-        stt_result: Dict = PydField(default_factory=dict)
-        vibe_summary: Dict = PydField(default_factory=dict)
-        vibe_timeline: List[Dict] = PydField(default_factory=list)
-        audio_metrics: Dict = PydField(default_factory=dict)
-        discourse_result: Dict = PydField(default_factory=dict)
-        pedagogy_result: Dict = PydField(default_factory=dict)
-        feedback_result: Dict = PydField(default_factory=dict)
-        master_report: Dict = PydField(default_factory=dict)
-        duration: float = 0.0
-        metadata: Dict = PydField(default_factory=dict)
-else:
-    @dataclass
-    class SharedContext:
-        """Agent shared context (dataclass fallback)"""
-        video_path: str = ""
-        temp_dir: str = ""
-        extracted_frames: List[str] = field(default_factory=list)
-        audio_path: str = ""
-        vision_summary: Dict = field(default_factory=dict)
-        vision_timeline: List[Dict] = field(default_factory=list)
-        content_summary: Dict = field(default_factory=dict)
-        content_timeline: List[Dict] = field(default_factory=list)
-        stt_result: Dict = field(default_factory=dict)
-        vibe_summary: Dict = field(default_factory=dict)
-        vibe_timeline: List[Dict] = field(default_factory=list)
-        audio_metrics: Dict = field(default_factory=dict)
-        discourse_result: Dict = field(default_factory=dict)
-        pedagogy_result: Dict = field(default_factory=dict)
-        feedback_result: Dict = field(default_factory=dict)
-        master_report: Dict = field(default_factory=dict)
-        duration: float = 0.0
-        metadata: Dict = field(default_factory=dict)
+    def __init__(self, frames, consumers: int = 2, maxsize: int = 4):
+        self._frames = frames
+        self._queues = [queue.Queue(maxsize=maxsize) for _ in range(consumers)]
+        self._closed = [threading.Event() for _ in range(consumers)]
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._produce, name="frame-decoder", daemon=True)
+
+    def start(self) -> "_FrameFanout":
+        self._thread.start()
+        return self
+
+    def _put(self, i: int, item):
+        while not self._closed[i].is_set():
+            try:
+                self._queues[i].put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(self):
+        try:
+            for item in self._frames:
+                if all(c.is_set() for c in self._closed):
+                    return
+                for i in range(len(self._queues)):
+                    self._put(i, item)
+        except BaseException as e:
+            # 잘린 프레임 목록으로 분석이 '성공'하지 않도록 소비자 쪽에서 다시 발생
+            self._error = e
+        finally:
+            for i in range(len(self._queues)):
+                self._put(i, self._END)
+
+    def consumer(self, i: int):
+        """i번째 소비자용 (frame, timestamp) 이터레이터"""
+        while True:
+            item = self._queues[i].get()
+            if item is self._END:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
+
+    def close(self, i: int):
+        """i번째 소비자 종료 — 이후 프레임은 이 소비자 큐에 넣지 않음"""
+        self._closed[i].set()
+
+
+class _DBWriter:
+    """v7.2: 분석 결과 DB 저장 전용 단일 작성자 (SQLite 단일 작성자)
+
+    run_pipeline은 행을 큐에 넣고 바로 반환합니다. 작성자 스레드는 하나의 Repository를
+    재사용하며, 큐에 쌓여 있는 행(최대 MAX_BATCH개)을 한 트랜잭션(save_many)으로 커밋합니다.
+    """
+
+    MAX_BATCH = 32
+
+    def __init__(self):
+        self._q: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._repo = None
+
+    def submit(self, row: Dict) -> Future:
+        """저장할 행 예약 — 반환된 Future는 커밋 후 완료 (실패해도 예외 없이 False)"""
+        fut: Future = Future()
+        self._q.put((row, fut))
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="agent-db", daemon=True)
+                    self._thread.start()
+        return fut
+
+    def flush(self):
+        """예약된 모든 행이 처리될 때까지 대기 (인터프리터 종료 시 호출)"""
+        if self._thread is not None:
+            self._q.join()
+
+    def _run(self):
+        while True:
+            batch = [self._q.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            results = self._write([row for row, _ in batch])
+            for (_, fut), ok in zip(batch, results):
+                fut.set_result(ok)
+                self._q.task_done()
+
+    def _write(self, rows: List[Dict]) -> List[bool]:
+        """행별 저장 성공 여부 — 배치가 실패하면 (트랜잭션 전체 rollback) 행마다 save_result로 재시도"""
+        try:
+            if self._repo is None:
+                # Use absolute path to avoid sys.path issues in batch context
+                module_name, file_path, attr = _COMPONENT_SPECS["database"]
+                self._repo = getattr(_load_module(module_name, file_path), attr)()
+            self._repo.save_many(rows)
+            return [True] * len(rows)
+        except Exception:
+            if self._repo is None or len(rows) == 1:
+                return [False] * len(rows)  # DB save is optional, don't break pipeline
+        # 한 행의 오류가 같은 배치의 다른 파이프라인 결과까지 버리지 않도록 개별 저장
+        return [self._write_one(row) for row in rows]
+
+    def _write_one(self, row: Dict) -> bool:
+        try:
+            self._repo.save_result(**row)
+            return True
+        except Exception:
+            return False
+
+
+_DB_WRITER = _DBWriter()
+atexit.register(_DB_WRITER.flush)
 
 
 class AgentOrchestrator:
@@ -153,7 +354,7 @@ class AgentOrchestrator:
     Multi-Agent Pipeline Orchestrator (v7.0)
 
     Manages 6 specialist agents + Master Agent with
-    Pydantic-validated context sharing, confidence metadata,
+    shared-context passing, confidence metadata,
     and thread-safe state monitoring.
 
     Pipeline:
@@ -164,32 +365,121 @@ class AgentOrchestrator:
         self.agents: Dict[str, AgentState] = {}
         self.context = SharedContext()
         self.pipeline_id: Optional[str] = None
-        self.pipeline_start: Optional[float] = None
+        self.pipeline_start: Optional[float] = None  # v7.2: time.monotonic() 기준 — 벽시계 시각은 이벤트 timestamp 참고
         self.pipeline_end: Optional[float] = None
-        self.event_log: List[Dict] = []
+        # v7.2: append는 GIL 하에서 원자적 — 잠금 불필요. 상주 서버에서 무한히 커지지 않도록 링 버퍼
+        self.event_log: deque = deque(maxlen=_EVENT_LOG_MAX)
         self._callbacks: List[Callable] = []
         self._lock = threading.Lock()  # v5.0: 스레드 안전
+        # v7.2: 콜백은 전용 디스패처 스레드에서 실행 (느린 콜백이 에이전트 스레드를 막지 않음)
+        self._event_q: queue.Queue = queue.Queue()
+        self._dispatcher: Optional[threading.Thread] = None
+        # v7.2: 파이프라인 실행마다 스레드를 새로 만들지 않고 재사용 (close() 또는 with 블록으로 종료)
+        self._pool = ThreadPoolExecutor(max_workers=_PIPELINE_WORKERS, thread_name_prefix="agent")
+        self._debug_tracebacks = _DEBUG_TRACEBACKS
+        self._agent_instances: Dict[str, Any] = {}  # v7.2: 재사용 에이전트 (_agent())
+        self._db_futures: List = []  # v7.2: 진행 중인 비동기 DB 저장 (flush_db()로 대기)
 
         self._register_agents()
+        self._load_components()
+
+    # v7.2: 정적 에이전트 정의 (클래스 수준 — 인스턴스마다 리스트를 다시 만들지 않음)
+    _AGENT_DEFS: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+        ("extractor", "리소스 추출기", "📦", ()),
+        ("vision", "비전 분석 에이전트", "👁️", ("extractor",)),
+        ("content", "콘텐츠 분석 에이전트", "🎨", ("extractor",)),
+        ("stt", "음성→텍스트 에이전트", "🗣️", ("extractor",)),
+        ("vibe", "음성 프로소디 에이전트", "🔊", ("extractor",)),
+        ("pedagogy", "교육학 평가 에이전트", "📚", ("vision", "content", "stt", "vibe")),
+        ("feedback", "피드백 생성 에이전트", "💡", ("pedagogy",)),
+        # v7.2: synthesize는 vision/content/vibe만 사용 → 교육학 평가/피드백과 병렬 실행
+        ("master_core", "종합 분석 초안", "🧩", ("vision", "content", "vibe")),
+        ("master", "종합 분석 마스터", "🧠", ("master_core", "pedagogy", "feedback")),
+    )
 
     def _register_agents(self):
         """에이전트 레지스트리 초기화"""
-        agent_defs = [
-            ("extractor", "리소스 추출기", "📦", []),
-            ("vision", "비전 분석 에이전트", "👁️", ["extractor"]),
-            ("content", "콘텐츠 분석 에이전트", "🎨", ["extractor"]),
-            ("stt", "음성→텍스트 에이전트", "🗣️", ["extractor"]),
-            ("vibe", "음성 프로소디 에이전트", "🔊", ["extractor"]),
-            ("pedagogy", "교육학 평가 에이전트", "📚", ["vision", "content", "stt", "vibe"]),
-            ("feedback", "피드백 생성 에이전트", "💡", ["pedagogy"]),
-            ("master", "종합 분석 마스터", "🧠", ["vision", "content", "vibe", "pedagogy", "feedback"]),
-        ]
-
-        for name, role, icon, deps in agent_defs:
+        for name, role, icon, deps in self._AGENT_DEFS:
             self.agents[name] = AgentState(
-                name=name, role=role, icon=icon, dependencies=deps
+                name=name, role=role, icon=icon, dependencies=list(deps)
             )
 
+    def close(self):
+        """워커 풀 종료 (실행 중인 작업과 대기 중인 DB 저장은 완료까지 대기)"""
+        self._pool.shutdown(wait=True)
+        self.flush_db()
+
+    def flush_db(self):
+        """이 오케스트레이터가 예약한 DB 저장이 모두 끝날 때까지 대기"""
+        futures, self._db_futures = self._db_futures, []
+        wait(futures)
+
+    def __enter__(self) -> "AgentOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # v7.2: 해석된 구성 요소 (클래스 수준 — 오케스트레이터 인스턴스 간 공유)
+    _COMPONENTS: Dict[str, Any] = {}
+    _COMPONENTS_LOADED = False  # 일괄 로드는 프로세스당 한 번만 시도
+    _COMPONENTS_LOCK = threading.Lock()
+
+    # v7.2: JPEG 디코딩 전용 풀 — 파이프라인 풀과 분리 (DAG 작업이 디코딩 작업을 기다리며 교착되지 않도록)
+    _DECODE_POOL: Optional[ThreadPoolExecutor] = None
+    _DECODE_POOL_LOCK = threading.Lock()
+
+    @classmethod
+    def _get_decode_pool(cls) -> ThreadPoolExecutor:
+        """JPEG 디코딩 풀 (지연 생성, 종료하지 않고 재사용)"""
+        if cls._DECODE_POOL is None:
+            with cls._DECODE_POOL_LOCK:
+                if cls._DECODE_POOL is None:
+                    cls._DECODE_POOL = ThreadPoolExecutor(max_workers=_DECODE_WORKERS,
+                                                          thread_name_prefix="frame-decode")
+        return cls._DECODE_POOL
+
+    @classmethod
+    def _load_components(cls):
+        """구성 요소를 프로세스당 한 번 일괄 로드
+
+        실패한 항목은 비워 두고 다시 시도하지 않음 — 재시도는 해당 단계 실행 시 _component()가 담당
+        (오케스트레이터를 만들 때마다 실패하는 무거운 import를 반복하지 않도록).
+        """
+        if cls._COMPONENTS_LOADED:
+            return
+        with cls._COMPONENTS_LOCK:
+            if cls._COMPONENTS_LOADED:
+                return
+            for key, (module_name, file_path, attr) in _COMPONENT_SPECS.items():
+                if key not in cls._COMPONENTS:
+                    try:
+                        cls._COMPONENTS[key] = getattr(_load_module(module_name, file_path), attr)
+                    except Exception:
+                        pass
+            cls._COMPONENTS_LOADED = True
+
+    @classmethod
+    def _component(cls, key: str):
+        """캐시된 구성 요소 (없으면 로드 — 실패 시 예외는 호출한 에이전트의 오류로 기록됨)"""
+        comp = cls._COMPONENTS.get(key)
+        if comp is None:
+            module_name, file_path, attr = _COMPONENT_SPECS[key]
+            comp = cls._COMPONENTS[key] = getattr(_load_module(module_name, file_path), attr)
+        return comp
+
+    def _agent(self, key: str):
+        """v7.2: 파이프라인 간 재사용하는 에이전트 인스턴스 (모델·설정 로드는 첫 실행에서만)
+
+        결과를 누적하는 에이전트(reset() 보유)는 재사용 전에 초기화합니다.
+        """
+        agent = self._agent_instances.get(key)
+        if agent is None:
+            agent = self._agent_instances[key] = self._component(key)()
+        elif hasattr(agent, "reset"):
+            agent.reset()
+        return agent
+
     def on_event(self, callback: Callable):
         """이벤트 콜백 등록"""
         self._callbacks.append(callback)
@@ -202,19 +492,48 @@ class AgentOrchestrator:
             "timestamp": datetime.now().isoformat(),
             "data": data or {},
         }
-        with self._lock:
-            self.event_log.append(event)
-        for cb in self._callbacks:
+        self.event_log.append(event)
+        if not self._callbacks:
+            return
+        if self._dispatcher is not None:
+            self._event_q.put_nowait(event)
+        else:
+            self._dispatch(event)
+
+    _STOP = object()
+
+    def _dispatch(self, event: Dict):
+        for cb in tuple(self._callbacks):
             try:
                 cb(event)
             except Exception:
                 pass
 
-    def _run_agent(self, name: str, fn: Callable, *args, **kwargs) -> Any:
-        """단일 에이전트 실행 및 상태 관리"""
+    def _dispatch_loop(self):
+        while True:
+            event = self._event_q.get()
+            if event is self._STOP:
+                return
+            self._dispatch(event)
+
+    def _start_dispatcher(self):
+        """v7.2: 파이프라인 실행 동안 이벤트 디스패처 스레드 시작"""
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="agent-events", daemon=True)
+            self._dispatcher.start()
+
+    def _stop_dispatcher(self):
+        """남은 이벤트를 모두 전달한 뒤 디스패처 종료 (run_pipeline 반환 전 콜백 완료 보장)"""
+        thread, self._dispatcher = self._dispatcher, None
+        if thread is not None:
+            self._event_q.put(self._STOP)
+            thread.join()
+
+    def _run_agent(self, name: str, fn: Callable[..., Dict], *args, **kwargs) -> Any:
+        """단일 에이전트 실행 및 상태 관리 (v7.2: fn은 모두 _phase_* 메서드로 Dict를 반환)"""
         agent = self.agents[name]
         agent.status = AgentStatus.RUNNING
-        agent.start_time = time.time()
+        agent.start_time = time.monotonic()
         agent.progress = 0
         self._emit("agent_start", name)
 
@@ -222,15 +541,19 @@ class AgentOrchestrator:
             result = fn(*args, **kwargs)
             agent.status = AgentStatus.DONE
             agent.progress = 100
-            agent.result = result if isinstance(result, dict) else {"data": result}
-            agent.end_time = time.time()
+            agent.result = result
+            agent.end_time = time.monotonic()
             self._emit("agent_done", name, {"elapsed": agent.elapsed_seconds})
             return result
         except Exception as e:
             agent.status = AgentStatus.ERROR
             agent.error = str(e)
-            agent.end_time = time.time()
-            self._emit("agent_error", name, {"error": str(e), "traceback": traceback.format_exc()})
+            agent.end_time = time.monotonic()
+            if self._debug_tracebacks:
+                tb = traceback.format_exc()
+            else:
+                tb = "".join(traceback.format_exception_only(type(e), e)).strip()
+            self._emit("agent_error", name, {"error": str(e), "traceback": tb})
             return None
 
     def run_pipeline(self, video_path: str, temp_dir: str = None) -> Dict:
@@ -244,43 +567,31 @@ class AgentOrchestrator:
         Returns:
             종합 분석 리포트 딕셔너리
         """
-        import uuid
+        self._start_dispatcher()
+        try:
+            return self._run_pipeline(video_path, temp_dir)
+        finally:
+            self._stop_dispatcher()
+
+    def _run_pipeline(self, video_path: str, temp_dir: str = None) -> Dict:
         self.pipeline_id = str(uuid.uuid4())[:8]
-        self.pipeline_start = time.time()
+        self.pipeline_start = time.monotonic()
         self.context = SharedContext(video_path=video_path, temp_dir=temp_dir or "")
 
         self._emit("pipeline_start", "orchestrator", {"video": video_path})
 
-        # Phase 1: 리소스 추출 (순차)
-        self._run_agent("extractor", self._phase_extract, video_path, temp_dir)
-
-        # Phase 2: 진짜 병렬 실행 (v5.0) — Vision + Content + STT + Vibe
-        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent") as pool:
-            futures = {
-                pool.submit(self._run_agent, "vision", self._phase_vision): "vision",
-                pool.submit(self._run_agent, "content", self._phase_content): "content",
-                pool.submit(self._run_agent, "stt", self._phase_stt): "stt",
-                pool.submit(self._run_agent, "vibe", self._phase_vibe): "vibe",
-            }
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    self._emit("agent_error", name, {"error": str(e)})
-
-        # Phase 3: 교육학 평가
-        self._run_agent("pedagogy", self._phase_pedagogy)
+        # v7.2: 고정 단계(barrier) 대신 AgentState.dependencies 기반 DAG 실행 —
+        # 의존 에이전트가 끝나는 즉시 다음 에이전트 시작
+        # EXTRACT -> [VISION+CONTENT | STT | VIBE] -> [MASTER_CORE | PEDAGOGY -> FEEDBACK] -> SYNTHESIZE
+        tasks = self._pipeline_tasks(video_path, temp_dir)
+        results = self._run_dag(tasks, self._task_dependencies(tasks))
+        result = results.get("master")
 
-        # Phase 4: 피드백 생성
-        self._run_agent("feedback", self._phase_feedback)
-
-        # Phase 5: 종합 분석
-        result = self._run_agent("master", self._phase_synthesize)
-
-        self.pipeline_end = time.time()
+        self.pipeline_end = time.monotonic()
         total_elapsed = round(self.pipeline_end - self.pipeline_start, 2)
         self._emit("pipeline_done", "orchestrator", {"total_elapsed": total_elapsed})
+        critical = self._critical_path()
+        self._emit("critical_path", "orchestrator", critical)
 
         # v7.0: Extract confidence & profile from pedagogy result
         pedagogy = self.context.pedagogy_result or {}
@@ -288,7 +599,9 @@ class AgentOrchestrator:
         profile = pedagogy.get("profile_summary", {})
 
         # v7.0: Auto-save to DB if available
-        self._try_save_to_db(video_path, result, total_elapsed)
+        # v7.2: 백그라운드 저장 — pipeline_id/교육학 결과는 reset·다음 실행 전에 미리 고정
+        self._db_futures = [f for f in self._db_futures if not f.done()]
+        self._db_futures.append(self._try_save_to_db(video_path, result, total_elapsed))
 
         return {
             "pipeline_id": self.pipeline_id,
@@ -299,23 +612,132 @@ class AgentOrchestrator:
             "confidence": confidence,
             "profile_summary": profile,
             "event_count": len(self.event_log),
+            **critical,
+        }
+
+    # =================================================================
+    # v7.2: 의존성 기반 DAG 스케줄러
+    # =================================================================
+
+    # 비임계 에이전트가 임계 경로 시간의 이 비율을 넘으면 재배치 후보로 표시
+    _NEAR_CRITICAL_RATIO = 0.8
+
+    def _critical_path(self) -> Dict:
+        """에이전트 의존성 DAG의 최장(임계) 경로 — 파이프라인 벽시계 시간의 하한
+
+        Returns:
+            critical_path: 임계 경로 에이전트 이름 (실행 순),
+            critical_path_seconds: 경로상 에이전트 소요 시간 합,
+            near_critical: 임계 경로 밖이지만 그 시간의 80%를 넘는 에이전트
+        """
+        deps = {name: set(a.dependencies) & self.agents.keys() for name, a in self.agents.items()}
+        finish: Dict[str, float] = {}
+        prev: Dict[str, Optional[str]] = {}
+        for name in self._topological_order(deps):
+            before = max(deps[name], key=finish.__getitem__, default=None)
+            prev[name] = before
+            finish[name] = self.agents[name].elapsed_seconds + (finish[before] if before else 0.0)
+
+        if not finish:
+            return {"critical_path": [], "critical_path_seconds": 0.0, "near_critical": []}
+        node = max(finish, key=finish.__getitem__)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = prev[node]
+        path.reverse()
+
+        total = round(finish[path[-1]], 2)
+        on_path = set(path)
+        near = [
+            name for name, a in self.agents.items()
+            if name not in on_path and total > 0 and a.elapsed_seconds > total * self._NEAR_CRITICAL_RATIO
+        ]
+        return {"critical_path": path, "critical_path_seconds": total, "near_critical": near}
+
+    def _pipeline_tasks(self, video_path: str, temp_dir: str = None) -> Dict[str, Tuple[Tuple[str, ...], Callable]]:
+        """DAG 작업 단위: 작업 이름 → (담당 에이전트들, 실행 함수)
+
+        vision/content는 프레임 디코딩을 공유하므로 하나의 작업(_phase_visual_fused)으로 묶음.
+        """
+        return {
+            "extractor": (("extractor",), lambda: self._run_agent("extractor", self._phase_extract, video_path, temp_dir)),
+            "visual": (("vision", "content"), self._phase_visual_fused),
+            "stt": (("stt",), lambda: self._run_agent("stt", self._phase_stt)),
+            "vibe": (("vibe",), lambda: self._run_agent("vibe", self._phase_vibe)),
+            "pedagogy": (("pedagogy",), lambda: self._run_agent("pedagogy", self._phase_pedagogy)),
+            "feedback": (("feedback",), lambda: self._run_agent("feedback", self._phase_feedback)),
+            "master_core": (("master_core",), lambda: self._run_agent("master_core", self._phase_master_core)),
+            "master": (("master",), lambda: self._run_agent("master", self._phase_synthesize)),
         }
 
+    def _task_dependencies(self, tasks: Dict[str, Tuple[Tuple[str, ...], Callable]]) -> Dict[str, Set[str]]:
+        """에이전트 의존성(AgentState.dependencies)을 작업 간 의존성으로 변환"""
+        owner = {agent: task for task, (agents, _) in tasks.items() for agent in agents}
+        return {
+            task: {owner[dep] for agent in agents for dep in self.agents[agent].dependencies} - {task}
+            for task, (agents, _) in tasks.items()
+        }
+
+    @staticmethod
+    def _topological_order(deps: Dict[str, Set[str]]) -> List[str]:
+        """Kahn 위상 정렬 (순환 의존이면 ValueError)"""
+        remaining = {task: set(d) for task, d in deps.items()}
+        ready = [task for task, d in remaining.items() if not d]
+        order = []
+        while ready:
+            task = ready.pop(0)
+            order.append(task)
+            for other, d in remaining.items():
+                if task in d:
+                    d.discard(task)
+                    if not d:
+                        ready.append(other)
+        if len(order) != len(deps):
+            raise ValueError(f"에이전트 의존성에 순환이 있습니다: {sorted(set(deps) - set(order))}")
+        return order
+
+    def _run_dag(self, tasks: Dict[str, Tuple[Tuple[str, ...], Callable]],
+                 deps: Dict[str, Set[str]]) -> Dict[str, Any]:
+        """의존 작업이 모두 끝난 작업을 즉시 제출 (실패한 작업도 '끝남'으로 간주 — 기존 단계별 실행과 동일)"""
+        pending = self._topological_order(deps)
+        finished: Set[str] = set()
+        results: Dict[str, Any] = {}
+        running = {}
+
+        while pending or running:
+            for task in [t for t in pending if deps[t] <= finished]:
+                pending.remove(task)
+                running[self._pool.submit(tasks[task][1])] = task
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                try:
+                    results[task] = future.result()
+                except Exception as e:
+                    results[task] = None
+                    self._emit("agent_error", task, {"error": str(e)})
+                finished.add(task)
+
+        return results
+
     # =================================================================
     # 파이프라인 단계별 실행 함수
     # =================================================================
 
     def _phase_extract(self, video_path: str, temp_dir: str = None) -> Dict:
         """Phase 1: FFmpeg 기반 리소스 추출"""
-        tl_mod = _load_module("timelapse_analyzer", _CORE_DIR / "analyzers" / "timelapse_analyzer.py")
-        flash_extract_resources = tl_mod.flash_extract_resources
-        import tempfile
+        flash_extract_resources = self._component("extract")
 
         if not temp_dir:
             temp_dir = tempfile.mkdtemp(prefix="gaim_agent_")
 
         self.context.temp_dir = temp_dir
-        resources = flash_extract_resources(video_path, temp_dir)
+        # v7.2: 영상을 직접 열 수 있으면 ffmpeg는 오디오만 추출하고 프레임은 분석 시 메모리에서 디코딩
+        in_memory = _FRAME_SOURCE == "video" and self._video_readable(video_path)
+        self.context.frame_source = "video" if in_memory else "jpeg"
+        resources = flash_extract_resources(video_path, temp_dir, extract_frames=not in_memory)
 
         # 추출된 프레임 목록 (flash_extract_resources는 temp_dir 루트에 저장)
         temp_path = Path(temp_dir)
@@ -326,6 +748,7 @@ class AgentOrchestrator:
             if frames_dir.exists():
                 frames = sorted(frames_dir.glob("*.jpg"))
         self.context.extracted_frames = [str(f) for f in frames]
+        self.context.frame_entries = [(str(f), self._path_to_timestamp(f)) for f in frames]
 
         # 오디오 파일 경로
         audio_file = Path(temp_dir) / "audio.wav"
@@ -334,45 +757,87 @@ class AgentOrchestrator:
 
         return {
             "frames_count": len(self.context.extracted_frames),
+            "frame_source": self.context.frame_source,
             "audio_extracted": bool(self.context.audio_path),
             "temp_dir": temp_dir,
         }
 
-    def _phase_vision(self) -> Dict:
-        """Phase 2a: 비전 분석"""
-        va_mod = _load_module("vision_agent", _AGENTS_DIR / "vision_agent.py")
-        VisionAgent = va_mod.VisionAgent
-        import cv2
-
-        agent = VisionAgent()
-        for frame_path in self.context.extracted_frames:
-            frame = cv2.imread(frame_path)
+    @staticmethod
+    def _video_readable(video_path: str) -> bool:
+        """OpenCV로 영상을 열고 첫 프레임을 읽을 수 있는지 확인"""
+        cap = cv2.VideoCapture(video_path)
+        try:
+            return cap.isOpened() and cap.grab()
+        finally:
+            cap.release()
+
+    def _iter_frames(self):
+        """분석용 (frame, timestamp)를 순서대로 디코딩 (v7.2: 영상 직접 디코딩 또는 JPEG)"""
+        if self.context.frame_source == "video":
+            yield from self._component("video_frames")(self.context.video_path)
+            return
+        # JPEG: 최대 2×워커 수만큼 앞서 병렬 디코딩하고 순서대로 내보냄 (선행 디코딩 프레임 수 상한)
+        pool = self._get_decode_pool()
+        window = 2 * _DECODE_WORKERS
+        pending: deque = deque()
+        for frame_path, timestamp in self._frame_entries():
+            pending.append((pool.submit(cv2.imread, frame_path), timestamp))
+            if len(pending) < window:
+                continue
+            future, ts = pending.popleft()
+            frame = future.result()
             if frame is not None:
-                timestamp = self._path_to_timestamp(frame_path)
-                agent.analyze_frame(frame, timestamp)
+                yield frame, ts
+        while pending:
+            future, ts = pending.popleft()
+            frame = future.result()
+            if frame is not None:
+                yield frame, ts
+
+    def _phase_visual_fused(self) -> Dict:
+        """Phase 2a+2b (v7.2): 프레임을 한 번만 읽어 Vision/Content 에이전트가 함께 소비
+
+        JPEG 디코딩/디스크 읽기를 에이전트마다 반복하지 않고, 두 에이전트는 기존처럼
+        병렬로 실행되며 각자의 상태/소요 시간이 따로 기록됩니다.
+        """
+        fanout = _FrameFanout(self._iter_frames()).start()
+
+        def _consume(name: str, fn: Callable, i: int):
+            try:
+                return self._run_agent(name, fn, fanout.consumer(i))
+            finally:
+                fanout.close(i)  # 실패/조기 종료한 에이전트 때문에 디코더가 멈추지 않도록
+
+        # 콘텐츠는 공용 풀에서, 비전은 현재 작업 스레드에서 실행
+        content = self._pool.submit(_consume, "content", self._phase_content, 1)
+        vision = _consume("vision", self._phase_vision, 0)
+        return {"vision": vision, "content": content.result()}
+
+    def _phase_vision(self, frames=None) -> Dict:
+        """Phase 2a: 비전 분석
+
+        Args:
+            frames: (frame, timestamp) 이터러블 (v7.2: 없으면 추출 프레임을 직접 디코딩)
+        """
+        agent = self._agent("vision")
+        for frame, timestamp in (self._iter_frames() if frames is None else frames):
+            agent.analyze_frame(frame, timestamp)
 
         self.context.vision_summary = agent.get_summary()
         self.context.vision_timeline = agent.get_timeline()
         return self.context.vision_summary
 
-    def _phase_content(self) -> Dict:
-        """Phase 2b: 콘텐츠 분석 (v7.1: batch SSIM dedup + parallel OCR)"""
-        ca_mod = _load_module("content_agent", _AGENTS_DIR / "content_agent.py")
-        ContentAgent = ca_mod.ContentAgent
-        import cv2
+    def _phase_content(self, frames=None) -> Dict:
+        """Phase 2b: 콘텐츠 분석 (v7.2: streaming perceptual-hash dedup + parallel OCR)
 
-        agent = ContentAgent()
-
-        # v7.1: Load all frames first, then batch-analyze
-        frames_with_ts = []
-        for frame_path in self.context.extracted_frames:
-            frame = cv2.imread(frame_path)
-            if frame is not None:
-                timestamp = self._path_to_timestamp(frame_path)
-                frames_with_ts.append((frame, timestamp))
+        Args:
+            frames: (frame, timestamp) 이터러블 (v7.2: 없으면 추출 프레임을 직접 디코딩)
+        """
+        agent = self._agent("content")
 
-        if frames_with_ts:
-            agent.analyze_frames_batch(frames_with_ts)
+        # v7.2: 전체 프레임을 리스트로 올리지 않고 스트리밍 분석 (메모리 상한 고정)
+        for _ in agent.analyze_frames_stream(self._iter_frames() if frames is None else frames):
+            pass
 
         self.context.content_summary = agent.get_summary()
         self.context.content_timeline = agent.get_timeline()
@@ -380,10 +845,7 @@ class AgentOrchestrator:
 
     def _phase_stt(self) -> Dict:
         """Phase 2c: 음성→텍스트 변환"""
-        stt_mod = _load_module("stt_agent", _AGENTS_DIR / "stt_agent.py")
-        STTAgent = stt_mod.STTAgent
-
-        agent = STTAgent()
+        agent = self._agent("stt")
         if self.context.audio_path:
             result = agent.analyze(self.context.audio_path)
         else:
@@ -393,14 +855,12 @@ class AgentOrchestrator:
 
     def _phase_vibe(self) -> Dict:
         """Phase 2d: 음성 프로소디 분석"""
-        vb_mod = _load_module("vibe_agent", _AGENTS_DIR / "vibe_agent.py")
-        VibeAgent = vb_mod.VibeAgent
-
-        agent = VibeAgent()
+        agent = self._agent("vibe")
         if self.context.audio_path:
             agent.analyze_full(Path(self.context.audio_path))
             self.context.vibe_summary = agent.get_summary()
             self.context.vibe_timeline = agent.get_timeline()
+            agent.reset()  # v7.2: 재사용 인스턴스가 다음 실행까지 오디오 버퍼를 붙잡지 않도록
         return self.context.vibe_summary
 
     def _phase_pedagogy(self) -> Dict:
@@ -408,10 +868,7 @@ class AgentOrchestrator:
         # v5.0: 발화 분석 먼저 실행
         self._run_discourse_analysis()
 
-        pg_mod = _load_module("pedagogy_agent", _AGENTS_DIR / "pedagogy_agent.py")
-        PedagogyAgent = pg_mod.PedagogyAgent
-
-        agent = PedagogyAgent()
+        agent = self._agent("pedagogy")
         result = agent.evaluate(
             vision_summary=self.context.vision_summary,
             content_summary=self.context.content_summary,
@@ -425,10 +882,7 @@ class AgentOrchestrator:
     def _run_discourse_analysis(self):
         """v5.0: 발화 내용 교육학적 분석 (교육학 평가 전 실행)"""
         try:
-            da_mod = _load_module("discourse_analyzer", _AGENTS_DIR / "discourse_analyzer.py")
-            DiscourseAnalyzer = da_mod.DiscourseAnalyzer
-
-            analyzer = DiscourseAnalyzer()
+            analyzer = self._agent("discourse")
             stt = self.context.stt_result or {}
             transcript = stt.get("transcript", "")
             segments = stt.get("segments", [])
@@ -445,10 +899,7 @@ class AgentOrchestrator:
 
     def _phase_feedback(self) -> Dict:
         """Phase 4: 맞춤형 피드백 생성"""
-        fb_mod = _load_module("feedback_agent", _AGENTS_DIR / "feedback_agent.py")
-        FeedbackAgent = fb_mod.FeedbackAgent
-
-        agent = FeedbackAgent()
+        agent = self._agent("feedback")
         result = agent.generate(
             pedagogy_result=self.context.pedagogy_result,
             vision_summary=self.context.vision_summary,
@@ -460,12 +911,9 @@ class AgentOrchestrator:
         self.context.feedback_result = result
         return result
 
-    def _phase_synthesize(self) -> Dict:
-        """Phase 5: MasterAgent를 통한 종합 분석"""
-        ma_mod = _load_module("master_agent", _AGENTS_DIR / "master_agent.py")
-        MasterAgent = ma_mod.MasterAgent
-
-        master = MasterAgent()
+    def _phase_master_core(self) -> Dict:
+        """Phase 5a (v7.2): MasterAgent 종합 분석 — 교육학/피드백 결과와 무관하므로 먼저 실행"""
+        master = self._agent("master")
         report = master.synthesize(
             vision_summary=self.context.vision_summary,
             content_summary=self.context.content_summary,
@@ -484,6 +932,13 @@ class AgentOrchestrator:
         else:
             report_dict = {"report": str(report)}
 
+        self.context.master_draft = report_dict
+        return report_dict
+
+    def _phase_synthesize(self) -> Dict:
+        """Phase 5b: MasterAgent 결과에 교육학/피드백 결과 통합 (v7.2: 초안이 없으면 여기서 생성)"""
+        report_dict = dict(self.context.master_draft or self._phase_master_core())
+
         report_dict["pedagogy"] = self.context.pedagogy_result
         report_dict["feedback"] = self.context.feedback_result
         report_dict["stt"] = self.context.stt_result
@@ -501,17 +956,27 @@ class AgentOrchestrator:
 
     def _path_to_timestamp(self, path: str) -> float:
         """프레임 파일명에서 타임스탬프 추출"""
-        import re
-        name = Path(path).stem
-        match = re.search(r'(\d+)', name)
+        match = _TS_RE.search(Path(path).stem)
         return float(match.group(1)) if match else 0.0
 
+    def _frame_entries(self) -> List[Tuple[str, float]]:
+        """(프레임 경로, 타임스탬프) 목록 — 추출 단계에서 만든 목록이 없으면 지금 파싱"""
+        if len(self.context.frame_entries) != len(self.context.extracted_frames):
+            self.context.frame_entries = [(p, self._path_to_timestamp(p)) for p in self.context.extracted_frames]
+        return self.context.frame_entries
+
     def get_pipeline_status(self) -> Dict:
         """현재 파이프라인 상태 조회"""
-        total = len(self.agents)
-        done = sum(1 for a in self.agents.values() if a.status == AgentStatus.DONE)
-        errors = sum(1 for a in self.agents.values() if a.status == AgentStatus.ERROR)
-        running = sum(1 for a in self.agents.values() if a.status == AgentStatus.RUNNING)
+        # v7.2: 상태 집계와 직렬화를 한 번의 순회로 처리 (UI 폴링 경로)
+        counts = Counter()
+        agents = {}
+        for name, s in self.agents.items():
+            counts[s.status] += 1
+            agents[name] = s.to_dict()
+        total = len(agents)
+        done = counts[AgentStatus.DONE]
+        errors = counts[AgentStatus.ERROR]
+        running = counts[AgentStatus.RUNNING]
 
         if self.pipeline_end:
             status = "completed"
@@ -526,7 +991,7 @@ class AgentOrchestrator:
             "pipeline_id": self.pipeline_id,
             "status": status,
             "progress": int((done / total) * 100) if total > 0 else 0,
-            "agents": {name: s.to_dict() for name, s in self.agents.items()},
+            "agents": agents,
             "summary": {
                 "total": total,
                 "done": done,
@@ -534,13 +999,13 @@ class AgentOrchestrator:
                 "errors": errors,
             },
             "elapsed": round(
-                (self.pipeline_end or time.time()) - (self.pipeline_start or time.time()), 2
+                (self.pipeline_end or time.monotonic()) - (self.pipeline_start or time.monotonic()), 2
             ),
         }
 
     def get_event_log(self) -> List[Dict]:
         """이벤트 로그 반환"""
-        return self.event_log
+        return list(self.event_log)
 
     def reset(self):
         """Reset orchestrator state"""
@@ -551,24 +1016,22 @@ class AgentOrchestrator:
             agent.end_time = None
             agent.result = None
             agent.error = None
-        self.context = SharedContext()
-        self.event_log = []
+        self.context.clear()
+        self.event_log.clear()
         self.pipeline_id = None
         self.pipeline_start = None
         self.pipeline_end = None
 
-    def _try_save_to_db(self, video_path: str, result: Dict, elapsed: float):
-        """v7.0: Auto-save analysis result to SQLite DB"""
-        try:
-            # Use absolute path to avoid sys.path issues in batch context
-            db_mod = _load_module("database", _CORE_DIR / "database.py")
-            repo = db_mod.AnalysisRepository()
-            repo.save_result(
-                video_path=video_path,
-                pipeline_id=self.pipeline_id,
-                result=result or {},
-                pedagogy=self.context.pedagogy_result,
-                elapsed_seconds=elapsed,
-            )
-        except Exception:
-            pass  # DB save is optional, don't break pipeline
+    def _try_save_to_db(self, video_path: str, result: Dict, elapsed: float) -> Future:
+        """v7.0: Auto-save analysis result to SQLite DB
+
+        v7.2: 백그라운드 작성자(_DB_WRITER)에 예약만 하고 반환 — pipeline_id/교육학 결과는
+        reset·다음 실행 전에 지금 값으로 고정됩니다.
+        """
+        return _DB_WRITER.submit({
+            "video_path": video_path,
+            "pipeline_id": self.pipeline_id,
+            "result": result or {},
+            "pedagogy": self.context.pedagogy_result,
+            "elapsed_seconds": elapsed,
+        })
@@ -17,11 +17,18 @@ v7.0 이전 개선:
 
 import os
 import math
+import bisect
+import functools
 import hashlib
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+import numpy as np
+
 # YAML 로드
 try:
     import yaml
@@ -29,6 +36,13 @@ try:
 except ImportError:
     HAS_YAML = False
 
+# v8.2: Numba (선택적) — 연속 채점 시그모이드 보간 커널 JIT
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 # 기본 프레임워크 (YAML 로드 실패 시 폴백)
 DEFAULT_DIMENSIONS = {
@@ -87,13 +101,81 @@ DEFAULT_BINNING = {
     },
 }
 
+# v8.2: 구간 레이블 → 가감점 표 (차원별 if/elif 레이블 사다리를 dict 조회 한 번으로 대체)
+# 표에 없는 레이블(UNKNOWN 포함)은 0점 — 기존 사다리에서 어느 분기에도 해당하지 않던 경우와 동일
+_WPM_EXPERTISE = {"GOOD": 3.0, "MODERATE": 1.5, "SLOW": 0.0, "FAST": -1.5, "VERY_FAST": -3.0, "VERY_SLOW": -3.0}
+_WPM_METHODS = {"GOOD": 2.0, "MODERATE": 2.0, "VERY_SLOW": -2.5}
+_WPM_ATTITUDE = {"GOOD": 2.0, "MODERATE": 2.0, "VERY_SLOW": -2.0}
+_GESTURE_METHODS = {"ACTIVE": 3.5, "MODERATE": 1.5, "LOW": -0.5, "INACTIVE": -2.0}
+_GESTURE_CREATIVITY = {"ACTIVE": 0.7, "MODERATE": 0.3, "INACTIVE": -0.6}
+_FILLER_LANGUAGE = {"CLEAN": 4.0, "GOOD": 2.0, "MODERATE": 0.5, "HIGH": -2.0, "EXCESSIVE": -4.0}
+_MONOTONE_LANGUAGE = {"EXPRESSIVE": 3.0, "VARIED": 1.5, "MODERATE": 0.0, "MONOTONE": -2.0, "FLAT": -3.5}
+_MONOTONE_TIME = {"EXPRESSIVE": 1.5, "VARIED": 1.5, "MONOTONE": -1.5, "FLAT": -1.5}
+_EYE_CONTACT_ATTITUDE = {"EXCELLENT": 4.0, "GOOD": 3.0, "MODERATE": 1.0, "LOW": -1.0, "POOR": -3.0}
+# v7.0: 독강(LECTURE_ONLY) 대폭 감점
+_TEACHER_RATIO_PARTICIPATION = {"STUDENT_LED": 2.0, "BALANCED": 1.5, "TEACHER_MODERATE": 0.5,
+                                "TEACHER_DOMINANT": -1.5, "LECTURE_ONLY": -4.0}
+
+# v8.2: 차원별 피드백 문구 (우수 ≥85% / 양호 ≥70% / 보통 ≥55% / 노력 필요) — 호출마다 lambda를 만들지 않도록 표로 보관
+_GRADE_LABELS = ("우수", "양호", "보통", "노력 필요")
+_FEEDBACK: Dict[str, Tuple[str, str, str, str]] = {
+    "수업 전문성": (
+        "학습 목표가 명확하고 내용 구조화가 매우 체계적입니다.",
+        "학습 목표와 내용 구성이 전반적으로 양호합니다.",
+        "내용 전달이 보통 수준입니다. 구조화가 필요합니다.",
+        "학습 목표를 명확히 하고 내용을 체계적으로 구성하세요.",
+    ),
+    "교수학습 방법": (
+        "다양한 교수학습 방법을 매우 효과적으로 활용합니다.",
+        "교수법이 양호하며 시각자료 활용도 적절합니다.",
+        "교수법이 보통 수준입니다. 다양한 전략을 시도하세요.",
+        "다양한 교수학습 전략과 매체 활용이 필요합니다.",
+    ),
+    "판서 및 언어": (
+        "언어 표현이 명확하고 발화가 매우 깨끗합니다.",
+        "언어 사용이 양호하나 미세한 개선 여지가 있습니다.",
+        "습관어나 단조로운 어조 개선이 필요합니다.",
+        "발화 습관을 개선하고 핵심 용어를 정확히 사용하세요.",
+    ),
+    "수업 태도": (
+        "열정적인 태도와 학생과의 라포 형성이 매우 우수합니다.",
+        "전반적으로 양호한 태도이나 소통 강화가 필요합니다.",
+        "태도 전반에 개선이 필요합니다.",
+        "시선 접촉과 구체적 피드백을 통해 열정을 전달하세요.",
+    ),
+    "학생 참여": (
+        "학생 참여를 효과적으로 이끌어내며 상호작용이 활발합니다.",
+        "참여 유도가 양호하나 상호작용을 더 늘리세요.",
+        "학생 참여 유도가 부족합니다.",
+        "발문과 피드백 전략을 적극적으로 활용하세요.",
+    ),
+    "시간 배분": (
+        "시간 배분이 매우 적절하며 수업 흐름이 자연스럽습니다.",
+        "시간 배분이 양호하나 정리 단계를 확보하세요.",
+        "시간 배분에 개선이 필요합니다.",
+        "시간 배분을 사전에 계획하고 각 단계에 충실하세요.",
+    ),
+    "창의성": (
+        "창의적인 수업 설계와 전달이 돋보입니다.",
+        "창의성이 양호한 수준입니다.",
+        "창의적 요소를 더 추가하세요.",
+        "독창적인 활동과 시각적 매체를 적극 활용하세요.",
+    ),
+}
+
+# v8.2: PedagogyAgent.evaluate() 결과 캐시 항목 수 (키가 입력 문자열을 참조하므로 작게 유지)
+_EVAL_CACHE_SIZE = 64
+# v8.2: (설정 지문, 입력 지문) → (설정 객체들, 결과) — 같은 설정의 인스턴스끼리 공유
+_EVAL_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_EVAL_CACHE_LOCK = threading.Lock()
+
 DEFAULT_CONFIDENCE_WEIGHTS = {
     "vision": 0.20, "stt": 0.30, "vibe": 0.15,
     "content": 0.15, "discourse": 0.20,
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionScore:
     name: str
     score: float
@@ -106,14 +188,138 @@ class DimensionScore:
     improvement_tips: List[str] = field(default_factory=list)
 
     def to_dict(self):
-        return {k: v for k, v in self.__dict__.items()}
+        # v8.2: slots=True → __dict__ 없음, 필드 순서대로 얕은 복사
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
+# v8.2: 유효하지 않은 에이전트 요약을 대신하는 공유 빈 매핑 (읽기 전용)
+_EMPTY = MappingProxyType({})
 
-def _safe(d: Dict, key: str, default=None):
-    """에이전트 데이터에서 안전하게 값 추출 (error 딕셔너리 처리)"""
+
+def _valid(d) -> Mapping:
+    """에이전트 요약 유효성 검사 1회 — 비었거나 error 딕셔너리면 _EMPTY 반환"""
     if not d or not isinstance(d, dict) or 'error' in d:
-        return default
-    return d.get(key, default)
+        return _EMPTY
+    return d
+
+
+def _fingerprint(d) -> tuple:
+    """v8.2: evaluate() 입력 dict → 해시 가능한 정확한 키 (양자화 없음)
+
+    evaluate()는 스칼라 값과 중첩 dict만 읽고 리스트(segments, timeline 등)는 읽지 않으므로
+    리스트는 키 존재만 반영하고 내용은 제외합니다. 문자열은 해시가 캐시되어 긴 transcript도
+    재해싱하지 않습니다.
+    """
+    if not isinstance(d, dict):
+        return (d,)
+    return tuple(
+        (k, _fingerprint(v) if isinstance(v, dict) else list if isinstance(v, (list, tuple)) else v)
+        for k, v in d.items()
+    )
+
+
+def _clone(obj):
+    """JSON 형태 결과 복사 (dict/list만 재귀 복사 — copy.deepcopy보다 가벼움)
+
+    스칼라 값은 재귀 호출 없이 그대로 두어 캐시 적중 시 복사 비용을 줄입니다.
+    """
+    if type(obj) is dict:
+        return {k: (_clone(v) if type(v) is dict or type(v) is list else v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [(_clone(v) if type(v) is dict or type(v) is list else v) for v in obj]
+    return obj
+
+
+# v8.2: speaking_pattern 레이블 → 플래그 비트 (STTAgent._classify_speaking_pattern 레이블 사전 등록)
+_PAT_SLOW = 1
+_PAT_FAST = 2
+_PATTERN_FLAGS: Dict[str, int] = {
+    "느림 (Slow)": _PAT_SLOW, "빠름 (Fast)": _PAT_FAST,
+    "대화형 (Conversational)": 0, "강의형 (Lecture)": 0,
+    "Slow": _PAT_SLOW, "느림": _PAT_SLOW, "Fast": _PAT_FAST, "빠름": _PAT_FAST, "": 0,
+}
+
+
+def _pattern_flags(pat) -> int:
+    """말하기 패턴 레이블 → 플래그 (미등록 레이블은 기존 부분 문자열 규칙으로 계산 후 등록)"""
+    flags = _PATTERN_FLAGS.get(pat)
+    if flags is None:
+        flags = 0
+        if '빠름' in pat or 'Fast' in pat:
+            flags |= _PAT_FAST
+        if '느림' in pat or 'Slow' in pat:
+            flags |= _PAT_SLOW
+        if len(_PATTERN_FLAGS) < 256:
+            _PATTERN_FLAGS[pat] = flags
+    return flags
+
+
+# v8.2: evaluate() 1회당 한 번 추출하는 스칼라 입력 (기본값은 기존 차원별 조회와 동일)
+_Stats = namedtuple(
+    "_Stats",
+    "wc dur wpm fr pflags sc student_turns interaction_count teacher_ratio question_count "
+    "slide_r contrast complexity speaker_vis "
+    "gesture motion ec expr body_open "
+    "mono silence ed",
+)
+
+
+def _extract_stats(vision: Mapping, content: Mapping, vibe: Mapping, stt: Dict) -> _Stats:
+    """요약 dict들에서 차원 평가용 스칼라를 한 번에 추출 (vision/content/vibe는 _valid() 통과본)"""
+    wc = stt.get('word_count', 0)
+    dur = stt.get('duration_seconds', 600)
+    return _Stats(
+        wc=wc,
+        dur=dur,
+        wpm=(wc / dur * 60) if dur and dur > 0 else 0,
+        fr=stt.get('filler_ratio', 0.03),
+        pflags=_pattern_flags(stt.get('speaking_pattern', '')),
+        sc=stt.get('segment_count', 1),
+        student_turns=stt.get('student_turns', 0),
+        interaction_count=stt.get('interaction_count', 0),
+        teacher_ratio=stt.get('teacher_ratio', 0.75),
+        question_count=stt.get('question_count', 0),
+        slide_r=content.get('slide_detected_ratio', 0),
+        contrast=content.get('avg_color_contrast', 0),
+        complexity=content.get('avg_complexity', 0),
+        speaker_vis=content.get('speaker_visible_ratio', 0),
+        gesture=vision.get('gesture_active_ratio', 0),
+        motion=vision.get('avg_motion_score', 0),
+        ec=vision.get('eye_contact_ratio', 0),
+        expr=vision.get('avg_expression_score', 50),
+        body_open=vision.get('avg_body_openness', 0.5),
+        mono=vibe.get('monotone_ratio', 0.5),
+        silence=vibe.get('avg_silence_ratio', 0.3),
+        ed=vibe.get('energy_distribution', {}),
+    )
+
+
+def _ed_spread(ed: Dict) -> Optional[float]:
+    """에너지 분포(low/normal/high) 최대-최소 편차 — 합이 0 이하면 None
+
+    임시 리스트와 sum/max/min 호출 없이 비교만으로 계산합니다.
+    """
+    a = ed.get('low', 0)
+    b = ed.get('normal', 0)
+    c = ed.get('high', 0)
+    if a + b + c <= 0:
+        return None
+    lo = a if a < b else b
+    lo = lo if lo < c else c
+    hi = a if a > b else b
+    hi = hi if hi > c else c
+    return hi - lo
+
+
+def _score_fields(clamped: float, w: float) -> tuple:
+    """클램핑된 기본점 → (score, percentage, 등급 구간 0~3)
+
+    v8.2: 등급 구간 한 번 계산 → 등급/피드백 문구 모두 표 조회
+    """
+    score = max(0, min(w, round(clamped, 1)))
+    pct = (score / w) * 100
+    bucket = 0 if pct >= 85 else (1 if pct >= 70 else (2 if pct >= 55 else 3))
+    return score, pct, bucket
 
 
 def _bin(value: float, bins: Dict) -> str:
@@ -121,9 +327,33 @@ def _bin(value: float, bins: Dict) -> str:
     for label, (low, high) in bins.items():
         if low <= value < high:
             return label
-    # 최대값 포함 (마지막 구간)
-    last_label = list(bins.keys())[-1]
-    return last_label
+    # 최대값 포함 (마지막 구간) — v8.2: 키 리스트를 만들지 않고 역순 반복자로 마지막 레이블
+    return next(reversed(bins))
+
+
+def _bin_table(bins: Dict) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[str, ...]]]:
+    """v8.2: 이분 탐색용 (하한, 상한, 레이블) 표 — 구간이 하한 순으로 정렬·비중첩일 때만 생성"""
+    items = list(bins.items())
+    lows = tuple(low for _, (low, _) in items)
+    highs = tuple(high for _, (_, high) in items)
+    if any(highs[i] > lows[i + 1] for i in range(len(items) - 1)) or list(lows) != sorted(lows):
+        return None
+    return lows, highs, tuple(label for label, _ in items)
+
+
+def _bin_lookup(value: float, table, bins: Dict) -> str:
+    """v8.2: _bin과 동일한 결과를 O(log N)으로 (표가 없으면 _bin으로 위임)
+
+    표는 정렬·비중첩 구간에서만 만들어지므로, 이분 탐색으로 찾은 구간에 없으면 (범위 밖/빈틈/NaN)
+    어느 구간에도 속하지 않음 → _bin과 같이 마지막 레이블을 반환합니다.
+    """
+    if table is None:
+        return _bin(value, bins)
+    lows, highs, labels = table
+    i = bisect.bisect_right(lows, value) - 1
+    if i >= 0 and value < highs[i]:
+        return labels[i]
+    return labels[-1]
 
 
 def _sigmoid_map(value: float, bins: Dict, scores: Dict, steepness: float = 10.0) -> float:
@@ -161,34 +391,96 @@ def _sigmoid_map(value: float, bins: Dict, scores: Dict, steepness: float = 10.0
     if len(labels) < 2:
         return scores.get(labels[0], 0.0) if labels else 0.0
     
-    # 각 구간의 중심점과 점수를 구하기
-    centers = []
-    for label in labels:
-        low, high = bins[label]
-        center = (low + high) / 2
-        centers.append((center, scores.get(label, 0.0)))
-    
-    # 가중 시그모이드 보간
+    return _sigmoid_interp(value, _sigmoid_table(bins, scores), steepness)
+
+
+# math.exp 인자가 이 값을 넘으면 OverflowError — 가중치는 사실상 0
+_EXP_MAX = 709.0
+
+
+def _sigmoid_table(bins: Dict, scores: Dict) -> Tuple[Tuple[float, float], ...]:
+    """v8.2: (구간 중심점, 점수) 표 — 구간 정의가 바뀌지 않으면 재사용 가능"""
+    return tuple(((low + high) / 2, scores.get(label, 0.0)) for label, (low, high) in bins.items())
+
+
+def _sigmoid_interp(value: float, table: Tuple[Tuple[float, float], ...], steepness: float) -> float:
+    """v8.2: 미리 계산한 중심점 표로 가중 시그모이드 보간"""
     total_weight = 0.0
     weighted_score = 0.0
+    offset = steepness * 0.1
     
-    for center, score in centers:
-        # 각 구간 중심으로부터의 거리 기반 가중치
-        # 시그모이드 형태로 부드러운 전환
-        dist = abs(value - center)
-        # 구간 폭의 역수를 scale로 사용
-        weight = 1.0 / (1.0 + math.exp(steepness * dist - steepness * 0.1))
+    for center, score in table:
+        # 각 구간 중심으로부터의 거리 기반 가중치 (시그모이드 형태로 부드러운 전환)
+        x = steepness * abs(value - center) - offset
+        weight = 1.0 / (1.0 + math.exp(x)) if x < _EXP_MAX else 0.0
         total_weight += weight
         weighted_score += weight * score
     
     if total_weight == 0:
         # fallback: 가장 가까운 구간의 점수
-        closest = min(centers, key=lambda c: abs(value - c[0]))
-        return closest[1]
+        return min(table, key=lambda c: abs(value - c[0]))[1]
     
     return weighted_score / total_weight
 
 
+def _sigmoid_interp_core(value: float, centers: np.ndarray, scores: np.ndarray,
+                        steepness: float) -> float:
+    """v8.2: _sigmoid_interp의 배열 버전 — Numba가 있으면 네이티브 코드로 컴파일
+
+    fastmath는 사용하지 않음 (연산 순서가 바뀌면 결정론적 출력이 깨질 수 있음).
+    """
+    total_weight = 0.0
+    weighted_score = 0.0
+    offset = steepness * 0.1
+    for i in range(centers.shape[0]):
+        x = steepness * abs(value - centers[i]) - offset
+        weight = 1.0 / (1.0 + math.exp(x)) if x < _EXP_MAX else 0.0
+        total_weight += weight
+        weighted_score += weight * scores[i]
+    if total_weight == 0.0:
+        # fallback: 가장 가까운 구간의 점수 (동률이면 앞 구간 — min()과 동일)
+        return scores[np.argmin(np.abs(value - centers))]
+    return weighted_score / total_weight
+
+
+if HAS_NUMBA:
+    # cache=True(디스크 캐시)는 사용하지 않음 — 오케스트레이터는 이 파일을 'pedagogy_agent'로,
+    # 서버/테스트는 'core.agents.pedagogy_agent'로 로드하므로 다른 이름으로 쓰인 캐시를 읽다 import 오류가 남
+    # 시그니처 없는 njit는 첫 호출 시 컴파일 — 연속 채점을 쓰지 않는 프로세스는 import 시 컴파일 비용 없음
+    _sigmoid_interp_core = numba.njit(_sigmoid_interp_core)
+
+
+def _sigmoid_map_batch(xs, bins: Dict, scores: Dict, steepness: float = 10.0) -> np.ndarray:
+    """v8.2: 여러 입력값(타임라인 전체 등)에 대한 _sigmoid_map을 한 번의 벡터 연산으로 계산
+    
+    xs[:, None] - centers[None, :]로 브로드캐스트해 np.exp를 한 번만 호출합니다.
+    결과는 원소별 _sigmoid_map(x, bins, scores, steepness)와 같습니다.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    labels = list(bins.keys())
+    
+    if len(labels) < 2:
+        return np.full(xs.shape, scores.get(labels[0], 0.0) if labels else 0.0)
+    
+    table = _sigmoid_table(bins, scores)
+    return _sigmoid_batch_core(xs, np.array([c for c, _ in table]), np.array([v for _, v in table]), steepness)
+
+
+def _sigmoid_batch_core(xs: np.ndarray, centers: np.ndarray, values: np.ndarray, steepness: float) -> np.ndarray:
+    """v8.2: 미리 만든 중심점/점수 배열로 일괄 가중 시그모이드 보간 (ufunc 한 번)"""
+    dist = np.abs(xs[..., None] - centers)
+    # 중심에서 먼 구간은 exp가 inf로 넘쳐 가중치 0 (스칼라 버전의 _EXP_MAX 처리와 동일)
+    with np.errstate(over="ignore"):
+        weights = 1.0 / (1.0 + np.exp(steepness * dist - steepness * 0.1))
+    total_weight = weights.sum(axis=-1)
+    
+    # fallback: 모든 가중치가 0이면 가장 가까운 구간의 점수
+    nearest = values[np.argmin(dist, axis=-1)]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = (weights @ values) / total_weight
+    return np.where(total_weight == 0, nearest, result)
+
+
 def _deterministic_hash(*args) -> float:
     """v8.0: 결정론적 해시 — 동일 입력에서 항상 동일한 0~1 값 반환
     
@@ -200,6 +492,59 @@ def _deterministic_hash(*args) -> float:
     return int(h[:8], 16) / 0xFFFFFFFF  # 0~1
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_steepness(raw: str) -> float:
+    """GAIM_SIGMOID_STEEPNESS 문자열 → float (v8.2: 같은 값은 한 번만 파싱)"""
+    return float(raw)
+
+
+def _freeze(obj):
+    """dict → MappingProxyType, list → tuple로 재귀 변환 (공유 설정을 읽기 전용으로)"""
+    if isinstance(obj, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _load_rubric_config():
+    """rubric_config.yaml 로드 (실패 시 기본값) — 프로세스당 1회
+
+    모든 PedagogyAgent가 같은 객체를 공유하므로 읽기 전용으로 고정해 반환합니다.
+    한 인스턴스의 변경이 다른 인스턴스나 id 기반 캐시(_dim_cache, _EVAL_CACHE)로 새지 않습니다.
+    """
+    config_path = Path(__file__).resolve().parent.parent.parent / "config" / "rubric_config.yaml"
+
+    if HAS_YAML and config_path.exists():
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                cfg = yaml.safe_load(f)
+
+            dims = {}
+            for name, d in cfg.get("dimensions", {}).items():
+                # YAML의 underscore 이름을 space로 변환
+                display_name = name.replace("_", " ")
+                dims[display_name] = {"weight": d["weight"], "theory": d["theory"]}
+
+            presets = {}
+            for pname, pvals in cfg.get("presets", {}).items():
+                preset_data = {}
+                for dname, dvals in pvals.items():
+                    display_name = dname.replace("_", " ")
+                    preset_data[display_name] = dvals
+                presets[pname] = preset_data
+
+            grading = cfg.get("grading", DEFAULT_GRADING)
+            binning = cfg.get("binning", DEFAULT_BINNING)
+            conf_weights = cfg.get("confidence_weights", DEFAULT_CONFIDENCE_WEIGHTS)
+            return _freeze((dims, presets, grading, binning, conf_weights))
+        except Exception as e:
+            print(f"[PedagogyAgent] YAML 설정 로드 실패: {e}")
+
+    return _freeze((DEFAULT_DIMENSIONS, DEFAULT_PRESETS, DEFAULT_GRADING, DEFAULT_BINNING, DEFAULT_CONFIDENCE_WEIGHTS))
+
+
 class PedagogyAgent:
     """📚 교육학 이론 기반 7차원 평가 에이전트 (v8.0 — 연속 함수 채점)"""
 
@@ -215,50 +560,36 @@ class PedagogyAgent:
         self.continuous_scoring = continuous_scoring
         self._rag_kb = None
         # v8.1: steepness 환경변수 설정 가능 (기본값 10.0 유지)
-        self.steepness = float(os.getenv("GAIM_SIGMOID_STEEPNESS", "10.0"))
+        self.steepness = _parse_steepness(os.getenv("GAIM_SIGMOID_STEEPNESS", "10.0"))
 
         # YAML 설정 로드
         self.dimensions, self.presets, self.grading, self.binning, self.confidence_weights = self._load_config()
         self.current_preset = self.presets.get(preset, self.presets.get("default", {}))
+        # v8.2: (metric, 구간별 점수) → (bins, 중심점 표) 캐시 — bins 객체가 바뀌면 재계산
+        self._sigmoid_cache: Dict[tuple, tuple] = {}
+        # v8.2: metric → (bins, 이분 탐색 표) 캐시
+        self._bin_cache: Dict[str, tuple] = {}
+        # v8.2: 차원 이름 → 가중치/이론/클램핑 범위 캐시 (_dim_params)
+        self._dim_cache: Dict[str, tuple] = {}
+        # v8.2: (grading, 오름차순 기준점, 등급) — _grade 이분 탐색 표
+        self._grade_table: Optional[tuple] = None
 
     def _load_config(self):
-        """rubric_config.yaml 로드 (실패 시 기본값)"""
-        config_path = Path(__file__).resolve().parent.parent.parent / "config" / "rubric_config.yaml"
+        """rubric_config.yaml 로드 (실패 시 기본값)
 
-        if HAS_YAML and config_path.exists():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    cfg = yaml.safe_load(f)
-
-                dims = {}
-                for name, d in cfg.get("dimensions", {}).items():
-                    # YAML의 underscore 이름을 space로 변환
-                    display_name = name.replace("_", " ")
-                    dims[display_name] = {"weight": d["weight"], "theory": d["theory"]}
-
-                presets = {}
-                for pname, pvals in cfg.get("presets", {}).items():
-                    preset_data = {}
-                    for dname, dvals in pvals.items():
-                        display_name = dname.replace("_", " ")
-                        preset_data[display_name] = dvals
-                    presets[pname] = preset_data
-
-                grading = cfg.get("grading", DEFAULT_GRADING)
-                binning = cfg.get("binning", DEFAULT_BINNING)
-                conf_weights = cfg.get("confidence_weights", DEFAULT_CONFIDENCE_WEIGHTS)
-                return dims, presets, grading, binning, conf_weights
-            except Exception as e:
-                print(f"[PedagogyAgent] YAML 설정 로드 실패: {e}")
-
-        return DEFAULT_DIMENSIONS, DEFAULT_PRESETS, DEFAULT_GRADING, DEFAULT_BINNING, DEFAULT_CONFIDENCE_WEIGHTS
+        v8.2: 프로세스당 한 번만 읽고 모든 인스턴스가 같은 (읽기 전용) 객체를 공유합니다.
+        """
+        return _load_rubric_config()
 
     def _bin_metric(self, metric_name: str, value: float) -> str:
         """v7.0: 메트릭을 구간 레이블로 변환"""
         bins = self.binning.get(metric_name)
         if not bins:
             return "UNKNOWN"
-        return _bin(value, bins)
+        cached = self._bin_cache.get(metric_name)
+        if cached is None or cached[0] is not bins:
+            cached = self._bin_cache[metric_name] = (bins, _bin_table(bins))
+        return _bin_lookup(value, cached[1], bins)
 
     def _continuous_score(self, metric_name: str, value: float, label_scores: Dict[str, float]) -> float:
         """v8.0: 시그모이드 연속 매핑으로 점수 반환
@@ -279,7 +610,24 @@ class PedagogyAgent:
         bins = self.binning.get(metric_name)
         if not bins:
             return 0.0
-        return _sigmoid_map(value, bins, label_scores, self.steepness)
+        if len(bins) < 2:
+            return _sigmoid_map(value, bins, label_scores, self.steepness)
+        cached = self._sigmoid_entry(metric_name, bins, label_scores)
+        if HAS_NUMBA:
+            return float(_sigmoid_interp_core(float(value), cached[2], cached[3], self.steepness))
+        return _sigmoid_interp(value, cached[1], self.steepness)
+
+    def _sigmoid_entry(self, metric_name: str, bins: Dict, label_scores: Dict[str, float]) -> tuple:
+        """v8.2: (bins, 중심점 표, 중심점 배열, 점수 배열) — bins 객체가 바뀌면 재계산"""
+        key = (metric_name, tuple(label_scores.items()))
+        cached = self._sigmoid_cache.get(key)
+        if cached is None or cached[0] is not bins:
+            table = _sigmoid_table(bins, label_scores)
+            cached = self._sigmoid_cache[key] = (
+                bins, table,
+                np.array([c for c, _ in table]), np.array([v for _, v in table]),
+            )
+        return cached
 
     def _compute_confidence(self, vis_ok, con_ok, stt_ok, vib_ok, disc_ok) -> Dict:
         """v7.0: 입력 데이터 품질에 따른 신뢰도 계산"""
@@ -321,7 +669,64 @@ class PedagogyAgent:
             vibe_summary: VibeAgent 분석 결과
             stt_result: STTAgent 분석 결과
             discourse_result: DiscourseAnalyzer 분석 결과 (v5.0+)
+
+        v8.2: 같은 설정·같은 입력이면 캐시된 결과의 사본을 반환합니다 (결정론적 채점이므로 결과 동일).
+        캐시는 모듈 수준이라 설정이 같은 PedagogyAgent 인스턴스끼리 공유됩니다.
+        """
+        config = self._task_config()
+        key = (tuple(map(id, config)), self.preset, self.use_rag, self.continuous_scoring, self.steepness,
+               tuple(_fingerprint(d) for d in (vision_summary, content_summary, vibe_summary,
+                                               stt_result, discourse_result)))
+        with _EVAL_CACHE_LOCK:
+            try:
+                cached = _EVAL_CACHE.get(key)
+            except TypeError:
+                # 입력에 해시 불가 값(np.ndarray, set 등)이 있으면 캐시 없이 평가
+                cached = key = None
+            # id 재사용 대비: 설정 객체 자체가 같을 때만 적중
+            if cached is not None and all(a is b for a, b in zip(cached[0], config)):
+                _EVAL_CACHE.move_to_end(key)
+                return _clone(cached[1])
+
+        result = self._evaluate(vision_summary, content_summary, vibe_summary, stt_result, discourse_result)
+        if key is None:
+            return result
+        with _EVAL_CACHE_LOCK:
+            _EVAL_CACHE[key] = (config, result)
+            _EVAL_CACHE.move_to_end(key)
+            if len(_EVAL_CACHE) > _EVAL_CACHE_SIZE:
+                _EVAL_CACHE.popitem(last=False)
+        return _clone(result)
+
+    def _task_config(self) -> tuple:
+        """채점 결과를 결정하는 설정 객체들 (evaluate 캐시 키의 설정 지문)"""
+        return (self.dimensions, self.current_preset, self.grading, self.binning, self.confidence_weights)
+
+    def evaluate_batch(self, vision_summaries: List[Dict], content_summaries: List[Dict],
+                       vibe_summaries: List[Dict], stt_results: List[Dict],
+                       discourse_results: Optional[List[Dict]] = None) -> List[Dict]:
+        """v8.2: 여러 강의 일괄 평가 (데이터셋 채점용)
+
+        한 인스턴스의 구간 표·차원 파라미터·결과 캐시를 공유하며, 중복 입력은 한 번만 계산합니다.
+        각 리스트는 같은 길이이며 i번째 원소들이 한 강의입니다.
         """
+        n = len(vision_summaries)
+        if not (len(content_summaries) == len(vibe_summaries) == len(stt_results) == n):
+            raise ValueError("evaluate_batch: 입력 리스트 길이가 서로 다릅니다")
+        if discourse_results is None:
+            discourse_results = [None] * n
+        elif len(discourse_results) != n:
+            raise ValueError("evaluate_batch: discourse_results 길이가 다릅니다")
+        return [
+            self.evaluate(vis, con, vib, stt, disc)
+            for vis, con, vib, stt, disc in zip(vision_summaries, content_summaries,
+                                                vibe_summaries, stt_results, discourse_results)
+        ]
+
+    def _evaluate(self, vision_summary: Dict, content_summary: Dict,
+                  vibe_summary: Dict, stt_result: Dict = None,
+                  discourse_result: Dict = None) -> Dict:
+        """7차원 종합 평가 본체 (캐시 없음)"""
         stt = stt_result or {}
         discourse = discourse_result or {}
 
@@ -335,36 +740,55 @@ class PedagogyAgent:
         # v7.0: confidence 계산
         confidence = self._compute_confidence(vis_ok, con_ok, stt_ok, vib_ok, disc_ok)
 
+        # v8.2: 차원 평가에서 반복 조회하던 스칼라 입력을 한 번만 추출
+        s = _extract_stats(_valid(vision_summary), _valid(content_summary), _valid(vibe_summary), stt)
+
         dimensions = [
-            self._eval_expertise(content_summary, stt, vis_ok, con_ok, stt_ok, discourse, disc_ok),
-            self._eval_methods(content_summary, vision_summary, stt, vis_ok, con_ok, stt_ok, discourse, disc_ok),
-            self._eval_language(content_summary, stt, vibe_summary, stt_ok, vib_ok),
-            self._eval_attitude(vision_summary, vibe_summary, vis_ok, vib_ok, stt_ok, stt, discourse, disc_ok),
-            self._eval_participation(stt, vibe_summary, stt_ok, vib_ok, discourse, disc_ok),
-            self._eval_time(vibe_summary, stt, vib_ok, stt_ok),
-            self._eval_creativity(content_summary, vision_summary, stt, vibe_summary, vis_ok, con_ok, stt_ok, vib_ok, discourse, disc_ok),
+            self._eval_expertise(s, vis_ok, con_ok, stt_ok, discourse, disc_ok),
+            self._eval_methods(s, vis_ok, con_ok, stt_ok, discourse, disc_ok),
+            self._eval_language(s, stt_ok, vib_ok),
+            self._eval_attitude(s, vis_ok, vib_ok, stt_ok, discourse, disc_ok),
+            self._eval_participation(s, stt_ok, vib_ok, discourse, disc_ok),
+            self._eval_time(s, vib_ok, stt_ok),
+            self._eval_creativity(s, vis_ok, con_ok, stt_ok, vib_ok, discourse, disc_ok),
         ]
-        total = sum(d.score for d in dimensions)
-
-        # v7.0: 차원별 독립 프로필 요약
-        strengths = [d.name for d in dimensions if d.percentage >= 80]
-        improvements = [d.name for d in dimensions if d.percentage < 60]
+        # v8.2: 차원 dict를 한 번만 순회하며 총점/점수표/이론/프로필 집계
+        total = 0
+        dimension_scores = {}
+        theory_references = []
+        strengths = []
+        improvements = []
+        top = weakest = None
+        for d in dimensions:
+            name, pct = d["name"], d["percentage"]
+            total += d["score"]
+            dimension_scores[name] = d["score"]
+            theory_references.append(d["theory_reference"])
+            # v7.0: 차원별 독립 프로필 요약
+            if pct >= 80:
+                strengths.append(name)
+            elif pct < 60:
+                improvements.append(name)
+            if top is None or pct > top["percentage"]:
+                top = d
+            if weakest is None or pct < weakest["percentage"]:
+                weakest = d
 
         return {
             "total_score": round(total, 1),
             "grade": self._grade(total),
             "is_supplementary": True,  # v7.0: 총점은 보조 지표
-            "dimensions": [d.to_dict() for d in dimensions],
-            "dimension_scores": {d.name: d.score for d in dimensions},
-            "theory_references": [d.theory_reference for d in dimensions],
+            "dimensions": dimensions,
+            "dimension_scores": dimension_scores,
+            "theory_references": theory_references,
             "preset_used": self.preset,
             "continuous_scoring": self.continuous_scoring,  # v8.0
             "confidence": confidence,
             "profile_summary": {
                 "strengths": strengths,
                 "improvements": improvements,
-                "top_dimension": max(dimensions, key=lambda d: d.percentage).name if dimensions else "",
-                "weakest_dimension": min(dimensions, key=lambda d: d.percentage).name if dimensions else "",
+                "top_dimension": top["name"] if top else "",
+                "weakest_dimension": weakest["name"] if weakest else "",
             },
             "version": "8.0",
         }
@@ -379,54 +803,59 @@ class PedagogyAgent:
         p = self.current_preset.get(dim_name, {})
         return p.get("adjust_range", 5.0)
 
-    def _make_score(self, name, base, feedback_fn, tips=None, confidence=1.0):
-        w = self.dimensions.get(name, DEFAULT_DIMENSIONS.get(name, {})).get("weight", 10)
-        # v7.0: adjust_range 클램핑 — base ± range 내에서만 허용
-        preset_base = self._get_base(name)
-        adj_range = self._get_adjust_range(name)
-        # v7.0: 유효 최대값을 weight * 0.95로 제한 (천장 효과 방지)
-        effective_max = min(preset_base + adj_range, w * 0.95)
-        effective_min = max(preset_base - adj_range, 0)
-        clamped = max(effective_min, min(effective_max, base))
-        score = max(0, min(w, round(clamped, 1)))
-        pct = (score / w) * 100
-        g = "우수" if pct >= 85 else ("양호" if pct >= 70 else ("보통" if pct >= 55 else "노력 필요"))
-        theory = self.dimensions.get(name, DEFAULT_DIMENSIONS.get(name, {})).get("theory", "")
-        return DimensionScore(name=name, score=score, max_score=w, percentage=pct, grade=g,
-                              feedback=feedback_fn(pct),
-                              theory_reference=theory,
-                              confidence=confidence,
-                              improvement_tips=tips or [])
+    def _dim_params(self, name: str) -> tuple:
+        """v8.2: 차원별 (preset, weight, theory, 유효 최소, 유효 최대, 상한 포화 점수, 하한 포화 점수)
+
+        포화 점수는 base가 유효 범위 밖일 때의 (score, pct, bucket)로, current_preset 객체가 바뀌면 재계산합니다.
+        """
+        cached = self._dim_cache.get(name)
+        if cached is None or cached[0] is not self.current_preset:
+            dim = self.dimensions.get(name, DEFAULT_DIMENSIONS.get(name, {}))
+            w = dim.get("weight", 10)
+            # v7.0: adjust_range 클램핑 — base ± range 내에서만 허용
+            preset_base = self._get_base(name)
+            adj_range = self._get_adjust_range(name)
+            # v7.0: 유효 최대값을 weight * 0.95로 제한 (천장 효과 방지)
+            effective_max = min(preset_base + adj_range, w * 0.95)
+            effective_min = max(preset_base - adj_range, 0)
+            cached = self._dim_cache[name] = (
+                self.current_preset, w, dim.get("theory", ""), effective_min, effective_max,
+                _score_fields(max(effective_min, effective_max), w),
+                _score_fields(effective_min, w),
+            )
+        return cached
+
+    def _make_score(self, name, base, tips=None, confidence=1.0):
+        _, w, theory, effective_min, effective_max, sat_high, sat_low = self._dim_params(name)
+        # v8.2: 유효 범위 밖(클램핑되는 경우)은 미리 계산한 포화 점수 사용
+        if base >= effective_max:
+            score, pct, bucket = sat_high
+        elif base <= effective_min:
+            score, pct, bucket = sat_low
+        else:
+            score, pct, bucket = _score_fields(base, w)
+        # v8.2: DimensionScore 인스턴스 → to_dict() 왕복 없이 결과 dict를 바로 생성 (키 순서 동일)
+        return {
+            "name": name, "score": score, "max_score": w, "percentage": pct,
+            "grade": _GRADE_LABELS[bucket], "feedback": _FEEDBACK[name][bucket],
+            "theory_reference": theory, "confidence": confidence,
+            "improvement_tips": tips if tips is not None else [],  # 빈 tips 리스트 재사용 (추가 할당 없음)
+        }
 
     # ================================================================
     # 1. 수업 전문성 (20점) — v7.0: 구간화 + 강화된 가감점
     # ================================================================
-    def _eval_expertise(self, content, stt, vis_ok, con_ok, stt_ok, discourse, disc_ok):
+    def _eval_expertise(self, s, vis_ok, con_ok, stt_ok, discourse, disc_ok):
         base = self._get_base("수업 전문성")
         conf = 0.5  # 기본 신뢰도
 
         if stt_ok:
             conf += 0.25
-            wc = stt.get('word_count', 0)
-            dur = stt.get('duration_seconds', 600)
-            wpm = (wc / dur * 60) if dur > 0 else 0
-
             # v7.0: 구간화된 WPM 평가
-            wpm_bin = self._bin_metric("speaking_wpm", wpm)
-            if wpm_bin == "GOOD":
-                base += 3.0
-            elif wpm_bin == "MODERATE":
-                base += 1.5
-            elif wpm_bin == "SLOW":
-                base += 0.0
-            elif wpm_bin == "FAST":
-                base -= 1.5
-            elif wpm_bin == "VERY_FAST":
-                base -= 3.0
-            elif wpm_bin == "VERY_SLOW":
-                base -= 3.0
+            base += _WPM_EXPERTISE.get(self._bin_metric("speaking_wpm", s.wpm), 0.0)
 
             # 발화량
+            wc = s.wc
             if wc > 1200:
                 base += 3.0
             elif wc > 800:
@@ -440,7 +869,7 @@ class PedagogyAgent:
 
         if con_ok:
             conf += 0.1
-            speaker_vis = _safe(content, 'speaker_visible_ratio', 0)
+            speaker_vis = s.speaker_vis
             if speaker_vis > 0.8:
                 base += 1.0
             elif speaker_vis < 0.3:
@@ -461,28 +890,23 @@ class PedagogyAgent:
                 base -= 2.5  # 암기 중심 수업
 
         tips = []
-        if stt_ok and stt.get('word_count', 0) < 500:
+        if stt_ok and s.wc < 500:
             tips.append("충분한 설명을 통해 학습 내용을 풍부하게 전달하세요.")
         if disc_ok and discourse.get('bloom_levels', {}).get('analyze', 0) < 0.1:
             tips.append("분석·평가·창작 수준의 사고를 유도하는 질문을 늘리세요.")
 
-        return self._make_score("수업 전문성", base,
-            lambda p: "학습 목표가 명확하고 내용 구조화가 매우 체계적입니다." if p >= 85 else
-                      ("학습 목표와 내용 구성이 전반적으로 양호합니다." if p >= 70 else
-                       ("내용 전달이 보통 수준입니다. 구조화가 필요합니다." if p >= 55 else
-                        "학습 목표를 명확히 하고 내용을 체계적으로 구성하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("수업 전문성", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 2. 교수학습 방법 (20점) — v7.0: 구간화 + 강화
     # ================================================================
-    def _eval_methods(self, content, vision, stt, vis_ok, con_ok, stt_ok, discourse, disc_ok):
+    def _eval_methods(self, s, vis_ok, con_ok, stt_ok, discourse, disc_ok):
         base = self._get_base("교수학습 방법")
         conf = 0.5
 
         if con_ok:
             conf += 0.15
-            slide_r = _safe(content, 'slide_detected_ratio', 0)
+            slide_r = s.slide_r
             if slide_r > 0.6:
                 base += 3.0
             elif slide_r > 0.3:
@@ -490,7 +914,7 @@ class PedagogyAgent:
             elif slide_r < 0.1:
                 base -= 2.0
 
-            contrast = _safe(content, 'avg_color_contrast', 0)
+            contrast = s.contrast
             if contrast > 60:
                 base += 1.5
             elif contrast < 20:
@@ -498,18 +922,9 @@ class PedagogyAgent:
 
         if vis_ok:
             conf += 0.15
-            g_ratio = _safe(vision, 'gesture_active_ratio', 0)
-            g_bin = self._bin_metric("gesture_active_ratio", g_ratio)
-            if g_bin == "ACTIVE":
-                base += 3.5
-            elif g_bin == "MODERATE":
-                base += 1.5
-            elif g_bin == "LOW":
-                base -= 0.5
-            elif g_bin == "INACTIVE":
-                base -= 2.0
+            base += _GESTURE_METHODS.get(self._bin_metric("gesture_active_ratio", s.gesture), 0.0)
 
-            motion = _safe(vision, 'avg_motion_score', 0)
+            motion = s.motion
             if motion > 25:
                 base += 1.5
             elif motion < 5:
@@ -517,14 +932,7 @@ class PedagogyAgent:
 
         if stt_ok:
             conf += 0.1
-            wc = stt.get('word_count', 0)
-            dur = stt.get('duration_seconds', 600)
-            wpm = (wc / dur * 60) if dur > 0 else 0
-            wpm_bin = self._bin_metric("speaking_wpm", wpm)
-            if wpm_bin in ("GOOD", "MODERATE"):
-                base += 2.0
-            elif wpm_bin == "VERY_SLOW":
-                base -= 2.5
+            base += _WPM_METHODS.get(self._bin_metric("speaking_wpm", s.wpm), 0.0)
 
         # 질문 유형 분석
         if disc_ok:
@@ -554,92 +962,48 @@ class PedagogyAgent:
             if qt.get('scaffolding', 0) < 1:
                 tips.append("스캐폴딩 질문으로 학생의 사고를 단계적으로 유도하세요.")
 
-        return self._make_score("교수학습 방법", base,
-            lambda p: "다양한 교수학습 방법을 매우 효과적으로 활용합니다." if p >= 85 else
-                      ("교수법이 양호하며 시각자료 활용도 적절합니다." if p >= 70 else
-                       ("교수법이 보통 수준입니다. 다양한 전략을 시도하세요." if p >= 55 else
-                        "다양한 교수학습 전략과 매체 활용이 필요합니다.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("교수학습 방법", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 3. 판서 및 언어 (15점) — v7.0: 구간화
     # ================================================================
-    def _eval_language(self, content, stt, vibe, stt_ok, vib_ok):
+    def _eval_language(self, s, stt_ok, vib_ok):
         base = self._get_base("판서 및 언어")
         conf = 0.5
 
         if stt_ok:
             conf += 0.25
-            fr = stt.get('filler_ratio', 0.03)
-            fr_bin = self._bin_metric("filler_ratio", fr)
-            if fr_bin == "CLEAN":
-                base += 4.0
-            elif fr_bin == "GOOD":
-                base += 2.0
-            elif fr_bin == "MODERATE":
-                base += 0.5
-            elif fr_bin == "HIGH":
-                base -= 2.0
-            elif fr_bin == "EXCESSIVE":
-                base -= 4.0
+            base += _FILLER_LANGUAGE.get(self._bin_metric("filler_ratio", s.fr), 0.0)
 
-            pat = stt.get('speaking_pattern', '')
-            if '빠름' in pat or 'Fast' in pat:
+            if s.pflags & _PAT_FAST:
                 base -= 1.5
-            elif '느림' in pat or 'Slow' in pat:
+            elif s.pflags & _PAT_SLOW:
                 base -= 0.5
 
         if vib_ok:
             conf += 0.25
-            mono = _safe(vibe, 'monotone_ratio', 0.5)
-            mono_bin = self._bin_metric("monotone_ratio", mono)
-            if mono_bin == "EXPRESSIVE":
-                base += 3.0
-            elif mono_bin == "VARIED":
-                base += 1.5
-            elif mono_bin == "MODERATE":
-                base += 0.0
-            elif mono_bin == "MONOTONE":
-                base -= 2.0
-            elif mono_bin == "FLAT":
-                base -= 3.5
+            base += _MONOTONE_LANGUAGE.get(self._bin_metric("monotone_ratio", s.mono), 0.0)
 
         tips = []
-        if stt_ok and stt.get('filler_ratio', 0) > 0.04:
-            tips.append(f"습관어를 줄이세요 (현재: {stt.get('filler_ratio', 0):.1%}).")
+        if stt_ok and s.fr > 0.04:
+            tips.append(f"습관어를 줄이세요 (현재: {s.fr:.1%}).")
         if not vib_ok:
             tips.append("목소리 톤에 변화를 주어 핵심 내용을 강조하세요.")
 
-        return self._make_score("판서 및 언어", base,
-            lambda p: "언어 표현이 명확하고 발화가 매우 깨끗합니다." if p >= 85 else
-                      ("언어 사용이 양호하나 미세한 개선 여지가 있습니다." if p >= 70 else
-                       ("습관어나 단조로운 어조 개선이 필요합니다." if p >= 55 else
-                        "발화 습관을 개선하고 핵심 용어를 정확히 사용하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("판서 및 언어", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 4. 수업 태도 (15점) — v7.0: 구간화 + 강화
     # ================================================================
-    def _eval_attitude(self, vision, vibe, vis_ok, vib_ok, stt_ok, stt, discourse, disc_ok):
+    def _eval_attitude(self, s, vis_ok, vib_ok, stt_ok, discourse, disc_ok):
         base = self._get_base("수업 태도")
         conf = 0.5
 
         if vis_ok:
             conf += 0.2
-            ec = _safe(vision, 'eye_contact_ratio', 0)
-            ec_bin = self._bin_metric("eye_contact_ratio", ec)
-            if ec_bin == "EXCELLENT":
-                base += 4.0
-            elif ec_bin == "GOOD":
-                base += 3.0
-            elif ec_bin == "MODERATE":
-                base += 1.0
-            elif ec_bin == "LOW":
-                base -= 1.0
-            elif ec_bin == "POOR":
-                base -= 3.0
+            base += _EYE_CONTACT_ATTITUDE.get(self._bin_metric("eye_contact_ratio", s.ec), 0.0)
 
-            expr = _safe(vision, 'avg_expression_score', 50)
+            expr = s.expr
             if expr > 70:
                 base += 2.5
             elif expr > 55:
@@ -649,7 +1013,7 @@ class PedagogyAgent:
 
         if vib_ok:
             conf += 0.1
-            ed = _safe(vibe, 'energy_distribution', {})
+            ed = s.ed
             if ed:
                 high_e = ed.get('high', 0)
                 low_e = ed.get('low', 0)
@@ -662,14 +1026,7 @@ class PedagogyAgent:
 
         if stt_ok:
             conf += 0.1
-            wc = stt.get('word_count', 0)
-            dur = stt.get('duration_seconds', 600)
-            wpm = (wc / dur * 60) if dur > 0 else 0
-            wpm_bin = self._bin_metric("speaking_wpm", wpm)
-            if wpm_bin in ("GOOD", "MODERATE"):
-                base += 2.0
-            elif wpm_bin == "VERY_SLOW":
-                base -= 2.0
+            base += _WPM_ATTITUDE.get(self._bin_metric("speaking_wpm", s.wpm), 0.0)
 
         # 피드백 품질 반영
         if disc_ok:
@@ -685,30 +1042,24 @@ class PedagogyAgent:
                 base += 1.5
 
         tips = []
-        if vis_ok and _safe(vision, 'eye_contact_ratio', 0) < 0.3:
+        if vis_ok and s.ec < 0.3:
             tips.append("학생들과 시선을 고르게 맞추며 소통하세요.")
         if disc_ok and discourse.get('feedback_quality', {}).get('specific_praise', 0) < 2:
             tips.append("'잘했어요' 대신 '○○을 정확히 파악했네!'와 같은 구체적 칭찬을 하세요.")
 
-        return self._make_score("수업 태도", base,
-            lambda p: "열정적인 태도와 학생과의 라포 형성이 매우 우수합니다." if p >= 85 else
-                      ("전반적으로 양호한 태도이나 소통 강화가 필요합니다." if p >= 70 else
-                       ("태도 전반에 개선이 필요합니다." if p >= 55 else
-                        "시선 접촉과 구체적 피드백을 통해 열정을 전달하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("수업 태도", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 5. 학생 참여 (15점) — v7.0: 구간화 + 점수 범위 확대
     # ================================================================
-    def _eval_participation(self, stt, vibe, stt_ok, vib_ok, discourse, disc_ok):
+    def _eval_participation(self, s, stt_ok, vib_ok, discourse, disc_ok):
         base = self._get_base("학생 참여")
         conf = 0.5
 
         if stt_ok:
             conf += 0.25
-            student_turns = stt.get('student_turns', 0)
-            interaction_count = stt.get('interaction_count', 0)
-            teacher_ratio = stt.get('teacher_ratio', 0.75)
+            student_turns = s.student_turns
+            interaction_count = s.interaction_count
 
             # 학생 발화
             if student_turns > 20:
@@ -731,20 +1082,10 @@ class PedagogyAgent:
                 base -= 1.5
 
             # v7.0: 교사 발화 비율 — 구간화
-            tr_bin = self._bin_metric("teacher_ratio", teacher_ratio)
-            if tr_bin == "STUDENT_LED":
-                base += 2.0
-            elif tr_bin == "BALANCED":
-                base += 1.5
-            elif tr_bin == "TEACHER_MODERATE":
-                base += 0.5
-            elif tr_bin == "TEACHER_DOMINANT":
-                base -= 1.5
-            elif tr_bin == "LECTURE_ONLY":
-                base -= 4.0  # v7.0: 독강 대폭 감점
+            base += _TEACHER_RATIO_PARTICIPATION.get(self._bin_metric("teacher_ratio", s.teacher_ratio), 0.0)
 
             # 질문 횟수
-            question_count = stt.get('question_count', 0)
+            question_count = s.question_count
             if question_count > 10:
                 base += 1.0
             elif question_count == 0:
@@ -752,7 +1093,7 @@ class PedagogyAgent:
 
         if vib_ok:
             conf += 0.1
-            sr = _safe(vibe, 'avg_silence_ratio', 0.3)
+            sr = s.silence
             if 0.15 <= sr <= 0.30:
                 base += 0.5
             elif sr > 0.45:
@@ -770,32 +1111,26 @@ class PedagogyAgent:
                 base -= 1.5
 
         tips = []
-        if stt_ok and stt.get('student_turns', 0) < 3:
+        if stt_ok and s.student_turns < 3:
             tips.append("개방형 질문으로 학생 발언 기회를 늘리세요.")
-        if stt_ok and stt.get('teacher_ratio', 0.75) > 0.85:
+        if stt_ok and s.teacher_ratio > 0.85:
             tips.append("교사 발화 비율이 높습니다. 학생에게 더 많은 발언 기회를 주세요.")
 
-        return self._make_score("학생 참여", base,
-            lambda p: "학생 참여를 효과적으로 이끌어내며 상호작용이 활발합니다." if p >= 85 else
-                      ("참여 유도가 양호하나 상호작용을 더 늘리세요." if p >= 70 else
-                       ("학생 참여 유도가 부족합니다." if p >= 55 else
-                        "발문과 피드백 전략을 적극적으로 활용하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("학생 참여", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 6. 시간 배분 (10점) — v7.0: 강화된 가감점
     # ================================================================
-    def _eval_time(self, vibe, stt, vib_ok, stt_ok):
+    def _eval_time(self, s, vib_ok, stt_ok):
         base = self._get_base("시간 배분")
         conf = 0.5
 
         if vib_ok:
             conf += 0.25
-            ed = _safe(vibe, 'energy_distribution', {})
+            ed = s.ed
             if ed:
-                lvs = [ed.get('low', 0), ed.get('normal', 0), ed.get('high', 0)]
-                if sum(lvs) > 0:
-                    spread = max(lvs) - min(lvs)
+                spread = _ed_spread(ed)
+                if spread is not None:
                     if spread < 0.25:
                         base += 3.5
                     elif spread < 0.4:
@@ -803,16 +1138,11 @@ class PedagogyAgent:
                     elif spread > 0.65:
                         base -= 2.5
 
-            mono = _safe(vibe, 'monotone_ratio', 0.5)
-            mono_bin = self._bin_metric("monotone_ratio", mono)
-            if mono_bin in ("EXPRESSIVE", "VARIED"):
-                base += 1.5
-            elif mono_bin in ("MONOTONE", "FLAT"):
-                base -= 1.5
+            base += _MONOTONE_TIME.get(self._bin_metric("monotone_ratio", s.mono), 0.0)
 
         if stt_ok:
             conf += 0.25
-            dur = stt.get('duration_seconds', 600)
+            dur = s.dur
             if 500 <= dur <= 900:
                 base += 1.0
             elif dur > 1200:
@@ -824,24 +1154,19 @@ class PedagogyAgent:
         if base < 7:
             tips.append("도입(10%)-전개(70%)-정리(20%) 비율로 시간을 배분하세요.")
 
-        return self._make_score("시간 배분", base,
-            lambda p: "시간 배분이 매우 적절하며 수업 흐름이 자연스럽습니다." if p >= 85 else
-                      ("시간 배분이 양호하나 정리 단계를 확보하세요." if p >= 70 else
-                       ("시간 배분에 개선이 필요합니다." if p >= 55 else
-                        "시간 배분을 사전에 계획하고 각 단계에 충실하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("시간 배분", base, tips, confidence=min(1.0, conf))
 
     # ================================================================
     # 7. 창의성 (5점) — v7.0: 구간화 + 범위 확대
     # ================================================================
-    def _eval_creativity(self, content, vision, stt, vibe, vis_ok, con_ok, stt_ok, vib_ok, discourse, disc_ok):
+    def _eval_creativity(self, s, vis_ok, con_ok, stt_ok, vib_ok, discourse, disc_ok):
         base = self._get_base("창의성")
         conf = 0.5
 
         if con_ok:
             conf += 0.1
-            contrast = _safe(content, 'avg_color_contrast', 0)
-            complexity = _safe(content, 'avg_complexity', 0)
+            contrast = s.contrast
+            complexity = s.complexity
             if contrast > 60:
                 base += 0.5
             elif contrast < 15:
@@ -853,7 +1178,7 @@ class PedagogyAgent:
 
         if vis_ok:
             conf += 0.15
-            motion = _safe(vision, 'avg_motion_score', 0)
+            motion = s.motion
             if motion > 30:
                 base += 0.8
             elif motion > 15:
@@ -861,25 +1186,18 @@ class PedagogyAgent:
             elif motion < 3:
                 base -= 0.6
 
-            openness = _safe(vision, 'avg_body_openness', 0.5)
+            openness = s.body_open
             if openness > 0.75:
                 base += 0.6
             elif openness < 0.3:
                 base -= 0.4
 
-            g_ratio = _safe(vision, 'gesture_active_ratio', 0)
-            g_bin = self._bin_metric("gesture_active_ratio", g_ratio)
-            if g_bin == "ACTIVE":
-                base += 0.7
-            elif g_bin == "MODERATE":
-                base += 0.3
-            elif g_bin == "INACTIVE":
-                base -= 0.6
+            base += _GESTURE_CREATIVITY.get(self._bin_metric("gesture_active_ratio", s.gesture), 0.0)
 
         if stt_ok:
             conf += 0.1
-            wc = stt.get('word_count', 0)
-            sc = stt.get('segment_count', 1)
+            wc = s.wc
+            sc = s.sc
 
             if sc > 100 and wc > 800:
                 base += 0.5
@@ -913,18 +1231,18 @@ class PedagogyAgent:
         tips = []
         if base < 3.5:
             tips.append("ICT 도구를 활용한 창의적 수업 설계를 시도하세요.")
-        if vis_ok and _safe(vision, 'gesture_active_ratio', 0) < 0.2:
+        if vis_ok and s.gesture < 0.2:
             tips.append("몸짓과 제스처를 적극 활용하여 수업을 역동적으로 만드세요.")
 
-        return self._make_score("창의성", base,
-            lambda p: "창의적인 수업 설계와 전달이 돋보입니다." if p >= 85 else
-                      ("창의성이 양호한 수준입니다." if p >= 70 else
-                       ("창의적 요소를 더 추가하세요." if p >= 55 else
-                        "독창적인 활동과 시각적 매체를 적극 활용하세요.")),
-            tips, confidence=min(1.0, conf))
+        return self._make_score("창의성", base, tips, confidence=min(1.0, conf))
 
     def _grade(self, total):
-        for g, threshold in sorted(self.grading.items(), key=lambda x: x[1], reverse=True):
-            if total >= threshold:
-                return g
-        return "D"
+        """총점 → 등급 (v8.2: 정렬된 기준점 표 이분 탐색, 기준점 동률 시 기존과 같은 등급)"""
+        cached = self._grade_table
+        if cached is None or cached[0] is not self.grading:
+            ordered = sorted(self.grading.items(), key=lambda x: x[1], reverse=True)[::-1]
+            cached = self._grade_table = (
+                self.grading, [t for _, t in ordered], [g for g, _ in ordered],
+            )
+        i = bisect.bisect_right(cached[1], total)
+        return cached[2][i - 1] if i else "D"
@@ -92,8 +92,9 @@ def _analyze_content(frame: np.ndarray, timestamp: float, config: Dict) -> Dict:
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     height, width = frame.shape[:2]
     
-    # 밝기
-    brightness = float(np.mean(gray))
+    # 밝기 (uint8 그대로 집계 — float64 사본 없음)
+    mean, _ = cv2.meanStdDev(gray)
+    brightness = float(mean[0, 0])
     
     # 색상 대비
     lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
@@ -109,15 +110,14 @@ def _analyze_content(frame: np.ndarray, timestamp: float, config: Dict) -> Dict:
     density_ratio = estimated_chars / threshold
     text_density_score = min(10, max(1, int(density_ratio * 5) + 1))
     
-    # 복잡도
-    laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-    complexity_score = min(100, float(laplacian.var()) / 50)
+    # 복잡도 — uint8 3x3 Laplacian은 |값| ≤ 1020이므로 CV_16S로 충분 (CV_64F 대비 1/4 메모리)
+    _, lap_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    complexity_score = min(100, float(lap_std[0, 0]) ** 2 / 50)
     
-    # 슬라이드 감지
-    center = frame[height//4:3*height//4, width//4:3*width//4]
-    center_gray = cv2.cvtColor(center, cv2.COLOR_BGR2GRAY)
+    # 슬라이드 감지 (이미 변환한 gray의 중앙 view 사용)
+    center_gray = gray[height//4:3*height//4, width//4:3*width//4]
     edges = cv2.Canny(center_gray, 50, 150)
-    edge_density = np.sum(edges > 0) / edges.size
+    edge_density = cv2.countNonZero(edges) / edges.size
     slide_detected = 0.01 < edge_density < 0.3
     
     return {
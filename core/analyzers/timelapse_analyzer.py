@@ -129,7 +129,8 @@ def deduplicate_frames(image_paths: List[str], threshold: int = 4) -> Tuple[List
 # ---------------------------------------------------------
 # 1. [I/O Phase] FFmpeg를 이용한 초고속 리소스 추출
 # ---------------------------------------------------------
-def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = True) -> Tuple[List[str], str]:
+def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = True,
+                            extract_frames: bool = True) -> Tuple[List[str], str]:
     """
     영상에서 '분석에 필요한 최소한의 데이터'만 물리적으로 추출합니다.
     
@@ -137,6 +138,7 @@ def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = Tr
         video_path: 입력 비디오 경로
         output_dir: 출력 디렉토리 (임시 캐시)
         use_gpu: GPU 가속 사용 여부 (NVIDIA CUDA)
+        extract_frames: False면 오디오만 추출 (프레임은 iter_video_frames로 직접 디코딩)
         
     Returns:
         (이미지 경로 리스트, 오디오 파일 경로)
@@ -151,7 +153,7 @@ def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = Tr
 
     # GPU 가속 감지
     gpu_available = False
-    if use_gpu:
+    if use_gpu and extract_frames:
         try:
             result = subprocess.run(
                 ['ffmpeg', '-hwaccels'],
@@ -196,8 +198,12 @@ def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = Tr
     ]
     
     # 두 작업을 동시에 던져놓고 기다림 (Parallel I/O)
-    p1 = subprocess.Popen(cmd_vid, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     p2 = subprocess.Popen(cmd_aud, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not extract_frames:
+        p2.wait()
+        print("   ✅ 추출 완료: 오디오 1개 (프레임은 메모리에서 직접 디코딩)")
+        return [], audio_path
+    p1 = subprocess.Popen(cmd_vid, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     # GPU 명령 실패 시 CPU fallback
     exit_code = p1.wait()
@@ -220,6 +226,46 @@ def flash_extract_resources(video_path: str, output_dir: str, use_gpu: bool = Tr
     return images, audio_path
 
 
+def iter_video_frames(video_path: str, fps: float = 1.0,
+                      size: Tuple[int, int] = (640, 360)):
+    """
+    영상을 직접 디코딩해 (BGR 프레임, 타임스탬프)를 순서대로 반환합니다.
+
+    flash_extract_resources의 JPEG 추출(ffmpeg 인코딩 → 디스크 → cv2 디코딩)과 같은
+    샘플링(1fps, 640x360)을 메모리에서 수행합니다. 한 번에 한 프레임만 유지합니다.
+
+    Args:
+        video_path: 입력 비디오 경로
+        fps: 초당 샘플 수
+        size: 출력 해상도 (width, height)
+
+    Yields:
+        (frame, timestamp) — timestamp는 JPEG 파일 번호(frame_0001 → 1.0)와 같은 규칙
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return
+    try:
+        src_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        step = src_fps / fps
+        index = 0        # 원본 프레임 번호
+        sampled = 0      # 반환한 샘플 수
+        next_pick = 0.0  # 다음 샘플 원본 프레임 위치
+        # 건너뛸 프레임은 grab()만 (색 변환/복사 없음), 샘플만 retrieve()
+        while cap.grab():
+            if index >= next_pick:
+                ok, frame = cap.retrieve()
+                if ok:
+                    if (frame.shape[1], frame.shape[0]) != size:
+                        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                    sampled += 1
+                    yield frame, float(sampled)
+                    next_pick = sampled * step
+            index += 1
+    finally:
+        cap.release()
+
+
 # ---------------------------------------------------------
 # 2. [Vision Worker] 이미지 배치 분석
 # ---------------------------------------------------------
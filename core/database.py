@@ -6,15 +6,65 @@ DB 파일: data/gaim_lab.db (자동 생성)
 """
 
 import json
+import math
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# 선택: msgspec JSON 인코더 — 결과 dict 직렬화가 stdlib json보다 수 배 빠름
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
 # DB 파일 기본 경로
 _DB_DIR = Path(__file__).resolve().parent.parent / "data"
 _DB_PATH = _DB_DIR / "gaim_lab.db"
 
+def _enc_hook(obj):
+    """msgspec 미지원 타입 처리 — float 하위 타입(np.float64 등)은 숫자, 나머지는 str (json default=str과 동일)"""
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+# result_json 인코더 — 모듈 로드 시 1회 생성
+_JSON_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook) if HAS_MSGSPEC else None
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(obj) -> bool:
+    """msgspec와 json.dumps(default=str)의 출력이 같은 구조인지 확인
+
+    str 키 dict / list / tuple / 유한 float / str·int·bool·None만 허용. NaN·inf(json은 NaN,
+    msgspec은 null), 비문자열 키, set·bytes·datetime·dataclass처럼 msgspec이 자체 규칙으로
+    인코딩하는 타입이 있으면 False → stdlib json 사용.
+    """
+    t = type(obj)
+    if t is dict:
+        for k, v in obj.items():
+            if type(k) is not str or not _is_plain_json(v):
+                return False
+        return True
+    if t is list or t is tuple:
+        for v in obj:
+            if not _is_plain_json(v):
+                return False
+        return True
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    return t in _PLAIN_TYPES
+
+
+def _encode_result(result: Dict) -> str:
+    """분석 결과 dict → result_json 문자열 (일반 JSON 구조면 msgspec, 아니면 stdlib json)"""
+    if _JSON_ENCODER is not None and _is_plain_json(result):
+        return _JSON_ENCODER.encode(result).decode("utf-8")
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
 # ============================================================
 # Schema
 # ============================================================
@@ -68,6 +118,7 @@ class AnalysisRepository:
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 체크포인트 시에만 fsync — 커밋당 fsync 제거
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
 
@@ -89,44 +140,49 @@ class AnalysisRepository:
         elapsed_seconds: float = 0.0,
     ) -> int:
         """Save a pipeline result to DB. Returns analysis row id."""
-        ped = pedagogy or {}
-        total_score = ped.get("total_score", 0)
-        grade = ped.get("grade", "")
-        confidence = ped.get("confidence", {}).get("overall", 0)
-        version = ped.get("version", "7.0")
-        preset = ped.get("preset_used", "default")
-        video_name = Path(video_path).stem
+        return self.save_many([{
+            "video_path": video_path,
+            "pipeline_id": pipeline_id,
+            "result": result,
+            "pedagogy": pedagogy,
+            "elapsed_seconds": elapsed_seconds,
+        }])[0]
 
-        with self._conn() as conn:
-            cur = conn.execute(
-                """INSERT OR REPLACE INTO analyses
-                   (pipeline_id, video_path, video_name, analyzed_at,
-                    elapsed_seconds, total_score, grade, confidence,
-                    version, preset, result_json)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    pipeline_id,
-                    str(video_path),
-                    video_name,
-                    datetime.now().isoformat(),
-                    elapsed_seconds,
-                    total_score,
-                    grade,
-                    confidence,
-                    version,
-                    preset,
-                    json.dumps(result, ensure_ascii=False, default=str),
-                ),
-            )
-            analysis_id = cur.lastrowid
+    def save_many(self, rows: List[Dict]) -> List[int]:
+        """Save several pipeline results in one transaction. Returns analysis row ids.
 
-            # Save dimension scores
-            dimensions = ped.get("dimensions", [])
-            for d in dimensions:
-                conn.execute(
-                    """INSERT INTO dimension_scores
-                       (analysis_id, name, score, max_score, percentage, grade, confidence)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        각 row는 save_result()와 같은 키 (video_path, pipeline_id, result, pedagogy, elapsed_seconds).
+        한 행이라도 실패하면 전체가 rollback되므로, 나머지 행을 살리려면 호출부에서 행별로 save_result()를 재시도합니다.
+        """
+        ids = []
+        dim_rows = []
+        with self._conn() as conn:
+            for row in rows:
+                ped = row.get("pedagogy") or {}
+                video_path = row["video_path"]
+                cur = conn.execute(
+                    """INSERT OR REPLACE INTO analyses
+                       (pipeline_id, video_path, video_name, analyzed_at,
+                        elapsed_seconds, total_score, grade, confidence,
+                        version, preset, result_json)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        row.get("pipeline_id"),
+                        str(video_path),
+                        Path(video_path).stem,
+                        datetime.now().isoformat(),
+                        row.get("elapsed_seconds", 0.0),
+                        ped.get("total_score", 0),
+                        ped.get("grade", ""),
+                        ped.get("confidence", {}).get("overall", 0),
+                        ped.get("version", "7.0"),
+                        ped.get("preset_used", "default"),
+                        _encode_result(row.get("result") or {}),
+                    ),
+                )
+                analysis_id = cur.lastrowid
+                ids.append(analysis_id)
+                dim_rows.extend(
                     (
                         analysis_id,
                         d.get("name", ""),
@@ -135,10 +191,20 @@ class AnalysisRepository:
                         d.get("percentage", 0),
                         d.get("grade", ""),
                         d.get("confidence", 1.0),
-                    ),
+                    )
+                    for d in ped.get("dimensions", [])
+                )
+
+            # Save dimension scores
+            if dim_rows:
+                conn.executemany(
+                    """INSERT INTO dimension_scores
+                       (analysis_id, name, score, max_score, percentage, grade, confidence)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    dim_rows,
                 )
             conn.commit()
-        return analysis_id
+        return ids
 
     # ----------------------------------------------------------
     # Read
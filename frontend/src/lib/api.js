@@ -102,7 +102,8 @@ const api = {
         register: (body) => request(`${AUTH_BASE}/register`, 'POST', body, { auth: false }),
         me: () => request(`${AUTH_BASE}/me`, 'GET'),
         changePassword: (body) => request(`${AUTH_BASE}/me/password`, 'PUT', body),
-        listUsers: () => request(`${AUTH_BASE}/users`, 'GET'),
+        // keyset 페이지네이션 — 한 페이지({items, next_after})만 조회, next_after가 null이면 마지막 페이지
+        listUsers: (after = 0, limit = 100) => request(`${AUTH_BASE}/users?after=${after}&limit=${limit}`, 'GET'),
         createUser: (body) => request(`${AUTH_BASE}/users`, 'POST', body),
         updateUser: (username, body) => request(`${AUTH_BASE}/users/${username}`, 'PUT', body),
         deleteUser: (username) => request(`${AUTH_BASE}/users/${username}`, 'DELETE'),
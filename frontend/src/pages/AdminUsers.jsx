@@ -6,6 +6,8 @@ import './AdminUsers.css'
 
 function AdminUsers() {
     const [users, setUsers] = useState([])
+    const [nextAfter, setNextAfter] = useState(null)
+    const [loadingMore, setLoadingMore] = useState(false)
     const [loading, setLoading] = useState(true)
     const [error, setError] = useState(null)
     const [showCreate, setShowCreate] = useState(false)
@@ -17,7 +19,15 @@ function AdminUsers() {
 
     const fetchUsers = async () => {
         try {
-            setUsers(isRemote ? await localListUsers() : await api.auth.listUsers())
+            if (isRemote) {
+                setUsers(await localListUsers())
+                setNextAfter(null)
+            } else {
+                // 첫 페이지만 조회 — 나머지는 '더 보기'로 필요할 때 이어서 조회
+                const page = await api.auth.listUsers()
+                setUsers(page.items)
+                setNextAfter(page.next_after)
+            }
         } catch (e) {
             if (e.message.includes('인증')) { navigate('/login'); return }
             setError(e.message)
@@ -30,6 +40,16 @@ function AdminUsers() {
 
     const flash = (m) => { setMsg(m); setTimeout(() => setMsg(null), 3000) }
 
+    const loadMore = async () => {
+        setLoadingMore(true)
+        try {
+            const page = await api.auth.listUsers(nextAfter)
+            setUsers(prev => [...prev, ...page.items])
+            setNextAfter(page.next_after)
+        } catch (e) { flash(`❌ ${e.message}`) }
+        finally { setLoadingMore(false) }
+    }
+
     const handleCreate = async (e) => {
         e.preventDefault()
         try {
@@ -132,7 +152,7 @@ function AdminUsers() {
             {/* User Stats */}
             <div className="admin-stats">
                 <div className="stat-mini">
-                    <span className="stat-num">{users.length}</span>
+                    <span className="stat-num">{users.length}{nextAfter !== null && '+'}</span>
                     <span className="stat-label">전체 사용자</span>
                 </div>
                 <div className="stat-mini">
@@ -204,6 +224,13 @@ function AdminUsers() {
                         ))}
                     </tbody>
                 </table>
+                {nextAfter !== null && (
+                    <div className="admin-more">
+                        <button className="btn btn-cancel" onClick={loadMore} disabled={loadingMore}>
+                            {loadingMore ? '로딩 중...' : '더 보기'}
+                        </button>
+                    </div>
+                )}
             </div>
         </div>
     )
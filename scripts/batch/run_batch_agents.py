@@ -80,7 +80,10 @@ def run_single_agent_analysis(video_path: Path, output_dir: Path):
     orch.on_event(on_event)
 
     start = time.time()
-    result = orch.run_pipeline(str(video_path), temp_dir=cache_dir)
+    try:
+        result = orch.run_pipeline(str(video_path), temp_dir=cache_dir)
+    finally:
+        orch.close()
     elapsed = time.time() - start
 
     # 결과 저장